@@ -39,6 +39,8 @@ install_requires = ['tensorflow>=2.0.0',
                     'kerasplotlib',
                     'requests']
 
+extras_require = {'parquet': ['pyarrow']}
+
 
 if __name__ == "__main__":
 
@@ -54,6 +56,7 @@ if __name__ == "__main__":
           version=VERSION,
           download_url=DOWNLOAD_URL,
           install_requires=install_requires,
+          extras_require=extras_require,
           packages=['talos',
                     'talos.scan',
                     'talos.templates',
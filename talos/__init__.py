@@ -3,6 +3,7 @@ warnings.simplefilter('ignore')
 
 # import commands
 from .scan.Scan import Scan
+from .scan.AsyncScan import AsyncScan
 from .commands.analyze import Analyze
 from .commands.analyze import Analyze as Reporting
 from .commands.predict import Predict
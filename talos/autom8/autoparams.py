@@ -64,11 +64,16 @@ class AutoParams:
 
         '''
 
+        # shapes given in params are kept as they are
+        generated = self._replace or 'shapes' not in self.params
+
         if shapes == 'fixed':
             self.shapes()
         else:
             self.shapes_slope()
         self.layers()
+        if generated:
+            self.conditional('shapes', {'hidden_layers': _has_hidden_layers})
         self.dropout()
         self.optimizers()
         self.activations()
@@ -257,9 +262,35 @@ class AutoParams:
         parameter.'''
 
         from wrangle import dic_resample_values
+        from ..parameters.Conditional import Conditional, is_conditional
+
+        # conditional parameters are resampled by their values
+        conditionals = {label: values for label, values in self.params.items()
+                        if is_conditional(values)}
+        for label, values in conditionals.items():
+            self.params[label] = values.values
 
         self.params = dic_resample_values(self.params, n)
 
+        for label, values in conditionals.items():
+            self.params[label] = Conditional(self.params[label],
+                                             values.when,
+                                             values.default)
+
+    def conditional(self, label, when, default=None):
+
+        '''Makes a parameter used only when other parameters have
+        certain values, e.g. `shapes` only when there are hidden layers.
+        See talos.utils.Conditional for `when` and `default`.'''
+
+        from ..parameters.Conditional import Conditional, is_conditional
+
+        values = self.params[label]
+        if is_conditional(values):
+            values = values.values
+
+        self.params[label] = Conditional(values, when, default)
+
     def _append_params(self, label, values):
 
         if self._replace is False:
@@ -270,3 +301,8 @@ class AutoParams:
 
         else:
             self.params[label] = values
+
+
+def _has_hidden_layers(hidden_layers):
+
+    return hidden_layers > 0
@@ -1,5 +1,6 @@
 from kerasplotlib import TrainingLog as TrainingPlot
 from .experiment_log import ExperimentLog
 from .power_draw import PowerDraw
+from .median_stopping import MedianStopping
 
-del experiment_log, power_draw
+del experiment_log, power_draw, median_stopping
@@ -5,7 +5,8 @@ class ExperimentLog(Callback):
 
     def __init__(self,
                  experiment_name,
-                 params):
+                 params,
+                 results_store=None):
 
         '''Takes as input the name of the experiment which will be
         used for creating a .log file with the outputs and the params
@@ -13,6 +14,10 @@ class ExperimentLog(Callback):
 
         experiment_name | str | must match the experiment_name in `Scan()`
         params | dict | the params dictionary from the input model in `Scan()
+        results_store | ResultsStore or None | also add the epochs to the
+                                               round in the store, which
+                                               Scan(results_store) passes
+                                               along with params
 
         '''
 
@@ -23,24 +28,31 @@ class ExperimentLog(Callback):
 
         # get the experiment id first
         list_of_files = glob.glob('./' + experiment_name + '/*.csv')
+        list_of_files += glob.glob('./' + experiment_name + '/*.parquet')
 
         try:
             latest_file = max(list_of_files, key=os.path.getmtime)
         except ValueError:
             print("\nERROR: `experiment_name` has to match `Scan(experiment_name)`\n")
 
-        self.name = latest_file.replace('.csv', '') + '.log'
+        self.name = os.path.splitext(latest_file)[0] + '.log'
 
         # rest of the config variables
         self.params = params
         self.counter = 1
         self.new_file = True
 
+        # the run and round of the results store (see RoundParams)
+        self.results_store = results_store
+        self.run_id = getattr(params, 'run_id', None)
+        self.round = getattr(params, 'round', None)
+
     def on_train_begin(self, logs={}):
 
         import random
         self.hash = hex(abs(hash(str(random.random()))))
         self.final_out = []
+        self.epochs = []
 
     def on_train_end(self, logs={}):
 
@@ -48,6 +60,9 @@ class ExperimentLog(Callback):
         [f.write(','.join(map(str, i)) + '\n') for i in self.final_out]
         f.close()
 
+        if self.results_store is not None and self.run_id is not None:
+            self.results_store.add_epochs(self.run_id, self.round, self.epochs)
+
     def on_epoch_begin(self, epoch, logs={}):
 
         self.epoch_out = []
@@ -74,6 +89,8 @@ class ExperimentLog(Callback):
         self.epoch_out.append(self.hash)
         self.epoch_out.append(epoch + 1)
 
+        self.epochs.append((epoch + 1, dict(logs)))
+
         for key in logs.keys():
 
             # round the values
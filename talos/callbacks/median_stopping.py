@@ -0,0 +1,66 @@
+from tensorflow.keras.callbacks import Callback
+
+
+class MedianStopping(Callback):
+
+    def __init__(self,
+                 params,
+                 monitor='val_loss',
+                 percentile=50,
+                 min_rounds=5,
+                 warmup=1):
+
+        '''Stops the training of a round when, at the end of an epoch,
+        `monitor` is worse than the median (or another percentile) of the
+        earlier rounds of the experiment at the same epoch. The round is
+        then logged with the epochs it actually ran in `round_epochs`.
+
+        Example use:
+
+        model.fit(...callbacks=[MedianStopping(params)]...)
+
+        params | dict | the params dictionary from the input model in `Scan()`
+        monitor | str | the metric to compare; lower is better for losses
+        percentile | int | stop when worse than this share of earlier rounds
+        min_rounds | int | the number of earlier rounds needed to compare
+        warmup | int | the number of epochs before stopping is possible
+
+        '''
+
+        super(MedianStopping, self).__init__()
+
+        # when params is a plain dict there is nothing to compare with
+        self.round_history = getattr(params, 'round_history', [])
+
+        self.monitor = monitor
+        self.percentile = percentile
+        self.min_rounds = min_rounds
+        self.warmup = warmup
+        self.minimize = 'loss' in monitor
+
+        self.stopped_epoch = None
+
+    def on_epoch_end(self, epoch, logs={}):
+
+        import numpy as np
+
+        if epoch + 1 < self.warmup or self.monitor not in logs:
+            return
+
+        # the earlier rounds that made it to this epoch
+        values = [h[self.monitor][epoch] for h in self.round_history
+                  if len(h.get(self.monitor, [])) > epoch]
+
+        if len(values) < self.min_rounds:
+            return
+
+        if self.minimize:
+            threshold = np.percentile(values, self.percentile)
+            worse = logs[self.monitor] > threshold
+        else:
+            threshold = np.percentile(values, 100 - self.percentile)
+            worse = logs[self.monitor] < threshold
+
+        if worse:
+            self.stopped_epoch = epoch + 1
+            self.model.stop_training = True
@@ -5,42 +5,94 @@ class Analyze:
 
     filename :: the name of the experiment log from Scan()'''
 
-    def __init__(self, source=None):
+    def __init__(self, source=None, run_id=None):
 
         '''Takes as input a filename to the experiment
-        log or the Scan object'''
+        log, the Scan object or a ResultsStore. A parquet experiment log
+        is only read for the columns that each command needs, and with a
+        ResultsStore, the rounds are sorted and picked by SQLite.
 
-        import pandas as pd
+        run_id | int or None | the run in a ResultsStore, latest if None
 
-        if isinstance(source, str):
-            self.data = pd.read_csv(source)
+        '''
+
+        from ..logging.read_log import read_log, is_parquet
+        from ..logging.ResultsStore import ResultsStore
+
+        self._source = None
+        self._store = None
+        self._data = None
+
+        if isinstance(source, ResultsStore):
+            self._store = source
+            if run_id is None:
+                run_id = source.latest_run()
+            self._run_id = run_id
+
+        elif isinstance(source, str):
+            if is_parquet(source):
+                self._source = source
+            else:
+                self.data = read_log(source)
         else:
             self.data = source.data
 
+    @property
+    def data(self):
+
+        # the whole experiment log e.g. for plots
+        if self._data is None and self._store is not None:
+            self._data = self._store.results(self._run_id)
+
+        elif self._data is None:
+            from ..logging.read_log import read_log
+            self._data = read_log(self._source)
+
+        return self._data
+
+    @data.setter
+    def data(self, data):
+
+        self._data = data
+
     def high(self, metric):
 
         '''Returns the highest value for a given metric'''
 
-        return max(self.data[metric])
+        if self._store is not None:
+            return self._store.high(self._run_id, metric)
+
+        return max(self._read([metric])[metric])
 
     def rounds(self):
 
         '''Returns the number of rounds in the experiment'''
 
-        return len(self.data)
+        if self._store is not None:
+            return self._store.count(self._run_id)
+
+        return len(self._read(self._columns()[:1]))
 
     def rounds2high(self, metric):
 
         '''Returns the number of rounds it took to get to the
         highest value for a given metric.'''
 
-        return self.data[self.data[metric] == self.data[metric].max()].index[0]
+        if self._store is not None:
+            return self._store.rounds2high(self._run_id, metric)
+
+        data = self._read([metric])
+
+        return data[data[metric] == data[metric].max()].index[0]
 
     def low(self, metric):
 
         '''Returns the minimum value for a given metric'''
 
-        return min(self.data[metric])
+        if self._store is not None:
+            return self._store.low(self._run_id, metric)
+
+        return min(self._read([metric])[metric])
 
     def correlate(self, metric, exclude):
 
@@ -54,9 +106,10 @@ class Analyze:
 
         '''
 
-        columns = [c for c in self.data.columns if c not in exclude + [metric]]
-        out = self.data[columns]
-        out.insert(0, metric, self.data[metric])
+        columns = [c for c in self._columns() if c not in exclude + [metric]]
+        data = self._read(columns + [metric])
+        out = data[columns]
+        out.insert(0, metric, data[metric])
 
         out = out.corr()[metric]
 
@@ -108,7 +161,7 @@ class Analyze:
         try:
             import astetik as ast
             cols = self._cols(metric, exclude)
-            return ast.corr(self.data[cols], color_grades=color_grades, mask=False)
+            return ast.corr(self._read(cols), color_grades=color_grades, mask=False)
         except RuntimeError:
             print('Matplotlib Runtime Error. Plots will not work.')
 
@@ -189,7 +242,12 @@ class Analyze:
         if sort_by is None:
             sort_by = metric
 
-        out = self.data[cols].sort_values(sort_by, ascending=ascending)
+        if self._store is not None:
+            return self._store.results(self._run_id,
+                                       sort_by=sort_by,
+                                       ascending=ascending)[cols]
+
+        out = self._read(cols).sort_values(sort_by, ascending=ascending)
 
         return out
 
@@ -207,7 +265,16 @@ class Analyze:
         '''
 
         cols = self._cols(metric, exclude)
-        out = self.data[cols].sort_values(metric, ascending=ascending)
+
+        # only the best n rounds are read from a ResultsStore
+        if self._store is not None:
+            out = self._store.results(self._run_id,
+                                      sort_by=metric,
+                                      ascending=ascending,
+                                      n=n)[cols]
+        else:
+            out = self._read(cols).sort_values(metric, ascending=ascending)
+
         out = out.drop(metric, axis=1).head(n)
         out.insert(out.shape[1], 'index_num', range(len(out)))
 
@@ -217,7 +284,7 @@ class Analyze:
 
         '''Helper to remove other than desired metric from data table'''
 
-        cols = [col for col in self.data.columns if col not in exclude + [metric]]
+        cols = [col for col in self._columns() if col not in exclude + [metric]]
 
         if isinstance(metric, list) is False:
             metric = [metric]
@@ -228,3 +295,28 @@ class Analyze:
         cols = list(set(cols))
 
         return cols
+
+    def _columns(self):
+
+        '''Returns the column labels without reading the rows
+        of a parquet experiment log.'''
+
+        if self._data is None and self._store is not None:
+            return self._store.columns(self._run_id)
+
+        elif self._data is None:
+            from ..logging.read_log import log_columns
+            return log_columns(self._source)
+
+        return list(self.data.columns)
+
+    def _read(self, columns):
+
+        '''Returns the given columns, where a parquet experiment log
+        that is not read yet is only read for those columns.'''
+
+        if self._data is None and self._source is not None:
+            from ..logging.read_log import read_log
+            return read_log(self._source, list(columns))
+
+        return self.data[columns]
@@ -94,7 +94,11 @@ class Deploy:
 
     def save_results(self):
 
-        self.scan_object.data.to_csv(self.path + '_results.csv')
+        # keep the column types of a parquet experiment log
+        if self.scan_object.details.get('log_format') == 'parquet':
+            self.scan_object.data.to_parquet(self.path + '_results.parquet')
+        else:
+            self.scan_object.data.to_csv(self.path + '_results.csv')
 
     def save_params(self):
 
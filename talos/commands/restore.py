@@ -48,8 +48,12 @@ class Restore:
         self.model = load_model(self.file_prefix + '_model')
 
         # add results
-        self.results = pd.read_csv(self.file_prefix + '_results.csv')
-        self.results.drop('Unnamed: 0', axis=1, inplace=True)
+        import os
+        if os.path.exists(self.file_prefix + '_results.parquet'):
+            self.results = pd.read_parquet(self.file_prefix + '_results.parquet')
+        else:
+            self.results = pd.read_csv(self.file_prefix + '_results.csv')
+            self.results.drop('Unnamed: 0', axis=1, inplace=True)
 
         # clean up
         del self.extract_to, self.file_prefix
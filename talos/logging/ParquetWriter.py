@@ -0,0 +1,256 @@
+import os
+import threading
+import time
+
+
+class ParquetWriter:
+
+    def __init__(self, path, types, flush_rows=1, flush_seconds=None,
+                 fsync=False):
+
+        '''Writes the experiment log as a folder of parquet files, one
+        for each flush, that is read as one table e.g. with
+        pd.read_parquet(path). Unlike in a csv file, the columns are typed
+        and each column can be read on its own. Each file is written under
+        a hidden name first, so a crash can't leave a partial file behind.
+        On close() the files are merged into one, so that reading the log
+        does not have to open a file for each flush.
+
+        path | str | the experiment log folder
+        types | dict | the type of each parameter column (see param_types)
+        flush_rows | int | write a row group after this many rows
+        flush_seconds | float or None | write a row group when this many
+                                        seconds have passed since the last
+        fsync | bool | also make sure each row group reaches the disk
+
+        NOTE: with flush_seconds, a timer writes the rows that are waiting,
+        so they are not held back until the next round finishes. If the
+        process stops while the files are merged, the rows of the files
+        after the first may be in the log twice.
+
+        '''
+
+        import pyarrow.parquet as pq
+
+        self.path = path
+        self.types = types
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.fsync = fsync
+
+        # continue after the files that are already there
+        parts = log_parts(path)
+        self._parts = 0
+        self._schema = None
+        if len(parts) > 0:
+            self._parts = int(parts[-1][len('part-'):-len('.parquet')]) + 1
+            self._schema = pq.read_schema(os.path.join(path, parts[-1]))
+
+        self._rows = []
+        self._flushed = time.time()
+
+        # the timer flushes from another thread
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def write(self, row):
+
+        with self._lock:
+
+            # the first row is the header
+            if self._schema is None:
+                self._schema = log_schema(row, self.types)
+                return
+
+            self._rows.append(row)
+
+            if (self.flush_rows is not None
+                    and len(self._rows) >= self.flush_rows):
+                self._flush()
+
+            elif self.flush_seconds is not None:
+
+                waited = time.time() - self._flushed
+
+                if waited >= self.flush_seconds:
+                    self._flush()
+
+                # flush later even if no more rows come
+                elif self._timer is None:
+                    self._timer = threading.Timer(self.flush_seconds - waited,
+                                                  self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+    def flush(self):
+
+        with self._lock:
+            self._flush()
+
+    def close(self):
+
+        '''Writes the rows that are waiting, and merges the files of
+        the log into the first one.'''
+
+        import pyarrow.parquet as pq
+
+        with self._lock:
+
+            self._flush()
+
+            parts = log_parts(self.path)
+
+            if len(parts) < 2:
+                return
+
+            # the files of the log are read in the order of their names
+            table = pq.read_table(self.path)
+
+            self._write(table, parts[0])
+
+            for name in parts[1:]:
+                os.remove(os.path.join(self.path, name))
+
+            self._parts = int(parts[0][len('part-'):-len('.parquet')]) + 1
+
+    def _flush(self):
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if len(self._rows) > 0:
+
+            columns = []
+            for i, field in enumerate(self._schema):
+                values = [log_value(row[i], str(field.type))
+                          for row in self._rows]
+                columns.append(pa.array(values, type=field.type))
+
+            table = pa.Table.from_arrays(columns, schema=self._schema)
+
+            self._write(table, 'part-%08d.parquet' % self._parts)
+            self._parts += 1
+
+        self._rows = []
+        self._flushed = time.time()
+
+    def _write(self, table, name):
+
+        '''Writes the table as a file of the log, replacing
+        the file if there already is one with the name.'''
+
+        import pyarrow.parquet as pq
+
+        # files starting with a dot are not read as part of the log
+        temp_path = os.path.join(self.path, '.' + name + '.tmp')
+        pq.write_table(table, temp_path)
+
+        if self.fsync:
+            with open(temp_path, 'rb') as f:
+                os.fsync(f.fileno())
+
+        os.replace(temp_path, os.path.join(self.path, name))
+
+
+def log_parts(path):
+
+    '''Returns the file names of the log in order.'''
+
+    return sorted([name for name in os.listdir(path)
+                   if name.startswith('part-') and name.endswith('.parquet')])
+
+
+def log_schema(header, types):
+
+    '''Returns the schema of the experiment log, where the parameters
+    are typed as in types, round_epochs is an integer and the metrics
+    are floats. The metrics and parameters are also in the metadata.'''
+
+    import json
+    import pyarrow as pa
+
+    fields = []
+    for label in header:
+        if label in types:
+            dtype = types[label]
+        elif label == 'round_epochs':
+            dtype = 'int64'
+        else:
+            dtype = 'double'
+        fields.append(pa.field(label, pa.type_for_alias(dtype)))
+
+    metadata = {'params': json.dumps([l for l in header if l in types]),
+                'metrics': json.dumps([l for l in header[1:]
+                                       if l not in types])}
+
+    return pa.schema(fields, metadata=metadata)
+
+
+def param_types(param_object):
+
+    '''Returns the column type of each parameter in the experiment log,
+    based on its values. Values that are not all numbers or all booleans
+    are written as strings, the same way as in the csv log.'''
+
+    from ..parameters.distributions import IntLogUniform
+
+    out = {}
+    for i, label in enumerate(param_object.param_keys):
+
+        if i in param_object._distributions:
+            if isinstance(param_object._distributions[i], IntLogUniform):
+                out[label] = 'int64'
+            else:
+                out[label] = 'double'
+            continue
+
+        # e.g. the default of a Conditional
+        values = [v for v in param_object._params_temp[i] if v is not None]
+        out[label] = _values_type(values)
+
+    return out
+
+
+def log_value(value, dtype):
+
+    '''Converts a value to the column type, where None is null.'''
+
+    if value is None:
+        return None
+
+    if dtype == 'string':
+        return str(value)
+
+    if dtype == 'bool':
+        return bool(value)
+
+    if dtype == 'int64':
+        return int(value)
+
+    return float(value)
+
+
+def _values_type(values):
+
+    import numbers
+    import numpy as np
+
+    booleans = [isinstance(v, (bool, np.bool_)) for v in values]
+
+    if len(values) == 0 or (any(booleans) and not all(booleans)):
+        return 'string'
+
+    if all(booleans):
+        return 'bool'
+
+    if all(isinstance(v, numbers.Integral) for v in values):
+        return 'int64'
+
+    if all(isinstance(v, numbers.Real) for v in values):
+        return 'double'
+
+    return 'string'
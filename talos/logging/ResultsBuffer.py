@@ -0,0 +1,100 @@
+import numpy as np
+
+
+class ResultsBuffer:
+
+    def __init__(self, param_object, metric_keys, size=1024):
+
+        '''Keeps the results of the rounds in memory as arrays, where each
+        parameter value is its position in params (its code) and metrics
+        are floats, so that reducers can encode the latest rounds without
+        reading the experiment log. The arrays grow twice as large as
+        needed, so adding a round is O(1) on average.
+
+        param_object | ParamSpace | the parameter space of the experiment
+        metric_keys | list | the labels of the metrics of each round
+        size | int | the number of rounds the arrays are made for at first
+
+        NOTE: distributions do not have codes, and neither do values that
+        are not in params, which are -1.
+
+        '''
+
+        self.param_keys = list(param_object.param_keys)
+        self.metric_keys = list(metric_keys)
+
+        self._values = param_object._params_temp
+        self._distributions = param_object._distributions
+
+        # the code of each value, by the value as written in the log
+        self._lookup = [{str(v): i for i, v in enumerate(values)}
+                        for values in self._values]
+
+        self._codes = np.empty((size, len(self.param_keys)), dtype='int32')
+        self._metrics = np.empty((size, len(self.metric_keys)))
+        self._rows = 0
+
+    def __len__(self):
+
+        return self._rows
+
+    def append(self, codes, metrics):
+
+        '''Adds a round from the codes of its parameter
+        values (see codes()) and its metrics.'''
+
+        if self._rows == len(self._codes):
+            self._codes = np.concatenate([self._codes,
+                                          np.empty_like(self._codes)])
+            self._metrics = np.concatenate([self._metrics,
+                                            np.empty_like(self._metrics)])
+
+        self._codes[self._rows] = codes
+        self._metrics[self._rows] = [_float(value) for value in metrics]
+        self._rows += 1
+
+    def codes(self, values):
+
+        '''Returns the codes of the parameter values of a round,
+        either as they are or as they are written in the log.'''
+
+        return [-1 if i in self._distributions
+                else self._lookup[i].get(str(value), -1)
+                for i, value in enumerate(values)]
+
+    def design_matrix(self, metric, window):
+
+        '''Returns the metric of the latest rounds, their parameter values
+        one-hot encoded with a column for each value that is in the rounds,
+        and the parameter label and value of each column.'''
+
+        start = max(0, self._rows - window)
+        codes = self._codes[start:self._rows]
+
+        y = self._metrics[start:self._rows, self.metric_keys.index(metric)]
+
+        x = [np.zeros((len(codes), 0), dtype=bool)]
+        columns = []
+
+        for i, label in enumerate(self.param_keys):
+
+            if i in self._distributions:
+                continue
+
+            col = codes[:, i]
+            counts = np.bincount(col[col >= 0],
+                                 minlength=len(self._values[i]))
+            present = np.flatnonzero(counts)
+
+            x.append(col[:, None] == present[None, :])
+            columns += [(label, self._values[i][code]) for code in present]
+
+        return y, np.hstack(x).astype('float64'), columns
+
+
+def _float(value):
+
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
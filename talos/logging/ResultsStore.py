@@ -0,0 +1,398 @@
+class ResultsStore:
+
+    def __init__(self, path, timeout=60):
+
+        '''A SQLite file where the results of many experiments are kept,
+        including several scans that write to it at the same time on the
+        same machine. Used with `Scan(..., results_store=ResultsStore(path))`
+        and `ExperimentLog(..., results_store=ResultsStore(path))`, and
+        read with `Analyze(ResultsStore(path))`.
+
+        Each scan is a run in the `runs` table with its parameters and
+        metrics. Each round is a row in the `rounds` table with the values
+        of the parameters, and its metrics are rows in the `round_metrics`
+        table, which is indexed by metric and value so that the best rounds
+        are found without reading the others. The `epochs` table has the
+        epoch level metrics from ExperimentLog, by the run and round of
+        the `rounds` table.
+
+        path | str | path to the SQLite file
+        timeout | int | seconds to wait for other writers
+
+        NOTE: WAL is used so that readers do not block the writers, which
+        does not work on network file systems (see ParamQueue).
+
+        '''
+
+        self.path = path
+        self.timeout = timeout
+
+        self._create()
+
+    def _connect(self):
+
+        '''Returns a new connection to the store.'''
+
+        import sqlite3
+
+        conn = sqlite3.connect(self.path,
+                               timeout=self.timeout,
+                               isolation_level=None)
+        conn.execute('PRAGMA busy_timeout = %d' % (self.timeout * 1000))
+
+        return conn
+
+    def _create(self):
+
+        conn = self._connect()
+        conn.execute('PRAGMA journal_mode = WAL')
+        conn.execute('BEGIN IMMEDIATE')
+
+        conn.execute('''CREATE TABLE IF NOT EXISTS runs
+                        (run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                         experiment_name TEXT,
+                         experiment_id TEXT,
+                         started REAL,
+                         finished REAL,
+                         param_keys TEXT,
+                         metric_keys TEXT,
+                         params TEXT)''')
+        conn.execute('''CREATE TABLE IF NOT EXISTS rounds
+                        (run_id INTEGER,
+                         round INTEGER,
+                         round_epochs INTEGER,
+                         start TEXT,
+                         end TEXT,
+                         duration REAL,
+                         params TEXT,
+                         PRIMARY KEY (run_id, round))''')
+        conn.execute('''CREATE TABLE IF NOT EXISTS round_metrics
+                        (run_id INTEGER,
+                         round INTEGER,
+                         metric TEXT,
+                         value REAL,
+                         PRIMARY KEY (run_id, round, metric))''')
+        conn.execute('''CREATE INDEX IF NOT EXISTS round_metrics_value
+                        ON round_metrics (run_id, metric, value)''')
+        conn.execute('''CREATE TABLE IF NOT EXISTS epochs
+                        (run_id INTEGER,
+                         round INTEGER,
+                         epoch INTEGER,
+                         metric TEXT,
+                         value REAL,
+                         PRIMARY KEY (run_id, round, epoch, metric))''')
+
+        conn.execute('COMMIT')
+        conn.close()
+
+    def start_run(self,
+                  experiment_name,
+                  experiment_id,
+                  param_keys,
+                  params,
+                  resume=False):
+
+        '''Returns the run_id of a new run, or with resume, of the
+        latest run of the same experiment log if there is one. The
+        metrics are set after the first round (see set_metric_keys).'''
+
+        import json
+        import time
+
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+
+        found = None
+        if resume:
+            found = conn.execute('''SELECT run_id FROM runs
+                                    WHERE experiment_name = ?
+                                    AND experiment_id = ?
+                                    ORDER BY run_id DESC LIMIT 1''',
+                                 (experiment_name, experiment_id))
+            found = found.fetchone()
+
+        if found is None:
+            run_id = conn.execute('''INSERT INTO runs
+                                     (experiment_name, experiment_id,
+                                      started, param_keys, metric_keys,
+                                      params)
+                                     VALUES (?, ?, ?, ?, ?, ?)''',
+                                  (experiment_name,
+                                   experiment_id,
+                                   time.time(),
+                                   json.dumps(list(param_keys)),
+                                   json.dumps([]),
+                                   json.dumps(params,
+                                              default=_json_value))).lastrowid
+        else:
+            run_id = found[0]
+
+        conn.execute('COMMIT')
+        conn.close()
+
+        return run_id
+
+    def set_metric_keys(self, run_id, metric_keys):
+
+        import json
+
+        conn = self._connect()
+        conn.execute('UPDATE runs SET metric_keys = ? WHERE run_id = ?',
+                     (json.dumps(list(metric_keys)), run_id))
+        conn.close()
+
+    def finish_run(self, run_id):
+
+        import time
+
+        conn = self._connect()
+        conn.execute('UPDATE runs SET finished = ? WHERE run_id = ?',
+                     (time.time(), run_id))
+        conn.close()
+
+    def add_rounds(self, run_id, rounds):
+
+        '''Stores rounds as (round, round_epochs, metrics, params, times)
+        where metrics and params are dictionaries and times is the
+        start, end and duration of the round.'''
+
+        import json
+
+        rows = []
+        metrics = []
+        for i, round_epochs, round_metrics, params, times in rounds:
+            rows.append([run_id, i, _sql_value(round_epochs)]
+                        + [_sql_value(value) for value in times]
+                        + [json.dumps(params, default=_json_value)])
+            metrics += [(run_id, i, metric, _sql_value(value))
+                        for metric, value in round_metrics.items()]
+
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        conn.executemany('''INSERT OR REPLACE INTO rounds
+                            VALUES (?, ?, ?, ?, ?, ?, ?)''', rows)
+        conn.executemany('''INSERT OR REPLACE INTO round_metrics
+                            VALUES (?, ?, ?, ?)''', metrics)
+        conn.execute('COMMIT')
+        conn.close()
+
+    def add_epochs(self, run_id, round, epochs):
+
+        '''Stores the metrics of a round for each epoch, where epochs
+        is a list of (epoch, metrics) and metrics is a dictionary. The
+        round is the same as in the rounds table (see RoundParams).'''
+
+        rows = [(run_id, round, epoch, metric, _sql_value(value))
+                for epoch, metrics in epochs
+                for metric, value in metrics.items()]
+
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        conn.executemany('''INSERT OR REPLACE INTO epochs
+                            VALUES (?, ?, ?, ?, ?)''', rows)
+        conn.execute('COMMIT')
+        conn.close()
+
+    def next_round(self, run_id):
+
+        '''Returns the number after the highest round of a
+        run, or 0 if there are no rounds.'''
+
+        conn = self._connect()
+        out = conn.execute('SELECT MAX(round) FROM rounds WHERE run_id = ?',
+                           (run_id,)).fetchone()[0]
+        conn.close()
+
+        return 0 if out is None else out + 1
+
+    def latest_run(self, experiment_name=None):
+
+        '''Returns the run_id of the latest run, or of the latest
+        run of an experiment, or None if there is none.'''
+
+        conn = self._connect()
+
+        if experiment_name is None:
+            out = conn.execute('SELECT MAX(run_id) FROM runs')
+        else:
+            out = conn.execute('''SELECT MAX(run_id) FROM runs
+                                  WHERE experiment_name = ?''',
+                               (experiment_name,))
+
+        out = out.fetchone()[0]
+        conn.close()
+
+        return out
+
+    def runs(self):
+
+        '''Returns the runs table as a dataframe.'''
+
+        import pandas as pd
+
+        conn = self._connect()
+        out = pd.read_sql_query('SELECT * FROM runs ORDER BY run_id', conn)
+        conn.close()
+
+        return out
+
+    def columns(self, run_id):
+
+        '''Returns the columns of the results of a run in the same
+        order as in the experiment log.'''
+
+        metric_keys, param_keys = self._keys(run_id)
+
+        return ['round_epochs'] + metric_keys + param_keys
+
+    def high(self, run_id, metric):
+
+        return self._value(run_id, metric, 'MAX')
+
+    def low(self, run_id, metric):
+
+        return self._value(run_id, metric, 'MIN')
+
+    def count(self, run_id):
+
+        conn = self._connect()
+        out = conn.execute('SELECT COUNT(*) FROM rounds WHERE run_id = ?',
+                           (run_id,)).fetchone()[0]
+        conn.close()
+
+        return out
+
+    def rounds2high(self, run_id, metric):
+
+        '''Returns the first round with the highest value of metric.'''
+
+        conn = self._connect()
+        out = conn.execute('''SELECT round FROM round_metrics
+                              WHERE run_id = ? AND metric = ?
+                              ORDER BY value DESC, round LIMIT 1''',
+                           (run_id, metric)).fetchone()
+        conn.close()
+
+        return out[0]
+
+    def results(self, run_id, sort_by=None, ascending=False, n=None):
+
+        '''Returns the results of a run as a dataframe like the experiment
+        log, where the index is the round. With sort_by (a metric) the
+        rounds are sorted, and only the first n are read.'''
+
+        import json
+        import pandas as pd
+
+        metric_keys, param_keys = self._keys(run_id)
+
+        # the metrics of each round as columns
+        select = ['r.round', 'r.round_epochs']
+        for metric in metric_keys:
+            select.append('''(SELECT value FROM round_metrics m
+                              WHERE m.run_id = r.run_id AND m.round = r.round
+                              AND m.metric = ?)''')
+        select.append('r.params')
+
+        query = 'SELECT ' + ', '.join(select) + ' FROM rounds r'
+        args = list(metric_keys)
+
+        # the rounds in order of the metric, from its index
+        if sort_by is not None:
+            query += ''' JOIN round_metrics s ON s.run_id = r.run_id
+                         AND s.round = r.round AND s.metric = ?'''
+            args.append(sort_by)
+
+        query += ' WHERE r.run_id = ?'
+        args.append(run_id)
+
+        if sort_by is not None:
+            query += ' ORDER BY s.value %s, r.round' % ('ASC' if ascending
+                                                        else 'DESC')
+        else:
+            query += ' ORDER BY r.round'
+
+        if n is not None:
+            query += ' LIMIT ?'
+            args.append(int(n))
+
+        conn = self._connect()
+        rows = conn.execute(query, args).fetchall()
+        conn.close()
+
+        data = []
+        for row in rows:
+            params = json.loads(row[-1])
+            data.append(list(row[1:-1]) + [params[k] for k in param_keys])
+
+        return pd.DataFrame(data,
+                            columns=['round_epochs'] + metric_keys + param_keys,
+                            index=[row[0] for row in rows])
+
+    def epochs(self, run_id):
+
+        '''Returns the epoch level metrics of a run as a dataframe
+        with a row for each round and epoch.'''
+
+        import pandas as pd
+
+        conn = self._connect()
+        out = pd.read_sql_query('''SELECT round, epoch, metric, value
+                                   FROM epochs WHERE run_id = ?''',
+                                conn, params=(run_id,))
+        conn.close()
+
+        out = out.pivot_table(index=['round', 'epoch'],
+                              columns='metric',
+                              values='value').reset_index()
+        out.columns.name = None
+
+        return out
+
+    def _keys(self, run_id):
+
+        '''Returns the metric and parameter labels of a run.'''
+
+        import json
+
+        conn = self._connect()
+        keys = conn.execute('''SELECT metric_keys, param_keys FROM runs
+                               WHERE run_id = ?''', (run_id,)).fetchone()
+        conn.close()
+
+        return json.loads(keys[0]), json.loads(keys[1])
+
+    def _value(self, run_id, metric, function):
+
+        conn = self._connect()
+        out = conn.execute('''SELECT %s(value) FROM round_metrics
+                              WHERE run_id = ? AND metric = ?''' % function,
+                           (run_id, metric)).fetchone()[0]
+        conn.close()
+
+        return out
+
+
+def _sql_value(value):
+
+    '''Numpy numbers as python numbers e.g. float32 metrics.'''
+
+    import numpy as np
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    return value
+
+
+def _json_value(value):
+
+    '''Numpy numbers as numbers, and other values as strings
+    e.g. functions, the same way as in the experiment log.'''
+
+    import numpy as np
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    return str(value)
@@ -0,0 +1,89 @@
+import os
+import threading
+import time
+
+
+class ResultsWriter:
+
+    def __init__(self, path, flush_rows=1, flush_seconds=None, fsync=False):
+
+        '''Appends rows to the experiment log as they come, instead of
+        writing the whole log again. The rows are written the same way
+        as np.savetxt(fmt='%s', delimiter=',') writes them.
+
+        path | str | the experiment log
+        flush_rows | int | flush after this many rows
+        flush_seconds | float or None | flush when this many seconds
+                                        have passed since the last flush
+        fsync | bool | also make sure each flush reaches the disk
+
+        NOTE: with flush_seconds, a timer flushes the rows that are
+        written, so they are not held back until the next round finishes.
+
+        '''
+
+        self.path = path
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.fsync = fsync
+
+        self._file = open(path, 'a')
+
+        self._rows = 0
+        self._flushed = time.time()
+
+        # the timer flushes from another thread
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def write(self, row):
+
+        with self._lock:
+
+            self._file.write(','.join([str(value) for value in row]) + '\n')
+            self._rows += 1
+
+            if self.flush_rows is not None and self._rows >= self.flush_rows:
+                self._flush()
+
+            elif self.flush_seconds is not None:
+
+                waited = time.time() - self._flushed
+
+                if waited >= self.flush_seconds:
+                    self._flush()
+
+                # flush later even if no more rows come
+                elif self._timer is None:
+                    self._timer = threading.Timer(self.flush_seconds - waited,
+                                                  self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+    def flush(self):
+
+        with self._lock:
+            self._flush()
+
+    def close(self):
+
+        with self._lock:
+            self._flush()
+            self._file.close()
+
+    def _flush(self):
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if self._file.closed:
+            return
+
+        self._file.flush()
+
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+        self._rows = 0
+        self._flushed = time.time()
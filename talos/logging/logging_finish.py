@@ -2,6 +2,13 @@ def logging_finish(self):
 
     from .results import result_todf
 
+    # all the rows are in the experiment log
+    if self._log_writer is not None:
+        self._log_writer.close()
+
+    if self._run_id is not None:
+        self.results_store.finish_run(self._run_id)
+
     # save the results
     self = result_todf(self)
 
@@ -1,12 +1,16 @@
-def logging_run(self, round_start, start, model_history):
+def logging_run(self, round_start, start, model_history, end=None):
 
     import time
 
+    # the round was timed where it was run (e.g. a worker process)
+    if end is None:
+        end = time.time()
+
     # count the duration of the round
-    self._round_seconds = time.time() - start
+    self._round_seconds = end - start
 
     # set end time and log
-    round_end = time.strftime('%D-%H%M%S')
+    round_end = time.strftime('%D-%H%M%S', time.localtime(end))
     self.round_times.append([round_start, round_end, self._round_seconds])
 
     # handle first round only things
@@ -21,6 +25,10 @@ def logging_run(self, round_start, start, model_history):
         _results_header = ['round_epochs'] + self._all_keys + self._param_dict_keys
         self.result.append(_results_header)
 
+        # the results for reducers (see ResultsBuffer)
+        from .ResultsBuffer import ResultsBuffer
+        self._results_buffer = ResultsBuffer(self.param_object, self._all_keys)
+
         # save the results
         from .results import save_result
         save_result(self)
@@ -38,6 +46,18 @@ def logging_run(self, round_start, start, model_history):
 
     self.result.append(_round_results)
 
+    # the round is stored by its number (see RoundParams), and the rounds
+    # that are logged without training (see canonical_rules) get new ones
+    round_number = getattr(self.round_params, 'round', None)
+    if round_number is None:
+        round_number = self._next_round
+        self._next_round += 1
+    self._result_rounds.append(round_number)
+
+    values = [self.round_params[key] for key in self._param_dict_keys]
+    self._results_buffer.append(self._results_buffer.codes(values),
+                                _round_results[1:len(self._all_keys) + 1])
+
     from .results import save_result
     save_result(self)
 
@@ -0,0 +1,42 @@
+def read_log(path, columns=None):
+
+    '''Reads an experiment log into a dataframe, either a csv file
+    or a parquet folder (see Scan log_format). With columns, only those
+    columns are read, which in a parquet log skips the others entirely.
+
+    path | str | the experiment log
+    columns | list or None | the column labels to read, or all if None
+
+    '''
+
+    import pandas as pd
+
+    if is_parquet(path):
+        return pd.read_parquet(path, columns=columns)
+
+    data = pd.read_csv(path, usecols=columns)
+
+    # usecols does not keep the order of the columns
+    if columns is not None:
+        data = data[columns]
+
+    return data
+
+
+def log_columns(path):
+
+    '''Returns the column labels of an experiment log
+    without reading the rows.'''
+
+    import pandas as pd
+
+    if is_parquet(path):
+        import pyarrow.dataset as ds
+        return ds.dataset(path, format='parquet').schema.names
+
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def is_parquet(path):
+
+    return path.rstrip('/').endswith('.parquet')
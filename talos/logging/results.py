@@ -26,14 +26,70 @@ def run_round_results(self, out):
 
 def save_result(self):
 
-    '''SAVES THE RESULTS/PARAMETERS TO A CSV SPECIFIC TO THE EXPERIMENT'''
+    '''APPENDS THE NEW RESULTS/PARAMETERS TO THE CSV SPECIFIC TO THE EXPERIMENT
 
-    import numpy as np
+    The experiment log is kept open, and only the rows that are not in it
+    yet are written, in the same format as np.savetxt(fmt='%s') or as
+    row groups of a parquet log.'''
 
-    np.savetxt(self._experiment_log,
-               self.result,
-               fmt='%s',
-               delimiter=',')
+    if self._log_writer is None:
+
+        if self.log_format == 'parquet':
+            from .ParquetWriter import ParquetWriter, param_types
+            self._log_writer = ParquetWriter(self._experiment_log,
+                                             param_types(self.param_object),
+                                             self.log_flush_rows,
+                                             self.log_flush_seconds,
+                                             self.log_fsync)
+        else:
+            from .ResultsWriter import ResultsWriter
+            self._log_writer = ResultsWriter(self._experiment_log,
+                                             self.log_flush_rows,
+                                             self.log_flush_seconds,
+                                             self.log_fsync)
+
+    for row in self.result[self._log_rows:]:
+        self._log_writer.write(row)
+
+    if self.results_store is not None:
+        store_result(self)
+
+    self._log_rows = len(self.result)
+
+
+def store_result(self):
+
+    '''Adds the rows of the results that are not in the results store
+    yet as rounds of the run of this experiment, including the ones
+    from before resuming.'''
+
+    header = self.result[0]
+    no_of_params = len(self._param_dict_keys)
+    metric_keys = header[1:len(header) - no_of_params]
+
+    if self._store_rows == 0:
+        self.results_store.set_metric_keys(self._run_id, metric_keys)
+        self._store_rows = 1
+
+    rounds = []
+    for i in range(self._store_rows, len(self.result)):
+
+        row = self.result[i]
+        values = row[len(row) - no_of_params:]
+        metrics = dict(zip(metric_keys, row[1:len(row) - no_of_params]))
+        params = dict(zip(self._param_dict_keys, values))
+
+        times = [None, None, None]
+        if i - 1 < len(self.round_times):
+            times = self.round_times[i - 1]
+
+        rounds.append((self._result_rounds[i - 1],
+                       row[0], metrics, params, times))
+
+    if len(rounds) > 0:
+        self.results_store.add_rounds(self._run_id, rounds)
+
+    self._store_rows = len(self.result)
 
 
 def result_todf(self):
@@ -0,0 +1,341 @@
+import ast
+import inspect
+import re
+
+import numpy as np
+
+
+class BooleanLimit:
+
+    # the number of permutations that are evaluated at once
+    chunk_size = 100000
+
+    def __init__(self, function, param_keys):
+
+        '''Evaluates a lambda function such as `boolean_limit` for many
+        permutations at once. The source of the lambda is parsed and
+        compiled so that `p['label']` is a column of values, `and`, `or`,
+        `not`, `in` and `is` work elementwise, and chained comparisons
+        are split. The permutations are evaluated in chunks of
+        `chunk_size`, so memory does not grow with the parameter space.
+
+        If the lambda can't be compiled, or it fails with columns (e.g.
+        it calls a function on the values), it's called for each
+        permutation separately instead.
+
+        function | function | lambda function that takes the parameters
+        param_keys | list | the parameter labels in the order of columns
+
+        '''
+
+        self.function = function
+        self.param_keys = list(param_keys)
+
+        self._vectorized = self._compile()
+
+    def __call__(self, columns, tables):
+
+        '''Returns a boolean array with True for the permutations that
+        are accepted.
+
+        columns | list | the positions of the values in tables, one
+                         array per parameter
+        tables | list | the values of each parameter as an object array
+
+        '''
+
+        length = len(columns[0]) if len(columns) > 0 else 0
+        out = np.ones(length, dtype=bool)
+
+        # numeric values are compared as numbers
+        typed = [_typed(table) for table in tables]
+
+        for start in range(0, length, self.chunk_size):
+            chunk = [column[start:start + self.chunk_size]
+                     for column in columns]
+            out[start:start + len(chunk[0])] = self._evaluate(chunk,
+                                                              tables,
+                                                              typed)
+
+        return out
+
+    def _evaluate(self, chunk, tables, typed):
+
+        length = len(chunk[0])
+
+        if self._vectorized is not None:
+
+            columns = {}
+            for i, key in enumerate(self.param_keys):
+                columns[key] = typed[i][chunk[i]]
+
+            try:
+                out = np.asarray(self._vectorized(columns))
+                if out.shape == ():
+                    out = np.full(length, bool(out))
+                if out.shape == (length,):
+                    return out.astype(bool)
+
+            except (TypeError, ValueError, AttributeError):
+                pass
+
+            # keep evaluating row by row from here on
+            self._vectorized = None
+
+        out = np.empty(length, dtype=bool)
+
+        for row in range(length):
+            values = [table[column[row]]
+                      for table, column in zip(tables, chunk)]
+            out[row] = bool(self.function(dict(zip(self.param_keys,
+                                                   values))))
+
+        return out
+
+    def _compile(self):
+
+        '''Returns the lambda compiled to work with columns,
+        or None if the source is not available.'''
+
+        node = self._lambda_node()
+        namespace = self._namespace()
+
+        if node is None or not _is_vectorizable(node, namespace):
+            return None
+
+        node = ast.fix_missing_locations(_Vectorize().visit(node))
+        code = compile(ast.Expression(body=node), '<boolean_limit>', 'eval')
+
+        return eval(code, namespace)
+
+    def _lambda_node(self):
+
+        '''Returns the ast of the lambda by parsing its source, as the
+        source may be only a part of a larger expression.'''
+
+        try:
+            source = inspect.getsource(self.function)
+        except Exception:
+            return None
+
+        for match in re.finditer(r'\blambda\b', source):
+
+            text = source[match.start():]
+
+            # the lambda ends before one of these or at the end
+            ends = [i for i, c in enumerate(text) if c in ',)]}\n']
+            ends = sorted(set(ends + [len(text)]), reverse=True)
+
+            for end in ends:
+
+                try:
+                    tree = ast.parse('(' + text[:end] + ')', mode='eval')
+                except SyntaxError:
+                    continue
+
+                if isinstance(tree.body, ast.Lambda):
+                    if self._is_same(tree.body):
+                        return tree.body
+                    break
+
+        return None
+
+    def _is_same(self, node):
+
+        '''Checks that the parsed lambda is the function.'''
+
+        code = compile(ast.Expression(body=node), '<boolean_limit>', 'eval')
+        code = [c for c in code.co_consts if inspect.iscode(c)][0]
+
+        def signature(code):
+            consts = [c.co_name if inspect.iscode(c) else c
+                      for c in code.co_consts]
+            return (code.co_argcount,
+                    code.co_varnames,
+                    consts,
+                    set(code.co_names) | set(code.co_freevars))
+
+        return signature(code) == signature(self.function.__code__)
+
+    def _namespace(self):
+
+        namespace = dict(self.function.__globals__)
+
+        # variables from an enclosing function
+        names = self.function.__code__.co_freevars
+        for name, cell in zip(names, self.function.__closure__ or []):
+            namespace[name] = cell.cell_contents
+
+        namespace.update({'_talos_and': _and,
+                          '_talos_or': _or,
+                          '_talos_not': _not,
+                          '_talos_where': _where,
+                          '_talos_isin': _isin,
+                          '_talos_is': _is})
+
+        return namespace
+
+
+class _Vectorize(ast.NodeTransformer):
+
+    '''Replaces the parts of a lambda that only work with single
+    values with ones that work elementwise.'''
+
+    def visit_BoolOp(self, node):
+
+        self.generic_visit(node)
+
+        if isinstance(node.op, ast.And):
+            return _call('_talos_and', node.values)
+
+        return _call('_talos_or', node.values)
+
+    def visit_UnaryOp(self, node):
+
+        self.generic_visit(node)
+
+        if isinstance(node.op, ast.Not):
+            return _call('_talos_not', [node.operand])
+
+        return node
+
+    def visit_IfExp(self, node):
+
+        self.generic_visit(node)
+
+        return _call('_talos_where', [node.test, node.body, node.orelse])
+
+    def visit_Compare(self, node):
+
+        self.generic_visit(node)
+
+        parts = []
+        left = node.left
+
+        # a < b < c is a < b and b < c
+        for op, right in zip(node.ops, node.comparators):
+
+            if isinstance(op, (ast.In, ast.NotIn)):
+                part = _call('_talos_isin', [left, right])
+            elif isinstance(op, (ast.Is, ast.IsNot)):
+                part = _call('_talos_is', [left, right])
+            else:
+                part = ast.Compare(left=left, ops=[op], comparators=[right])
+
+            if isinstance(op, (ast.NotIn, ast.IsNot)):
+                part = _call('_talos_not', [part])
+
+            parts.append(part)
+            left = right
+
+        if len(parts) == 1:
+            return parts[0]
+
+        return _call('_talos_and', parts)
+
+
+def _is_vectorizable(node, namespace):
+
+    '''Checks that the lambda does not do anything with the columns
+    that gives a different result than with single values, e.g.
+    calls len() or indexes the values.'''
+
+    if len(node.args.args) != 1:
+        return False
+
+    for n in ast.walk(node.body):
+
+        if isinstance(n, ast.Call):
+
+            func = n.func
+
+            # numpy functions work elementwise
+            if isinstance(func, ast.Attribute):
+                if not (isinstance(func.value, ast.Name)
+                        and namespace.get(func.value.id) is np):
+                    return False
+
+            elif not (isinstance(func, ast.Name) and func.id == 'abs'):
+                return False
+
+        if isinstance(n, ast.Subscript) and isinstance(n.value, ast.Subscript):
+            return False
+
+        if isinstance(n, (ast.Lambda, ast.ListComp, ast.SetComp,
+                          ast.DictComp, ast.GeneratorExp)):
+            return False
+
+    return True
+
+
+def _call(name, args):
+
+    return ast.Call(func=ast.Name(id=name, ctx=ast.Load()),
+                    args=args,
+                    keywords=[])
+
+
+def _typed(table):
+
+    '''Returns a table of numbers as a numeric array.'''
+
+    out = np.array(table.tolist())
+
+    if out.shape == table.shape and out.dtype.kind in 'biuf':
+        return out
+
+    return table
+
+
+def _bool(value):
+
+    return np.asarray(value).astype(bool)
+
+
+def _and(*values):
+
+    out = _bool(values[0])
+    for value in values[1:]:
+        out = out & _bool(value)
+
+    return out
+
+
+def _or(*values):
+
+    out = _bool(values[0])
+    for value in values[1:]:
+        out = out | _bool(value)
+
+    return out
+
+
+def _not(value):
+
+    return ~_bool(value)
+
+
+def _where(condition, a, b):
+
+    return np.where(_bool(condition), a, b)
+
+
+def _isin(value, values):
+
+    # e.g. a string in a column is not elementwise
+    if not isinstance(value, np.ndarray):
+        raise TypeError('in is only vectorized for columns')
+
+    out = np.zeros(value.shape, dtype=bool)
+    for v in values:
+        out |= _bool(value == v)
+
+    return out
+
+
+def _is(value, other):
+
+    if not isinstance(value, np.ndarray):
+        raise TypeError('is is only vectorized for columns')
+
+    return np.array([v is other for v in value.tolist()], dtype=bool)
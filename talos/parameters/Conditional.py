@@ -0,0 +1,53 @@
+class Conditional:
+
+    def __init__(self, values, when, default=None):
+
+        '''A parameter that only has a value when other parameters
+        have certain values e.g. `shapes` when `hidden_layers` is not 0.
+        Used as a value in the params dictionary instead of a list, in
+        which case only the permutations where the parameter is used
+        are created. Otherwise the parameter is `default`.
+
+        values | list or tuple | the values as with any parameter
+        when | dict | the label of a parameter and either a list of its
+                      values or a function that returns True for them
+                      e.g. {'hidden_layers': lambda x: x > 0}
+        default | any | the value when the parameter is not used
+
+        '''
+
+        from ..utils.exceptions import TalosParamsError
+
+        if not isinstance(values, (list, tuple)):
+            raise TalosParamsError('values has to be a list or a tuple.')
+
+        if not isinstance(when, dict) or len(when) == 0:
+            raise TalosParamsError('when has to be a non-empty dictionary.')
+
+        self.values = values
+        self.when = when
+        self.default = default
+
+    def is_met(self, label, value):
+
+        '''Returns True if the value of the parameter meets the
+        condition, or if there is no condition for the parameter.'''
+
+        condition = self.when.get(label)
+
+        if condition is None:
+            return True
+
+        if callable(condition):
+            return bool(condition(value))
+
+        return value in condition
+
+    def __repr__(self):
+
+        return 'Conditional(%s, when=%s)' % (self.values, self.when)
+
+
+def is_conditional(value):
+
+    return isinstance(value, Conditional)
@@ -39,7 +39,9 @@ class DistributeParamSpace:
     def _split_param_space(self):
 
         '''Takes in a ParamSpace object and splits it so that
-        it can be used in DistributeScan experiments.'''
+        it can be used in DistributeScan experiments. The values
+        of the parameters are shared, and the grid indexes of each
+        part are a view of one shuffled array.'''
 
         import numpy as np
         import copy
@@ -48,22 +50,19 @@ class DistributeParamSpace:
 
         # randomly shuffle the param_space
         rand = np.random.default_rng()
-        rand.shuffle(self._params.param_space, axis=0)
+        order = rand.permutation(len(self._params.grid_index))
+        grid_index = self._params.grid_index[order]
 
         # split into n arras
-        param_spaces = np.array_split(self._params.param_space, self.machines)
-
-        # remove keys to allow copy
-        param_keys = self._params.param_keys
-        self._params.param_keys = []
+        grid_indexes = np.array_split(grid_index, self.machines)
 
         # create the individual ParamSpace objects
         for i in range(self.machines):
 
-            out[i] = copy.deepcopy(self._params)
-            out[i].param_space = param_spaces[i]
-            out[i].dimensions = len(out[i].param_space)
+            out[i] = copy.copy(self._params)
+            out[i]._tables = list(self._params._tables)
+            out[i].grid_index = grid_indexes[i]
+            out[i].dimensions = len(out[i].grid_index)
             out[i].param_index = list(range(out[i].dimensions))
-            out[i].param_keys = param_keys
 
         return out
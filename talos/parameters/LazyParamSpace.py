@@ -0,0 +1,677 @@
+import threading
+from collections import Counter
+
+import numpy as np
+
+from .ParamSpace import ParamSpace, _object_array
+from .ParamSpace import _sorted_positions, _find_positions
+
+
+class LazyParamSpace(ParamSpace):
+
+    def __init__(self,
+                 params,
+                 param_keys,
+                 random_method='uniform_mersenne',
+                 fraction_limit=None,
+                 round_limit=None,
+                 time_limit=None,
+                 boolean_limit=None):
+
+        '''Same as ParamSpace, but the permutations are never created
+        up front. Each permutation is decoded from its index on the full
+        grid when it's drawn, so memory does not grow with the size of the
+        grid. Removals are kept as the allowed values of each parameter,
+        and `boolean_limit` and `remove_lambda` are checked as each
+        permutation is drawn, as are the conditions of `Conditional`
+        parameters.
+
+        `param_index` is a read-only sequence of the grid indexes of the
+        remaining permutations, and `grid_index` maps a grid index to
+        itself. `param_space` is not available.
+
+        NOTE: The length of `param_index` is an upper bound when
+        `boolean_limit`, `remove_lambda`, `prioritize()` or a
+        `Conditional` parameter is used.
+
+        '''
+
+        # set all the arguments
+        self.params = params
+        self.param_keys = param_keys
+        self.fraction_limit = fraction_limit
+        self.round_limit = round_limit
+        self.time_limit = time_limit
+        self.boolean_limit = boolean_limit
+        self.random_method = random_method
+
+        # set a counter
+        self.round_counter = 0
+
+        # round_parameters() and removals may be called from many threads
+        self._lock = threading.Lock()
+
+        # handle tuple conversion to discrete values
+        self.p = self._param_input_conversion()
+
+        # create list of list from the params dictionary
+        self._params_temp = [list(self.p[key]) for key in self.param_keys]
+
+        # establish max dimensions (as python int to avoid overflow)
+        self.dimensions = 1
+        for l in self._params_temp:
+            self.dimensions *= len(l)
+
+        # the parameters that are sampled as each permutation is drawn
+        self._distributions = self._param_distributions()
+
+        # the parameters that only have a value under some conditions
+        self._conditions = self._param_conditions()
+
+        # the values of each parameter that are not removed
+        self._allowed = [np.ones(len(l), dtype=bool)
+                         for l in self._params_temp]
+
+        # lambdas that are checked as the permutations are drawn
+        self._limits = []
+        if self.boolean_limit is not None:
+            self._limits.append(self._convert_lambda(self.boolean_limit))
+
+        # the sampled grid indexes (see sample_reducer) or None
+        # to go through the grid in order
+        self._order = None
+        if self.fraction_limit is not None or self.round_limit is not None:
+            self._order = self._param_apply_limits()
+
+        # the positions of the grid indexes in _order (see _is_ahead)
+        self._order_rows = None
+
+        # the permutations ahead that are already checked (see _next_checked)
+        self._checked = None
+
+        # where the next permutation is drawn from
+        self._position = 0
+        self._cursor = 0
+
+        # grid indexes drawn before others, and ones to skip
+        self._priority = []
+        self._excluded = Counter()
+
+        # canonicalize() needs the permutations up front
+        self._equivalents = {}
+
+        # changes whenever the remaining permutations change (see _cached)
+        self._version = 0
+        self._cache = {}
+
+    @property
+    def param_index(self):
+
+        return _LazyIndex(self)
+
+    @param_index.setter
+    def param_index(self, grid_indexes):
+
+        # e.g. an empty list once the performance target is met
+        self._order = np.array(grid_indexes, dtype='int64')
+        self._order_rows = None
+        self._position = 0
+        self._priority = []
+        self._version += 1
+
+    @property
+    def grid_index(self):
+
+        return _GridIndex()
+
+    def round_parameters(self):
+
+        with self._lock:
+
+            if self._check_time_limit():
+
+                # handle the boolean limits and conditional parameters
+                if len(self._limits) > 0 or len(self._conditions) > 0:
+                    values = self._next_checked()
+
+                else:
+                    index = self._next()
+                    values = None
+                    if index is not None:
+                        values = self._param_values(index)
+                        values = self._sample_values(values)
+
+                # the experiment is finished
+                if values is None:
+                    return False
+
+                self.round_counter += 1
+
+                # pass the parameters to Scan
+                return self._round_parameters_todict(values)
+
+        return False
+
+    def draw_grid_index(self, index):
+
+        '''Same as round_parameters(), but draws the permutation with the
+        grid index e.g. one that is claimed from a ParamQueue. Returns
+        False if it's not left e.g. it was removed by a reducer.'''
+
+        with self._lock:
+
+            if index in self._priority:
+                self._priority.remove(index)
+
+            elif not self._is_ahead(index):
+                return False
+
+            # it's skipped when the cursor gets to it
+            else:
+                self._excluded[index] += 1
+
+            self._version += 1
+
+            allowed, accepted, values = self._check_block(np.array([index]))
+
+            if not accepted[0]:
+                return False
+
+            self.round_counter += 1
+
+        return self._round_parameters_todict(values(0))
+
+    def replace_sample(self, grid_indexes):
+
+        '''Replaces the permutations sampled with round_limit or
+        fraction_limit with the grid indexes e.g. the ones a ParamQueue
+        was seeded with by another node.'''
+
+        with self._lock:
+            self.param_index = grid_indexes
+
+    def prioritize(self, index):
+
+        '''Moves a permutation in param_index to the front, so that it
+        is the next one returned by round_parameters().'''
+
+        with self._lock:
+            if index in self._priority:
+                self._priority.remove(index)
+            else:
+                self._excluded[index] += 1
+            self._priority.insert(0, index)
+            self._version += 1
+
+    def canonicalize(self, rules):
+
+        '''Not available, as the permutations are not created.'''
+
+        from ..utils.exceptions import TalosParamsError
+
+        raise TalosParamsError('canonicalize() is not available for '
+                               'LazyParamSpace, use ParamSpace instead.')
+
+    def remove_lambda(self, function):
+
+        '''Removes based on a lambda function'''
+
+        with self._lock:
+            self._limits.append(self._convert_lambda(function))
+            self._version += 1
+
+    def remove_grid_index(self, grid_indexes):
+
+        '''Removes permutations based on their grid indexes
+        e.g. the ones that were already done before resuming.'''
+
+        with self._lock:
+            for index in grid_indexes:
+                if index in self._priority:
+                    self._priority.remove(index)
+                else:
+                    self._excluded[index] += 1
+            self._version += 1
+
+    def snapshot(self, in_flight=None):
+
+        '''Returns the progress through the parameter space in a
+        compact form for restore(). Rounds in flight are drawn first.'''
+
+        if in_flight is None:
+            in_flight = []
+
+        return {'allowed': [a.copy() for a in self._allowed],
+                'order': self._order,
+                'position': self._position,
+                'cursor': self._cursor,
+                'priority': list(in_flight) + self._priority,
+                'excluded': Counter(self._excluded),
+                'round_counter': self.round_counter}
+
+    def restore(self, state):
+
+        '''Continues from a snapshot().'''
+
+        with self._lock:
+            self._allowed = state['allowed']
+            self._order = state['order']
+            self._order_rows = None
+            self._position = state['position']
+            self._cursor = state['cursor']
+            self._priority = state['priority']
+            self._excluded = state['excluded']
+            self.round_counter = state['round_counter']
+            self._version += 1
+
+    def _remove(self, label, condition):
+
+        col = self.param_keys.index(label)
+
+        # the values of distributions are not known before they are drawn
+        if col in self._distributions:
+            return
+
+        drop = np.array([condition(x) for x in self._params_temp[col]])
+
+        with self._lock:
+            self._allowed[col] &= ~drop
+            self._version += 1
+
+    def _distribution_values(self, col, rows):
+
+        # distributions are sampled as each permutation is drawn
+        return [None] * len(rows)
+
+    def _next_checked(self):
+
+        '''Same as _next(), but returns the values of the next permutation
+        that is valid (see Conditional) and accepted by the limits, or None
+        if there are none left. The permutations ahead are decoded and
+        checked a block at a time, so that each limit is evaluated for many
+        permutations at once. The blocks grow from a few permutations up to
+        BooleanLimit.chunk_size, so that a limit that accepts most of them
+        is not evaluated far ahead.'''
+
+        from .BooleanLimit import BooleanLimit
+
+        while len(self._priority) > 0:
+            index = self._priority.pop(0)
+            allowed, accepted, values = self._check_block(np.array([index]))
+            if accepted[0]:
+                return values(0)
+
+        size = 16
+
+        while True:
+
+            # the rest of the block checked by the previous draw
+            key = (self._version, self._position, self._cursor)
+            if self._checked is not None and self._checked[0] == key:
+                block, allowed, accepted, values, start, size = \
+                    self._checked[1:]
+
+            else:
+                block = self._peek(size)
+                start = 0
+
+                if len(block) == 0:
+                    return None
+
+                allowed, accepted, values = self._check_block(block)
+
+            self._checked = None
+
+            # the excluded ones are skipped as in _next()
+            excluded = np.isin(block[start:], self._excluded_indexes())
+            candidates = (excluded & allowed[start:]) | accepted[start:]
+
+            for j in np.flatnonzero(candidates) + start:
+
+                index = int(block[j])
+
+                if self._excluded[index] > 0:
+                    self._excluded[index] -= 1
+                    self._version += 1
+                    continue
+
+                self._advance(block, start, j)
+
+                if j + 1 < len(block):
+                    self._checked = ((self._version,
+                                      self._position,
+                                      self._cursor),
+                                     block, allowed, accepted, values,
+                                     j + 1, size)
+
+                return values(j)
+
+            self._advance(block, start, len(block) - 1)
+
+            size = min(size * 2, BooleanLimit.chunk_size)
+
+    def _peek(self, size):
+
+        '''Returns the grid indexes of up to `size` permutations that
+        _next() goes through next, without drawing them. Priority and
+        excluded permutations are not taken into account.'''
+
+        if self._order is not None:
+            return self._order[self._position:self._position + size]
+
+        start = self._rank(self._cursor)
+        stop = min(start + size, self._allowed_size())
+
+        return self._unrank_many(np.arange(start, stop, dtype='int64'))
+
+    def _advance(self, block, start, j):
+
+        '''Moves past the jth permutation of a block from _peek(),
+        where the startth one is the next one to be drawn.'''
+
+        if self._order is not None:
+            self._position += j + 1 - start
+        else:
+            self._cursor = int(block[j]) + 1
+
+    def _check_block(self, grid_indexes):
+
+        '''Returns boolean arrays for the grid indexes with True for the
+        ones that are allowed, and for the ones that are also valid (see
+        Conditional) and accepted by the limits, and a function that
+        returns the values of the jth one with the distributions sampled.'''
+
+        codes = self._grid_codes(grid_indexes)
+
+        allowed = np.ones(len(codes), dtype=bool)
+        for i, values in enumerate(self._allowed):
+            allowed &= values[codes[:, i]]
+
+        accepted = allowed & self._is_valid(codes)
+
+        # the permutations as a parameter space (see ParamSpace)
+        columns = [codes[:, i] for i in range(len(self._params_temp))]
+        tables = [_object_array(l) for l in self._params_temp]
+
+        for i, distribution in self._distributions.items():
+            sample = distribution.sample(np.random.random(len(codes)))
+            columns[i] = np.arange(len(codes))
+            tables[i] = _object_array(sample.tolist())
+
+        # the limits are evaluated for the valid permutations only
+        for limit in self._limits:
+            rows = np.flatnonzero(accepted)
+            accepted[rows] = limit([column[rows] for column in columns],
+                                   tables)
+
+        def values(j):
+            return [table[column[j]] for table, column in zip(tables, columns)]
+
+        return allowed, accepted, values
+
+    def _next(self):
+
+        '''Returns the grid index of the next allowed permutation,
+        or None if there are none left.'''
+
+        if len(self._priority) > 0:
+            return self._priority.pop(0)
+
+        while True:
+
+            # go through the grid in order
+            if self._order is None:
+                rank = self._rank(self._cursor)
+                if rank >= self._allowed_size():
+                    return None
+                index = self._unrank(rank)
+                self._cursor = index + 1
+
+            # go through the sampled grid indexes
+            else:
+                if self._position >= len(self._order):
+                    return None
+                index = int(self._order[self._position])
+                self._position += 1
+                if not self._is_allowed(np.array([index]))[0]:
+                    continue
+
+            if self._excluded[index] > 0:
+                self._excluded[index] -= 1
+                self._version += 1
+                continue
+
+            return index
+
+    def _is_ahead(self, index):
+
+        '''Returns True if the grid index is allowed, not excluded
+        and not yet drawn in the order of the permutations.'''
+
+        if not self._is_allowed(np.array([index]))[0]:
+            return False
+
+        if self._excluded[index] > 0:
+            return False
+
+        if self._order is None:
+            return index >= self._cursor
+
+        if self._order_rows is None:
+            self._order_rows = _sorted_positions(self._order)
+
+        positions = _find_positions(self._order_rows, index)
+
+        return bool((positions >= self._position).any())
+
+    def _allowed_size(self, start=0):
+
+        size = 1
+        for allowed in self._allowed[start:]:
+            size *= int(np.count_nonzero(allowed))
+
+        return size
+
+    def _rank(self, index):
+
+        '''Returns the number of allowed permutations that come
+        before the grid index on the full grid.'''
+
+        if index >= self.dimensions:
+            return self._allowed_size()
+
+        rank = 0
+        for i, code in enumerate(self._codes(index)):
+            below = int(np.count_nonzero(self._allowed[i][:code]))
+            rank += below * self._allowed_size(i + 1)
+            if not self._allowed[i][code]:
+                break
+
+        return rank
+
+    def _unrank(self, rank):
+
+        '''Returns the grid index of the nth allowed permutation.'''
+
+        index = 0
+        stride = 1
+
+        for i in reversed(range(len(self._params_temp))):
+            rank, code = divmod(rank, int(np.count_nonzero(self._allowed[i])))
+            index += int(np.flatnonzero(self._allowed[i])[code]) * stride
+            stride *= len(self._params_temp[i])
+
+        return index
+
+    def _unrank_many(self, ranks):
+
+        '''Same as _unrank() for an array of ranks.'''
+
+        out = np.zeros(len(ranks), dtype='int64')
+        stride = 1
+
+        for i in reversed(range(len(self._params_temp))):
+            values = np.flatnonzero(self._allowed[i])
+            ranks, code = np.divmod(ranks, len(values))
+            out += values[code] * stride
+            stride *= len(self._params_temp[i])
+
+        return out
+
+    def _codes(self, index):
+
+        '''Returns the position of each parameter value on the grid.'''
+
+        codes = []
+        for l in reversed(self._params_temp):
+            index, code = divmod(index, len(l))
+            codes.insert(0, code)
+
+        return codes
+
+    def _is_allowed(self, grid_indexes):
+
+        '''Returns a boolean array for the grid indexes that are
+        not removed.'''
+
+        codes = self._grid_codes(grid_indexes)
+        out = np.ones(len(codes), dtype=bool)
+
+        for i, allowed in enumerate(self._allowed):
+            out &= allowed[codes[:, i]]
+
+        return out
+
+    def _remaining(self):
+
+        out = len(self._priority)
+
+        if self._order is None:
+            out += self._allowed_size() - self._rank(self._cursor)
+            out -= len(self._excluded_ranks())
+        elif self._is_unrestricted():
+            out += len(self._order) - self._position
+        else:
+            out += len(self._remaining_order())
+
+        return out
+
+    def _is_unrestricted(self):
+
+        '''Returns True if nothing is removed or excluded, so that the
+        sampled grid indexes that are left do not have to be checked.'''
+
+        return (all(allowed.all() for allowed in self._allowed)
+                and not any(n > 0 for n in self._excluded.values()))
+
+    def _cached(self, name, function):
+
+        '''Returns the output of the function as long as nothing
+        is drawn or removed.'''
+
+        key = (self._version, self._position, self._cursor)
+
+        if name not in self._cache or self._cache[name][0] != key:
+            self._cache[name] = (key, function())
+
+        return self._cache[name][1]
+
+    def _excluded_indexes(self):
+
+        return np.array([i for i, n in self._excluded.items() if n > 0],
+                        dtype='int64')
+
+    def _excluded_ranks(self):
+
+        '''Returns the sorted ranks of the excluded permutations
+        that are still ahead of the cursor.'''
+
+        def ranks():
+            excluded = self._excluded_indexes()
+            excluded = excluded[excluded >= self._cursor]
+            excluded = excluded[self._is_allowed(excluded)]
+            return sorted([self._rank(int(i)) for i in excluded])
+
+        return self._cached('ranks', ranks)
+
+    def _remaining_order(self):
+
+        '''Returns the positions in _order that are left, allowed
+        and not excluded.'''
+
+        def positions():
+            order = self._order[self._position:]
+            keep = self._is_allowed(order)
+            keep &= ~np.isin(order, self._excluded_indexes())
+            return np.flatnonzero(keep) + self._position
+
+        return self._cached('positions', positions)
+
+    def _nth(self, n):
+
+        if n < len(self._priority):
+            return self._priority[n]
+
+        n -= len(self._priority)
+
+        if self._order is None:
+
+            # step over the excluded permutations
+            rank = self._rank(self._cursor) + n
+            for excluded in self._excluded_ranks():
+                if excluded <= rank:
+                    rank += 1
+                else:
+                    break
+
+            return self._unrank(rank)
+
+        if self._is_unrestricted():
+            return int(self._order[self._position + n])
+
+        return int(self._order[self._remaining_order()[n]])
+
+
+class _LazyIndex:
+
+    '''The grid indexes of the remaining permutations of a
+    LazyParamSpace, without creating them.'''
+
+    def __init__(self, param_object):
+
+        self.param_object = param_object
+
+    def __len__(self):
+
+        return self.param_object._remaining()
+
+    def __getitem__(self, n):
+
+        if n < 0:
+            n += len(self)
+
+        if n < 0 or n >= len(self):
+            raise IndexError('param_index out of range')
+
+        return self.param_object._nth(n)
+
+    def __iter__(self):
+
+        for n in range(len(self)):
+            yield self.param_object._nth(n)
+
+    def __array__(self, dtype=None, copy=None):
+
+        return np.array(list(self), dtype=dtype)
+
+
+class _GridIndex:
+
+    '''Maps the grid indexes of a LazyParamSpace to themselves.'''
+
+    def __getitem__(self, index):
+
+        if isinstance(index, (list, np.ndarray)):
+            return np.asarray(index)
+
+        return index
@@ -0,0 +1,306 @@
+class ParamQueue:
+
+    def __init__(self,
+                 path,
+                 batch_size=1,
+                 lease_seconds=600,
+                 node=None):
+
+        '''A work queue of permutations that is shared between several
+        machines through a SQLite file, for example on a network mount.
+        Each machine runs `Scan(..., queue=ParamQueue(path))` with the same
+        `params` and claims permutations from the queue until none are left.
+
+        A claimed batch is leased to the node for `lease_seconds`. The lease
+        is renewed by a heartbeat while the node is alive, and once a lease
+        expires (e.g. the node died) the permutations are given to other
+        nodes. The first node to start seeds the queue with its permutations.
+
+        path | str | path to the SQLite file shared by all the nodes
+        batch_size | int | number of permutations claimed at a time
+        lease_seconds | int | seconds before an unrenewed lease expires
+        node | str or None | name of the node; hostname and pid by default
+
+        NOTE: The parameter space of each node is made of the permutations
+        the queue was seeded with e.g. the same round_limit sample. Reducers
+        only see the results of their own node, and the permutations they
+        remove are skipped when claimed by that node.
+        The experiment log of each node is written locally as usual, and
+        `results()` returns the results of all the nodes.
+
+        '''
+
+        import os
+        import socket
+
+        self.path = path
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+
+        if node is None:
+            node = socket.gethostname() + '-' + str(os.getpid())
+
+        self.node = node
+
+        # the permutations currently leased to this node
+        self._leased = set()
+        self._heartbeat = None
+
+    def _connect(self):
+
+        '''Returns a new connection to the queue. WAL is not used
+        because it does not work on network file systems.'''
+
+        import sqlite3
+
+        conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        conn.execute('PRAGMA busy_timeout = 60000')
+
+        return conn
+
+    def seed(self, param_object):
+
+        '''Creates the queue from a ParamSpace object unless another
+        node already did. Returns True if the queue was created by this
+        node. Raises TalosParamsError if the queue was created for a
+        different parameter space.'''
+
+        import json
+
+        from ..utils.exceptions import TalosParamsError
+
+        signature = json.dumps([list(param_object.param_keys),
+                                str(param_object.dimensions)])
+
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+
+        conn.execute('''CREATE TABLE IF NOT EXISTS meta
+                        (key TEXT PRIMARY KEY, value TEXT)''')
+        conn.execute('''CREATE TABLE IF NOT EXISTS permutations
+                        (idx TEXT PRIMARY KEY,
+                         position INTEGER,
+                         status TEXT,
+                         node TEXT,
+                         lease_until REAL,
+                         attempts INTEGER,
+                         result TEXT)''')
+        conn.execute('''CREATE INDEX IF NOT EXISTS permutations_status
+                        ON permutations (status, position)''')
+
+        found = conn.execute("SELECT value FROM meta WHERE key='signature'")
+        found = found.fetchone()
+
+        if found is None:
+            rows = [(str(param_object.grid_index[idx]), i,
+                     'pending', None, 0, 0, None)
+                    for i, idx in enumerate(param_object.param_index)]
+            conn.executemany('''INSERT INTO permutations
+                                VALUES (?, ?, ?, ?, ?, ?, ?)''', rows)
+            conn.execute("INSERT INTO meta VALUES ('signature', ?)",
+                         (signature,))
+            conn.execute("INSERT INTO meta VALUES ('seeded_by', ?)",
+                         (self.node,))
+
+        conn.execute('COMMIT')
+        conn.close()
+
+        if found is not None and found[0] != signature:
+            raise TalosParamsError("The queue was created for other params.")
+
+        return found is None
+
+    def grid_indexes(self):
+
+        '''Returns the grid indexes of all the permutations in the
+        order they were seeded in.'''
+
+        conn = self._connect()
+        rows = conn.execute('''SELECT idx FROM permutations
+                               ORDER BY position''').fetchall()
+        conn.close()
+
+        return [int(row[0]) for row in rows]
+
+    def claim(self):
+
+        '''Leases the next batch of permutations to this node. Pending
+        permutations are claimed first, and then ones with an expired
+        lease. Returns a list of grid indexes (empty when none is free).'''
+
+        import time
+
+        now = time.time()
+
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+
+        rows = conn.execute('''SELECT idx FROM permutations
+                               WHERE status = 'pending'
+                               OR (status = 'leased' AND lease_until < ?)
+                               ORDER BY status DESC, position
+                               LIMIT ?''', (now, self.batch_size))
+        indexes = [row[0] for row in rows.fetchall()]
+
+        conn.executemany('''UPDATE permutations
+                            SET status = 'leased', node = ?,
+                            lease_until = ?, attempts = attempts + 1
+                            WHERE idx = ?''',
+                         [(self.node, now + self.lease_seconds, idx)
+                          for idx in indexes])
+
+        conn.execute('COMMIT')
+        conn.close()
+
+        self._leased.update(indexes)
+
+        return [int(idx) for idx in indexes]
+
+    def renew(self):
+
+        '''Extends the lease of the permutations held by this node.'''
+
+        import time
+
+        leased = list(self._leased)
+
+        if len(leased) == 0:
+            return
+
+        conn = self._connect()
+        conn.executemany('''UPDATE permutations SET lease_until = ?
+                            WHERE idx = ? AND node = ?
+                            AND status = 'leased' ''',
+                         [(time.time() + self.lease_seconds, idx, self.node)
+                          for idx in leased])
+        conn.close()
+
+    def complete(self, index, result):
+
+        '''Marks a permutation as done and stores its result row. Returns
+        False if this node no longer holds the lease e.g. it expired and
+        the permutation was claimed by another node. A permutation that
+        this node has completed can be completed again by it e.g. with
+        the result of a higher rung of a scheduler.'''
+
+        import json
+
+        conn = self._connect()
+        updated = conn.execute('''UPDATE permutations
+                                  SET status = 'done', result = ?
+                                  WHERE idx = ? AND node = ?
+                                  AND status IN ('leased', 'done')''',
+                               (json.dumps(result, default=str),
+                                str(index),
+                                self.node)).rowcount
+        conn.close()
+
+        self._leased.discard(str(index))
+
+        return updated == 1
+
+    def skip(self, index):
+
+        '''Marks a permutation as skipped e.g. when a scheduler has
+        already run the same permutation with another value of epochs.'''
+
+        conn = self._connect()
+        conn.execute('''UPDATE permutations SET status = 'skipped'
+                        WHERE idx = ? AND node = ?
+                        AND status = 'leased' ''', (str(index), self.node))
+        conn.close()
+
+        self._leased.discard(str(index))
+
+    def release(self):
+
+        '''Gives the permutations held by this node back to the queue.'''
+
+        leased = list(self._leased)
+
+        conn = self._connect()
+        conn.executemany('''UPDATE permutations SET status = 'pending'
+                            WHERE idx = ? AND node = ?
+                            AND status = 'leased' ''',
+                         [(idx, self.node) for idx in leased])
+        conn.close()
+
+        self._leased = set()
+
+    def cancel(self):
+
+        '''Cancels all the pending permutations e.g. when the
+        performance target has been met on some node.'''
+
+        conn = self._connect()
+        conn.execute('''UPDATE permutations SET status = 'cancelled'
+                        WHERE status = 'pending' ''')
+        conn.close()
+
+    def set_header(self, header):
+
+        '''Stores the column names of the result rows once.'''
+
+        import json
+
+        conn = self._connect()
+        conn.execute("INSERT OR IGNORE INTO meta VALUES ('header', ?)",
+                     (json.dumps(header),))
+        conn.close()
+
+    def remaining(self):
+
+        '''Returns the number of permutations that are pending or
+        leased to some node.'''
+
+        conn = self._connect()
+        out = conn.execute('''SELECT COUNT(*) FROM permutations
+                              WHERE status IN ('pending', 'leased')''')
+        out = out.fetchone()[0]
+        conn.close()
+
+        return out
+
+    def results(self):
+
+        '''Returns the results from all the nodes as a dataframe.'''
+
+        import json
+        import pandas as pd
+
+        conn = self._connect()
+        header = conn.execute("SELECT value FROM meta WHERE key='header'")
+        header = header.fetchone()
+        rows = conn.execute('''SELECT result FROM permutations
+                               WHERE status = 'done'
+                               ORDER BY position''').fetchall()
+        conn.close()
+
+        rows = [json.loads(row[0]) for row in rows]
+
+        if header is None:
+            return pd.DataFrame(rows)
+
+        return pd.DataFrame(rows, columns=json.loads(header[0]))
+
+    def start_heartbeat(self):
+
+        '''Starts renewing the leases of this node in the background.'''
+
+        import threading
+
+        self._stop = threading.Event()
+
+        def beat():
+            while not self._stop.wait(self.lease_seconds / 3):
+                self.renew()
+
+        self._heartbeat = threading.Thread(target=beat, daemon=True)
+        self._heartbeat.start()
+
+    def stop_heartbeat(self):
+
+        if self._heartbeat is not None:
+            self._stop.set()
+            self._heartbeat.join()
+            self._heartbeat = None
@@ -1,9 +1,13 @@
-import inspect
+import threading
+from collections import Counter
 
 import numpy as np
 import itertools as it
 from datetime import datetime
 
+from .distributions import is_distribution
+from .Conditional import is_conditional
+
 
 class ParamSpace:
 
@@ -28,6 +32,9 @@ class ParamSpace:
         # set a counter
         self.round_counter = 0
 
+        # round_parameters() and removals may be called from many threads
+        self._lock = threading.Lock()
+
         # handle tuple conversion to discrete values
         self.p = self._param_input_conversion()
 
@@ -37,19 +44,90 @@ class ParamSpace:
         # establish max dimensions
         self.dimensions = np.prod([len(l) for l in self._params_temp])
 
-        # apply all the set limits
-        self.param_index = self._param_apply_limits()
+        # the parameters that are sampled for each round
+        self._distributions = self._param_distributions()
+
+        # the parameters that only have a value under some conditions
+        self._conditions = self._param_conditions()
 
-        # create the parameter space
-        self.param_space = self._param_space_creation()
+        # the values of each parameter that the parameter space refers to
+        self._tables = self._value_tables()
+
+        # apply all the set limits and create the parameter space
+        self.grid_index = self._param_apply_limits()
 
         # handle the boolean limits separately
         if self.boolean_limit is not None:
-            index = self._convert_lambda(self.boolean_limit)(self.param_space)
-            self.param_space = self.param_space[index]
+            limit = self._convert_lambda(self.boolean_limit)
+            self.grid_index = self.grid_index[limit(self._columns,
+                                                    self._tables)]
+
+        # all the permutations are left
+        self.param_index = range(len(self.grid_index))
+
+        # the permutations removed as the same as another (see canonicalize)
+        self._equivalents = {}
+
+    @property
+    def grid_index(self):
+
+        '''The position of each permutation on the full grid.'''
+
+        return self._grid_index
+
+    @grid_index.setter
+    def grid_index(self, grid_indexes):
+
+        # the parameter space is created from the positions on the grid
+        # (an int64 array is kept as it is e.g. a part of a larger one)
+        self._grid_index = np.asarray(grid_indexes, dtype='int64')
+        self._grid_rows = None
+        self._sample_distributions()
+        self._columns = self._param_space_creation()
+
+    @property
+    def param_space(self):
+
+        '''The permutations as an array of parameter values with a
+        column for each parameter. Created from the columns each time
+        it's accessed.'''
+
+        out = np.empty((len(self.grid_index), len(self._tables)),
+                       dtype='object')
+
+        for i, table in enumerate(self._tables):
+            out[:, i] = table[self._columns[i]]
+
+        return out
 
-        # reset index
-        self.param_index = list(range(len(self.param_index)))
+    @property
+    def param_index(self):
+
+        '''The rows of param_space that are left, in the order they
+        are drawn by round_parameters().'''
+
+        rest = self._order[self._cursor:]
+        rest = rest[self._active[rest]]
+
+        priority = [i for i in self._priority if self._active[i]]
+
+        if len(priority) > 0:
+            rest = rest[~np.isin(rest, priority)]
+            rest = np.concatenate([np.array(priority, dtype='int64'), rest])
+
+        return rest
+
+    @param_index.setter
+    def param_index(self, rows):
+
+        # the rows that are left are kept as a mask, and the order they
+        # are drawn in with a cursor, so that drawing and removing
+        # permutations does not have to copy the list of rows
+        self._order = np.array(rows, dtype='int64')
+        self._cursor = 0
+        self._priority = []
+        self._active = np.zeros(len(self.grid_index), dtype=bool)
+        self._active[self._order] = True
 
     def _param_input_conversion(self):
 
@@ -71,6 +149,185 @@ class ParamSpace:
             elif isinstance(self.params[param], list):
                 out[param] = self.params[param]
 
+            # deal with distributions which are sampled for each round
+            elif is_distribution(self.params[param]):
+                out[param] = [self.params[param]]
+
+            # deal with conditional values where the default comes first
+            elif is_conditional(self.params[param]):
+                values = self.params[param].values
+                if isinstance(values, tuple):
+                    values = self._param_range_expansion(values)
+                out[param] = [self.params[param].default] + list(values)
+
+        return out
+
+    def _param_distributions(self):
+
+        '''Returns the distributions in params by their column.'''
+
+        out = {}
+        for i, key in enumerate(self.param_keys):
+            if is_distribution(self.params[key]):
+                out[i] = self.params[key]
+
+        return out
+
+    def _param_conditions(self):
+
+        '''Returns the conditional parameters by their column, each
+        with a list of (column, mask) pairs where the mask is True for
+        the values of the other parameter that meet the condition.'''
+
+        from ..utils.exceptions import TalosParamsError
+
+        out = {}
+        for i, key in enumerate(self.param_keys):
+
+            if not is_conditional(self.params[key]):
+                continue
+
+            out[i] = []
+            for label in self.params[key].when:
+
+                if label not in self.param_keys:
+                    raise TalosParamsError('%s is conditional on %s which is '
+                                           'not in params.' % (key, label))
+
+                col = self.param_keys.index(label)
+                if col in self._distributions:
+                    raise TalosParamsError('%s can not be conditional on a '
+                                           'distribution.' % key)
+
+                mask = [self.params[key].is_met(label, value)
+                        for value in self._params_temp[col]]
+                out[i].append((col, np.array(mask, dtype=bool)))
+
+        # check that the conditions do not depend on each other
+        self._condition_order(out)
+
+        return out
+
+    def _condition_order(self, conditions):
+
+        '''Returns the columns in an order where each conditional
+        parameter comes after the parameters of its conditions.'''
+
+        from ..utils.exceptions import TalosParamsError
+
+        order = []
+        left = list(range(len(self.param_keys)))
+
+        while len(left) > 0:
+
+            ready = [i for i in left
+                     if all(col in order for col, _ in conditions.get(i, []))]
+
+            if len(ready) == 0:
+                labels = [self.param_keys[i] for i in left]
+                raise TalosParamsError('the conditions of %s depend on '
+                                       'each other.' % labels)
+
+            order += ready
+            left = [i for i in left if i not in ready]
+
+        return order
+
+    def _valid_codes(self):
+
+        '''Returns the codes of the parameters that the conditions
+        involve (the conditional parameters and the ones they depend on)
+        by column, one row for each of their combinations where each
+        conditional parameter has a value only when its conditions are
+        met. The combinations are expanded one parameter at a time, so the
+        ones that are not valid are never created.'''
+
+        involved = set(self._conditions)
+        for conditions in self._conditions.values():
+            involved.update(col for col, _ in conditions)
+
+        codes = {}
+        n = 1
+
+        for i in self._condition_order(self._conditions):
+
+            if i not in involved:
+                continue
+
+            size = len(self._params_temp[i])
+            active = np.ones(n, dtype=bool)
+            shift = 0
+
+            # the default when the conditions are not met
+            if i in self._conditions:
+                for col, mask in self._conditions[i]:
+                    active &= mask[codes[col]]
+                counts = np.where(active, size - 1, 1)
+                shift = 1
+            else:
+                counts = np.full(n, size)
+
+            # each combination so far once for each value it can take
+            rows = np.repeat(np.arange(n), counts)
+            offsets = np.arange(len(rows)) - (np.cumsum(counts) - counts)[rows]
+
+            for col in codes:
+                codes[col] = codes[col][rows]
+            codes[i] = np.where(active[rows], offsets + shift, 0)
+
+            n = len(rows)
+
+        return codes
+
+    def _valid_size(self, codes):
+
+        '''Returns the number of valid permutations from the
+        output of _valid_codes().'''
+
+        size = len(next(iter(codes.values())))
+        for i, l in enumerate(self._params_temp):
+            if i not in codes:
+                size *= len(l)
+
+        return size
+
+    def _valid_grid_index(self, codes, positions):
+
+        '''Returns the grid indexes of the valid permutations at the
+        positions, where the valid permutations are numbered by the
+        combination in _valid_codes() and then by the values of the other
+        parameters. Only the permutations at the positions are created.'''
+
+        positions = np.array(positions, dtype='int64')
+
+        # the values of the parameters that the conditions do not involve
+        rest = positions
+        other = {}
+        for i in reversed(range(len(self._params_temp))):
+            if i not in codes:
+                rest, other[i] = np.divmod(rest, len(self._params_temp[i]))
+
+        out = np.zeros(len(positions), dtype='int64')
+        for i, l in enumerate(self._params_temp):
+            code = codes[i][rest] if i in codes else other[i]
+            out = out * len(l) + code
+
+        return out
+
+    def _is_valid(self, codes):
+
+        '''Returns a boolean array for rows of grid codes (see
+        _grid_codes) where each conditional parameter has a value
+        only when its conditions are met.'''
+
+        out = np.ones(len(codes), dtype=bool)
+
+        for i, conditions in self._conditions.items():
+            active = np.ones(len(codes), dtype=bool)
+            for col, mask in conditions:
+                active &= mask[codes[:, col]]
+            out &= active == (codes[:, i] > 0)
+
         return out
 
     def _param_apply_limits(self):
@@ -86,20 +343,52 @@ class ParamSpace:
             # NOTE: this is handled in _time_left
             pass
 
+        # the limits are applied to the valid permutations only
+        valid = None
+        size = self.dimensions
+        if len(self._conditions) > 0:
+            valid = self._valid_codes()
+            size = self._valid_size(valid)
+
         # a fractional limit is set
         if self.fraction_limit is not None:
-            return sample_reducer(self.fraction_limit,
-                                  self.dimensions,
-                                  self.random_method)
+            out = sample_reducer(self.fraction_limit,
+                                 size,
+                                 self.random_method)
 
         # a round limit is set
-        if self.round_limit is not None:
-            return sample_reducer(self.round_limit,
-                                  self.dimensions,
-                                  self.random_method)
+        elif self.round_limit is not None:
+
+            repeats, rest = divmod(self.round_limit, int(size))
+
+            # the permutations are repeated with new samples of the
+            # distributions when there are more rounds than permutations
+            if len(self._distributions) > 0 and repeats > 0:
+                out = np.tile(np.arange(size), repeats)
+                if rest > 0:
+                    out = np.concatenate([out, sample_reducer(
+                        rest, size, self.random_method)])
+                out = np.random.permutation(out)
+
+            else:
+                out = sample_reducer(self.round_limit,
+                                     size,
+                                     self.random_method)
 
         # no limits are set
-        return list(range(self.dimensions))
+        else:
+            out = list(range(size))
+
+        if valid is None:
+            return out
+
+        out = self._valid_grid_index(valid, out)
+
+        # all the valid permutations are in the order of the grid
+        if self.fraction_limit is None and self.round_limit is None:
+            out = np.sort(out)
+
+        return out
 
     def _param_range_expansion(self, param_values):
 
@@ -126,18 +415,121 @@ class ParamSpace:
         '''Expand params dictionary to permutations
 
         Takes the input params dictionary and expands it to
-        actual parameter permutations for the experiment.
+        actual parameter permutations for the experiment. Each
+        parameter is kept as a column of positions in its table of
+        values, with the smallest integer type that fits.
         '''
 
-        final_grid = []
-        for i in self.param_index:
-            p = []
-            for l in reversed(self._params_temp):
-                i, s = divmod(int(i), len(l))
-                p.insert(0, l[s])
-            final_grid.append(tuple(p))
+        codes = self._grid_codes(self.grid_index)
+
+        columns = []
+        for i, table in enumerate(self._tables):
+
+            # each permutation has its own sample of a distribution
+            if i in self._distributions:
+                column = np.arange(len(self.grid_index))
+            else:
+                column = codes[:, i]
+
+            dtype = np.min_scalar_type(max(len(table) - 1, 0))
+            columns.append(column.astype(dtype))
+
+        return columns
+
+    def _value_tables(self):
+
+        '''Returns the values of each parameter as an object array,
+        so that the values are returned as they are in params.'''
+
+        return [_object_array(l) for l in self._params_temp]
+
+    def _sample_distributions(self):
+
+        '''Samples the values of the distributions, one for
+        each permutation, with `random_method`.'''
+
+        from talos.reducers.sample_reducer import sample_reducer
+
+        n = len(self.grid_index)
+
+        for i, distribution in self._distributions.items():
+
+            u = np.zeros(0)
+
+            # numbers between 0 and 1 that are spread by random_method
+            if n > 0:
+                size = max(n, 10 ** 6)
+                u = sample_reducer(n, size, self.random_method)
+                u = (np.array(u) + np.random.random(n)) / size
+
+            values = distribution.sample(np.random.permutation(u))
+            self._tables[i] = _object_array(values.tolist())
+
+    def _distribution_values(self, col, rows):
+
+        '''Returns the sampled values of a distribution for rows.'''
+
+        return self._tables[col][self._columns[col][rows]]
+
+    def _sample_values(self, values):
+
+        '''Replaces the distributions in the values of a permutation
+        with a sample of each.'''
+
+        values = list(values)
+        for i, distribution in self._distributions.items():
+            values[i] = distribution.sample(np.random.random()).item()
+
+        return values
+
+    def _grid_codes(self, grid_indexes):
+
+        '''Returns the position of each parameter value on the grid
+        for many permutations at once, one column per parameter.'''
+
+        grid_indexes = np.array(grid_indexes, dtype='int64')
+        codes = np.empty((len(grid_indexes), len(self._params_temp)),
+                         dtype='int64')
+
+        for i in reversed(range(len(self._params_temp))):
+            grid_indexes, codes[:, i] = np.divmod(grid_indexes,
+                                                  len(self._params_temp[i]))
+
+        return codes
+
+    def _param_values(self, index):
+
+        '''Returns the parameter values for a permutation based
+        on its index on the full grid.'''
+
+        p = []
+        for l in reversed(self._params_temp):
+            index, s = divmod(int(index), len(l))
+            p.insert(0, l[s])
+
+        return tuple(p)
+
+    def _param_grid_index(self, round_parameters):
+
+        '''Returns the index on the full grid for the parameters
+        of a round. The reverse of grid_parameters().'''
+
+        index = 0
+        for i, (key, l) in enumerate(zip(self.param_keys, self._params_temp)):
+            if i not in self._distributions:
+                index = index * len(l) + l.index(round_parameters[key])
+
+        return index
+
+    def grid_parameters(self, index):
 
-        return np.array(final_grid, dtype='object')
+        '''Returns the parameters for a permutation based on its
+        index on the full grid (see `grid_index`) in the same format
+        as round_parameters().'''
+
+        values = self._sample_values(self._param_values(index))
+
+        return self._round_parameters_todict(values)
 
     def _check_time_limit(self):
 
@@ -148,28 +540,264 @@ class ParamSpace:
 
         return stop > datetime.now()
 
+    def __getstate__(self):
+
+        # locks can't be copied or pickled
+        state = self.__dict__.copy()
+        del state['_lock']
+
+        # the lookups of draw_grid_index() and the checked permutations
+        # of LazyParamSpace are created again when needed
+        for name in ['_grid_rows', '_order_rows', '_checked']:
+            if name in state:
+                state[name] = None
+
+        return state
+
+    def __setstate__(self, state):
+
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
     def round_parameters(self):
 
-        # permutations remain in index
-        if len(self.param_index) > 0:
+        with self._lock:
 
             # time limit has not been met yet
             if self._check_time_limit():
-                self.round_counter += 1
 
                 # get current index
-                index = self.param_index.pop(0)
+                index = self._next()
+
+                # permutations remain in index
+                if index is not None:
+                    self.round_counter += 1
 
-                # get the values based on the index
-                values = self.param_space[index]
-                round_parameters = self._round_parameters_todict(values)
+                    # get the values based on the index
+                    values = [table[column[index]] for table, column
+                              in zip(self._tables, self._columns)]
+                    round_parameters = self._round_parameters_todict(values)
 
-                # pass the parameters to Scan
-                return round_parameters
+                    # pass the parameters to Scan
+                    return round_parameters
 
         # the experiment is finished
         return False
 
+    def _next(self):
+
+        '''Returns the next row of param_space that is left and marks
+        it as drawn, or None if there are none left.'''
+
+        while len(self._priority) > 0:
+            index = self._priority.pop(0)
+            if self._active[index]:
+                self._active[index] = False
+                return index
+
+        while self._cursor < len(self._order):
+            index = int(self._order[self._cursor])
+            self._cursor += 1
+            if self._active[index]:
+                self._active[index] = False
+                return index
+
+        return None
+
+    def draw_grid_index(self, index):
+
+        '''Same as round_parameters(), but draws the permutation with the
+        grid index e.g. one that is claimed from a ParamQueue. Returns
+        False if it's not left e.g. it was removed by a reducer.'''
+
+        with self._lock:
+
+            # grid_index is not always sorted e.g. after restore()
+            if self._grid_rows is None:
+                self._grid_rows = _sorted_positions(self.grid_index)
+
+            rows = _find_positions(self._grid_rows, index)
+            rows = rows[self._active[rows]]
+
+            if len(rows) == 0:
+                return False
+
+            row = rows[0]
+            self._active[row] = False
+            self.round_counter += 1
+
+            values = [table[column[row]] for table, column
+                      in zip(self._tables, self._columns)]
+
+        return self._round_parameters_todict(values)
+
+    def replace_sample(self, grid_indexes):
+
+        '''Replaces the permutations sampled with round_limit or
+        fraction_limit with the grid indexes e.g. the ones a ParamQueue
+        was seeded with by another node.'''
+
+        with self._lock:
+            self.grid_index = grid_indexes
+            self.param_index = range(len(self.grid_index))
+
+    def prioritize(self, index):
+
+        '''Moves a permutation in param_index to the front, so that it
+        is the next one returned by round_parameters().'''
+
+        with self._lock:
+            self._priority = [i for i in self._priority if i != index]
+            self._priority.insert(0, index)
+
+    def remove_grid_index(self, grid_indexes):
+
+        '''Removes permutations based on their grid indexes
+        e.g. the ones that were already done before resuming.'''
+
+        drop = Counter(grid_indexes)
+
+        rows = []
+        for i in self.param_index:
+            if drop[self.grid_index[i]] > 0:
+                drop[self.grid_index[i]] -= 1
+                rows.append(i)
+
+        with self._lock:
+            self._active[rows] = False
+
+    def snapshot(self, in_flight=None):
+
+        '''Returns the remaining permutations in a compact form for
+        restore(). The grid indexes of rounds in flight are included.'''
+
+        if in_flight is None:
+            in_flight = []
+
+        remaining = self.grid_index[self.param_index]
+        in_flight = np.array(in_flight, dtype='int64')
+
+        return {'remaining': np.concatenate([remaining, in_flight]),
+                'round_counter': self.round_counter}
+
+    def restore(self, state):
+
+        '''Continues from a snapshot().'''
+
+        with self._lock:
+            self.grid_index = state['remaining']
+            self.param_index = range(len(self.grid_index))
+            self.round_counter = state['round_counter']
+
+    def save(self, path):
+
+        '''Saves the parameter space and the progress through it to a
+        folder, so that it can be opened with ParamSpace.load() e.g. to
+        continue where it was left, or in many processes at once. The
+        arrays are saved as .npy files which can be memory-mapped.
+
+        path | str | the folder, which is created if it does not exist
+
+        '''
+
+        import os
+        import pickle
+
+        from ..utils.exceptions import TalosParamsError
+
+        os.makedirs(path, exist_ok=True)
+
+        with self._lock:
+
+            state = self.__getstate__()
+            state['_class'] = type(self)
+            state['params'] = self._saved_params()
+            state['param_keys'] = list(self.param_keys)
+
+            # boolean_limit is already applied to the parameter space
+            if '_limits' not in state:
+                state['boolean_limit'] = None
+
+            # the arrays are saved separately so that they can be mapped
+            state['_arrays'] = []
+            for name, value in list(state.items()):
+                if isinstance(value, np.ndarray) and value.dtype != object:
+                    np.save(os.path.join(path, name + '.npy'), value)
+                    state['_arrays'].append(name)
+                    del state[name]
+
+            if '_columns' in state:
+                for i, column in enumerate(state['_columns']):
+                    np.save(os.path.join(path, '_columns_%d.npy' % i), column)
+                state['_columns'] = len(state['_columns'])
+
+            try:
+                with open(os.path.join(path, 'state.pkl'), 'wb') as f:
+                    pickle.dump(state, f)
+            except (pickle.PicklingError, AttributeError, TypeError) as e:
+                raise TalosParamsError('the parameter space can not be '
+                                       'saved: %s' % e)
+
+    @staticmethod
+    def load(path, mmap=True):
+
+        '''Opens a parameter space saved with save(). With `mmap` the
+        arrays are memory-mapped instead of read into memory, so that
+        the permutations are shared between processes that open the same
+        parameter space. The arrays are copy-on-write, so the rounds
+        drawn in one process are not seen by others or saved to the files.
+
+        path | str | the folder given to save()
+        mmap | bool | memory-map the arrays
+
+        '''
+
+        import os
+        import pickle
+
+        with open(os.path.join(path, 'state.pkl'), 'rb') as f:
+            state = pickle.load(f)
+
+        mmap_mode = 'c' if mmap else None
+
+        for name in state.pop('_arrays'):
+            state[name] = np.load(os.path.join(path, name + '.npy'),
+                                  mmap_mode=mmap_mode)
+
+        if '_columns' in state:
+            state['_columns'] = [np.load(os.path.join(path, '_columns_%d.npy'
+                                                      % i),
+                                         mmap_mode=mmap_mode)
+                                 for i in range(state['_columns'])]
+
+        # e.g. LazyParamSpace
+        space_class = state.pop('_class')
+
+        param_object = space_class.__new__(space_class)
+        param_object.__setstate__(state)
+
+        return param_object
+
+    def _saved_params(self):
+
+        '''Returns params where the conditions of conditional parameters
+        are lists of values, as functions may not be saved.'''
+
+        from .Conditional import Conditional
+
+        out = dict(self.params)
+
+        for i, conditions in self._conditions.items():
+            key = self.param_keys[i]
+            when = {}
+            for col, mask in conditions:
+                values = self._params_temp[col]
+                when[self.param_keys[col]] = [values[j]
+                                              for j in np.flatnonzero(mask)]
+            out[key] = Conditional(out[key].values, when, out[key].default)
+
+        return out
+
     def _round_parameters_todict(self, values):
 
         round_parameters = {}
@@ -181,64 +809,186 @@ class ParamSpace:
 
     def _convert_lambda(self, fn):
 
-        '''Converts a lambda function into a format
-        where parameter labels are changed to the column
-        indexes in parameter space.'''
+        '''Converts a lambda function into a function that
+        takes the parameter space and returns a boolean array
+        with True for the permutations that are accepted.'''
+
+        from .BooleanLimit import BooleanLimit
+
+        return BooleanLimit(fn, self.param_keys)
+
+    def canonicalize(self, rules):
+
+        '''Keeps only one of the permutations that are the same once the
+        parameters that have no effect are ignored, and removes the rest.
+        The removed ones are returned by equivalent_parameters() for the
+        one that is kept, so that its results can be copied to them.
+
+        rules | dict | parameter labels with a lambda function that is
+                       True for the permutations where the parameter
+                       has no effect e.g. {'shapes': lambda p:
+                       p['hidden_layers'] == 0}
+
+        '''
+
+        from ..utils.exceptions import TalosParamsError
+
+        codes = [np.array(column, dtype='int64') for column in self._columns]
+
+        # distributions are sampled for each round, and not compared
+        for i in self._distributions:
+            codes[i][:] = 0
+
+        for label, rule in rules.items():
+
+            if label not in self.param_keys:
+                raise TalosParamsError('%s is not in params.' % label)
+
+            col = self.param_keys.index(label)
+            if col in self._distributions:
+                raise TalosParamsError('%s is a distribution.' % label)
+
+            # the first value stands for all the values
+            no_effect = self._convert_lambda(rule)(self._columns, self._tables)
+            codes[col][no_effect] = 0
+
+        key = np.zeros(len(self.grid_index), dtype='int64')
+        for code, l in zip(codes, self._params_temp):
+            key = key * len(l) + code
+
+        # the first one to be drawn is kept
+        rows = self.param_index
+        _, first, group = np.unique(key[rows],
+                                    return_index=True,
+                                    return_inverse=True)
+
+        removed = np.ones(len(rows), dtype=bool)
+        removed[first] = False
+
+        # the grid indexes of the removed ones by the one that is kept
+        kept = self.grid_index[rows[first[group[removed]]]]
+        members = self.grid_index[rows[removed]]
+
+        order = np.argsort(kept, kind='stable')
+        kept, members = kept[order], members[order]
+        starts = np.flatnonzero(np.r_[True, kept[1:] != kept[:-1]])
+        starts = starts[starts < len(kept)]
+
+        for index, group_members in zip(kept[starts].tolist(),
+                                        np.split(members, starts[1:])):
+            self._equivalents.setdefault(index, []).extend(
+                group_members.tolist())
+
+        with self._lock:
+            self._active[rows[removed]] = False
+
+    def equivalent_parameters(self, round_parameters):
 
-        # get the source code for the lambda function
-        fn_string = inspect.getsource(fn)
-        fn_string = fn_string.replace('"', '\'')
+        '''Returns the parameters of the permutations that canonicalize()
+        removed as the same as the one of the round, each only once.'''
 
-        # look for column/label names
-        for i, name in enumerate(self.param_keys):
-            index = ':,' + str(i)
-            fn_string = fn_string.replace(name, index)
+        if len(self._equivalents) == 0:
+            return []
 
-        # cleanup the string
-        fn_string = fn_string.split('lambda')[1]
-        fn_string = fn_string.replace('[\':', '[:')
-        fn_string = fn_string.replace('\']', ']')
-        fn_string = 'lambda ' + fn_string
+        # e.g. epochs set by a scheduler
+        try:
+            index = self._param_grid_index(round_parameters)
+        except ValueError:
+            return []
 
-        # pass it back as a function
-        return eval(fn_string)
+        out = []
+        for member in self._equivalents.pop(index, []):
+
+            # the same samples of the distributions as the round
+            values = list(self._param_values(member))
+            for i in self._distributions:
+                values[i] = round_parameters[self.param_keys[i]]
+
+            out.append(self._round_parameters_todict(values))
+
+        return out
 
     def remove_is_not(self, label, value):
 
         '''Removes baesd on exact match but reversed'''
 
-        col = self.param_keys.index(label)
-        drop = np.where(self.param_space[:, col] != value)[0].tolist()
-        self.param_index = [x for x in self.param_index if x not in drop]
+        self._remove(label, lambda x: x != value)
 
     def remove_is(self, label, value):
 
         '''Removes based on exact match'''
 
-        col = self.param_keys.index(label)
-        drop = np.where(self.param_space[:, col] == value)[0].tolist()
-        self.param_index = [x for x in self.param_index if x not in drop]
+        self._remove(label, lambda x: x == value)
 
     def remove_ge(self, label, value):
 
         '''Removes based on greater-or-equal'''
 
-        col = self.param_keys.index(label)
-        drop = np.where(self.param_space[:, col] >= value)[0].tolist()
-        self.param_index = [x for x in self.param_index if x not in drop]
+        self._remove(label, lambda x: x >= value)
 
     def remove_le(self, label, value):
 
         '''Removes based on lesser-or-equal'''
 
-        col = self.param_keys.index(label)
-        drop = np.where(self.param_space[:, col] <= value)[0].tolist()
-        self.param_index = [x for x in self.param_index if x not in drop]
+        self._remove(label, lambda x: x <= value)
+
+    def remove_many(self, label, values):
+
+        '''Removes based on exact match with any of the values
+        in one pass e.g. many reductions of the same parameter.'''
+
+        self._remove(label, lambda x: any(x == value for value in values))
 
     def remove_lambda(self, function):
 
         '''Removes based on a lambda function'''
 
-        index = self._convert_lambda(function)(self.param_space)
-        self.param_space = self.param_space[index]
-        self.param_index = list(range(len(self.param_space)))
+        index = self._convert_lambda(function)(self._columns, self._tables)
+
+        with self._lock:
+            self._active &= np.array(index, dtype=bool)
+
+    def _remove(self, label, condition):
+
+        '''Removes the permutations where the condition is True for
+        the value of the parameter. The condition is checked once for
+        each value in params, and mapped to the rows with the column.'''
+
+        col = self.param_keys.index(label)
+        values = self._tables[col]
+        drop = np.array([bool(condition(x)) for x in values], dtype=bool)
+
+        with self._lock:
+            self._active &= ~drop[self._columns[col]]
+
+
+def _sorted_positions(values):
+
+    '''Returns the values sorted and their positions, for
+    _find_positions().'''
+
+    positions = np.argsort(values, kind='stable')
+
+    return np.asarray(values)[positions], positions
+
+
+def _find_positions(sorted_positions, value):
+
+    '''Returns the positions of the value in O(log n)
+    from the output of _sorted_positions().'''
+
+    values, positions = sorted_positions
+    start, end = np.searchsorted(values, [value, value + 1])
+
+    return positions[start:end]
+
+
+def _object_array(values):
+
+    '''Returns the values as a 1d object array as they are.'''
+
+    out = np.empty(len(values), dtype='object')
+    for i, value in enumerate(values):
+        out[i] = value
+
+    return out
@@ -0,0 +1,108 @@
+class RoundParams(dict):
+
+    def __init__(self, params, round_history, warm_start=None,
+                 history_limit=None, run_id=None, round=None):
+
+        '''The parameters of a round as they are passed to the model
+        function. Works in the same way as a dictionary, and in addition
+        gives access to the epoch level history of the earlier rounds of
+        the experiment (see talos.callbacks.MedianStopping), and to the
+        weights of earlier rounds for warm starting (see `warm_start()`).
+
+        params | dict | the parameters of the round
+        round_history | list | the history dictionaries of earlier rounds
+        warm_start | list | the (model json, weights) of earlier rounds
+        history_limit | int or None | only the latest rounds of the history
+        run_id | int or None | the run in Scan(results_store)
+        round | int or None | the round in the results store
+
+        NOTE: the history is not copied until `round_history` is used, and
+        only the latest `history_limit` rounds are sent along when the
+        round is run in a worker process.
+
+        '''
+
+        dict.__init__(self, params)
+
+        # the rounds that were finished when the round started
+        self._history = round_history
+        self._rounds = len(round_history)
+        self._history_limit = history_limit
+
+        # the closest finished rounds first
+        self._warm_start = warm_start or []
+
+        # the epochs are stored by these (see ExperimentLog)
+        self.run_id = run_id
+        self.round = round
+
+    @property
+    def round_history(self):
+
+        '''The history dictionaries of the earlier rounds.'''
+
+        start = 0
+        if self._history_limit is not None:
+            start = max(0, self._rounds - self._history_limit)
+
+        return self._history[start:self._rounds]
+
+    def __getstate__(self):
+
+        # only the rounds that are used are pickled
+        state = self.__dict__.copy()
+        state['_history'] = self.round_history
+        state['_rounds'] = len(state['_history'])
+
+        return state
+
+    def warm_start(self, model):
+
+        '''Sets the weights of the closest finished round that has the
+        same architecture as `model`, when Scan(warm_start=True). The
+        architecture is compared based on the model json without layer
+        names, and the shapes of the weights. Call it once the model is
+        built and before fitting. Returns True if weights were set.
+
+        model | keras model | the model of the round
+
+        '''
+
+        import numpy as np
+
+        architecture = _architecture(model.to_json())
+        shapes = [np.shape(w) for w in model.get_weights()]
+
+        for model_json, weights in self._warm_start:
+
+            if [np.shape(w) for w in weights] != shapes:
+                continue
+
+            if _architecture(model_json) != architecture:
+                continue
+
+            model.set_weights(weights)
+
+            return True
+
+        return False
+
+
+def _architecture(model_json):
+
+    '''Returns the model json without the names, which are
+    different for each model even when the architecture is the same.'''
+
+    import json
+
+    def strip(config):
+
+        if isinstance(config, dict):
+            return {k: strip(v) for k, v in config.items() if k != 'name'}
+
+        if isinstance(config, list):
+            return [strip(v) for v in config]
+
+        return config
+
+    return strip(json.loads(model_json))
@@ -0,0 +1,7 @@
+# rules for Scan(canonical_rules=...) that are True for the permutations
+# where the parameter has no effect on the model
+
+
+# the parameters of talos.utils.hidden_layers() e.g. every value of
+# shapes builds the same model when there are no hidden layers
+hidden_layers = {'shapes': lambda p: p['hidden_layers'] == 0}
@@ -0,0 +1,88 @@
+import numpy as np
+
+
+class Uniform:
+
+    def __init__(self, low, high):
+
+        '''A continuous parameter with values between low and high.
+        Used as a value in the params dictionary instead of a list,
+        in which case a value is sampled for each round instead of
+        adding the values to the grid of permutations.
+
+        low | float | the smallest value
+        high | float | the largest value
+
+        '''
+
+        from ..utils.exceptions import TalosParamsError
+
+        if low >= high:
+            raise TalosParamsError('low has to be smaller than high.')
+
+        self.low = low
+        self.high = high
+
+    def sample(self, u):
+
+        '''Returns the values for numbers between 0 and 1.'''
+
+        return self.low + np.asarray(u) * (self.high - self.low)
+
+    def cdf(self, value):
+
+        '''Returns the position of a value between 0 and 1.'''
+
+        return (value - self.low) / (self.high - self.low)
+
+    def __repr__(self):
+
+        return '%s(%s, %s)' % (type(self).__name__, self.low, self.high)
+
+
+class LogUniform(Uniform):
+
+    '''A continuous parameter with values between low and high where
+    each order of magnitude is equally likely e.g. learning rate.'''
+
+    def __init__(self, low, high):
+
+        from ..utils.exceptions import TalosParamsError
+
+        if low <= 0:
+            raise TalosParamsError('low has to be larger than 0.')
+
+        super().__init__(low, high)
+
+    def sample(self, u):
+
+        low, high = np.log(self.low), np.log(self.high)
+
+        return np.exp(low + np.asarray(u) * (high - low))
+
+    def cdf(self, value):
+
+        low, high = np.log(self.low), np.log(self.high)
+
+        return (np.log(value) - low) / (high - low)
+
+
+class IntLogUniform(LogUniform):
+
+    '''An integer parameter with values from low to high (inclusive)
+    where each order of magnitude is equally likely e.g. neurons.'''
+
+    def sample(self, u):
+
+        values = LogUniform(self.low, self.high + 1).sample(u)
+
+        return np.minimum(np.floor(values), self.high).astype(int)
+
+    def cdf(self, value):
+
+        return LogUniform(self.low, self.high + 1).cdf(value)
+
+
+def is_distribution(value):
+
+    return isinstance(value, Uniform)
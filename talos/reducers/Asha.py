@@ -0,0 +1,103 @@
+from .Hyperband import Hyperband
+
+
+class Asha(Hyperband):
+
+    def __init__(self, scan_object):
+
+        '''Asynchronous successive halving (ASHA) promotes permutations
+        as soon as each round is reported, instead of waiting for a rung to
+        finish as Hyperband does. This way there are no idle workers when
+        rounds run in parallel.
+
+        Whenever a new round is asked for, the best permutation of the
+        highest rung that is in the top 1/`reduction_factor` of its rung,
+        and not yet promoted, is trained again for `reduction_factor` times
+        more epochs. If there is none, a new permutation is drawn from the
+        parameter space for the smallest value of `epochs` in params.
+
+        A permutation is compared to others of its rung by the value of
+        `reduction_metric` at the epochs of the rung, as stored in
+        `round_history`, so that early stopped rounds are compared fairly.
+
+        '''
+
+        Hyperband.__init__(self, scan_object)
+
+        # the results, and the promoted permutations, of each rung
+        self._rung_results = [[] for _ in range(self.s_max + 1)]
+        self._promoted = [set() for _ in range(self.s_max + 1)]
+
+        # with a single bracket the epochs of a rung are as in Hyperband
+        self._bracket = self.s_max
+
+    def next_round(self):
+
+        '''Returns the parameters for the next round, None if there
+        is nothing to do before the rounds in flight are reported, or
+        False when the experiment is finished.'''
+
+        if self.finished or self.param_object._check_time_limit() is False:
+            return False
+
+        # promote from the highest rung first
+        for rung in reversed(range(self.s_max)):
+            round_params = self._promotable(rung)
+            if round_params is not None:
+                return self._start(round_params, rung + 1)
+
+        # otherwise start a new permutation on the lowest rung
+        new = self._draw(1)
+        if len(new) > 0:
+            return self._start(new[0], 0)
+
+        # a round in flight may still make a promotion possible
+        if len(self._in_flight) > 0:
+            return None
+
+        return False
+
+    def report(self, round_params, history):
+
+        '''Records the result of a finished round on its rung.'''
+
+        out = self._in_flight.pop(self.key(round_params), None)
+
+        if out is None:
+            return
+
+        rung, round_params = out
+
+        # the value at the epochs of the rung (or the last epoch)
+        values = history[self.scan_object.reduction_metric]
+        value = values[min(self._rung_epochs(rung), len(values)) - 1]
+
+        self._rung_results[rung].append((value, round_params))
+
+    def _start(self, round_params, rung):
+
+        round_params = dict(round_params)
+        round_params['epochs'] = self._rung_epochs(rung)
+        self._in_flight[self.key(round_params)] = (rung, round_params)
+
+        return round_params
+
+    def _promotable(self, rung):
+
+        '''Returns the best permutation in the top 1/reduction_factor
+        of the rung that is not yet promoted, or None.'''
+
+        results = self._rung_results[rung]
+        keep = int(len(results) / self.eta)
+
+        top = sorted(results,
+                     key=lambda x: x[0],
+                     reverse=self.scan_object.minimize_loss is False)
+
+        for _, round_params in top[:keep]:
+            key = self.key(round_params)
+            if key not in self._promoted[rung]:
+                self._promoted[rung].add(key)
+                return round_params
+
+        return None
@@ -0,0 +1,220 @@
+import bisect
+from collections import Counter
+
+import numpy as np
+
+
+class CorrelationStats:
+
+    def __init__(self, results_buffer, metric, window):
+
+        '''Keeps the statistics that the pearson, spearman and kendall
+        correlations of each parameter value with the metric are computed
+        from, for the latest `window` rounds. Each round is added once
+        (and removed once when it leaves the window), so the correlations
+        cost the same however often they are asked for.
+
+        For each parameter value, the statistics are the number of rounds
+        with the value, the sum of their metric, the sum of their ranks of
+        the metric (spearman) and the concordant minus discordant pairs
+        with the other rounds (kendall). The metric of the rounds with each
+        value is kept sorted, so that adding or removing a round is
+        O(V log n) for the V parameter values in the window: a round
+        changes the ranks and pairs of the rounds with every value, not
+        only of the values of the round. The count and sum (pearson) only
+        change for the values of the round. The new rounds are added when
+        the correlations are asked for, that is when a reduction runs.
+
+        results_buffer | ResultsBuffer | the results of the experiment
+        metric | str | the metric to correlate with
+        window | int | the number of latest rounds
+
+        '''
+
+        self.results_buffer = results_buffer
+        self.metric = results_buffer.metric_keys.index(metric)
+        self.window = window
+
+        # a column for each value of the parameters that are not
+        # distributions, as in ResultsBuffer.design_matrix()
+        self._params = [i for i in range(len(results_buffer.param_keys))
+                        if i not in results_buffer._distributions]
+
+        self._offsets = {}
+        self._values = []
+        for i in self._params:
+            self._offsets[i] = len(self._values)
+            self._values += [(results_buffer.param_keys[i], value)
+                             for value in results_buffer._values[i]]
+
+        size = len(self._values)
+
+        self._count = np.zeros(size)
+        self._sum = np.zeros(size)
+        self._below = np.zeros(size)
+        self._ties = np.zeros(size)
+        self._order = np.zeros(size)
+        self._sorted = [[] for i in range(size)]
+
+        # the metric of all the rounds in the window
+        self._all = []
+        self._n = 0
+        self._shift = None
+        self._sum_y = 0.0
+        self._sum_y2 = 0.0
+        self._tie_counts = Counter()
+        self._tie_pairs = 0
+        self._tie_cubes = 0
+
+        # the rounds of results_buffer that are added so far
+        self._rows = 0
+
+    def update(self):
+
+        '''Adds the rounds that are new in results_buffer, and
+        removes the ones that are no longer in the window.'''
+
+        codes = self.results_buffer._codes
+        metrics = self.results_buffer._metrics
+
+        rows = len(self.results_buffer)
+        start = max(0, rows - self.window)
+
+        for row in range(max(0, self._rows - self.window),
+                         min(self._rows, start)):
+            self._update(codes[row], metrics[row, self.metric], -1)
+
+        for row in range(max(self._rows, start), rows):
+            self._update(codes[row], metrics[row, self.metric], 1)
+
+        self._rows = rows
+
+    def correlations(self, method):
+
+        '''Returns the correlation of each parameter value in the window
+        with the metric, and the parameter label and value of each.'''
+
+        import pandas as pd
+
+        self.update()
+
+        present = np.flatnonzero(self._count > 0)
+        values = [self._values[j] for j in present]
+
+        n = self._n
+        count = self._count[present]
+
+        # the metric has no variance
+        if n < 2 or len(self._tie_counts) < 2:
+            return pd.Series(np.nan, index=range(len(present))), values
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+
+            if method == 'kendall':
+                pairs = n * (n - 1) / 2
+                x_ties = (count * (count - 1)
+                          + (n - count) * (n - count - 1)) / 2
+                y_ties = self._tie_pairs
+                out = self._order[present] / np.sqrt((pairs - x_ties)
+                                                     * (pairs - y_ties))
+
+            else:
+                share = count / n
+
+                if method == 'spearman':
+                    mean = (n + 1) / 2
+                    variance = ((n + 1) * (2 * n + 1) / 6
+                                - self._tie_cubes / 12 / n - mean ** 2)
+                    sums = (self._below[present] + self._ties[present] / 2
+                            + count)
+                else:
+                    mean = self._sum_y / n
+                    variance = self._sum_y2 / n - mean ** 2
+                    sums = self._sum[present] - count * self._shift
+
+                covariance = sums / n - share * mean
+                out = covariance / np.sqrt(share * (1 - share) * variance)
+
+        # a value in all or none of the rounds has no variance, but round-off
+        # can leave a covariance (and a correlation of +-inf) for it
+        out[(count == n) | (count == 0)] = np.nan
+
+        return pd.Series(out, index=range(len(present))), values
+
+    def _update(self, codes, y, sign):
+
+        '''Adds (sign 1) or removes (sign -1) a round.'''
+
+        if np.isnan(y):
+            return
+
+        y = float(y)
+        if self._shift is None:
+            self._shift = y
+
+        columns = set([self._offsets[i] + int(codes[i])
+                       for i in self._params if codes[i] >= 0])
+
+        if sign < 0:
+            self._remove_sorted(self._all, y)
+            for j in columns:
+                self._remove_sorted(self._sorted[j], y)
+
+        # the other rounds below, at and above the metric
+        below = bisect.bisect_left(self._all, y)
+        above = len(self._all) - bisect.bisect_right(self._all, y)
+        equal = len(self._all) - below - above
+
+        for j, members in enumerate(self._sorted):
+
+            if j not in columns and len(members) == 0:
+                continue
+
+            low = bisect.bisect_left(members, y)
+            high = bisect.bisect_right(members, y)
+            members_above = len(members) - high
+
+            # pairs of the rounds with the value and this round
+            below_j = members_above
+            ties_j = high - low
+            order_j = members_above - low
+
+            # pairs of this round with all, and the rounds without the value
+            if j in columns:
+                below_j += below
+                ties_j += equal
+                order_j = (below - low) - (above - members_above)
+
+            self._below[j] += sign * below_j
+            self._ties[j] += sign * ties_j
+            self._order[j] += sign * order_j
+
+        for j in columns:
+            self._count[j] += sign
+            self._sum[j] += sign * y
+
+        ties = self._tie_counts[y]
+        if sign > 0:
+            self._tie_pairs += ties
+            self._tie_cubes += 3 * ties ** 2 + 3 * ties
+            self._tie_counts[y] += 1
+        else:
+            ties -= 1
+            self._tie_pairs -= ties
+            self._tie_cubes -= 3 * ties ** 2 + 3 * ties
+            self._tie_counts[y] -= 1
+            if self._tie_counts[y] == 0:
+                del self._tie_counts[y]
+
+        self._n += sign
+        self._sum_y += sign * (y - self._shift)
+        self._sum_y2 += sign * (y - self._shift) ** 2
+
+        if sign > 0:
+            bisect.insort(self._all, y)
+            for j in columns:
+                bisect.insort(self._sorted[j], y)
+
+    def _remove_sorted(self, members, y):
+
+        del members[bisect.bisect_left(members, y)]
@@ -20,15 +20,22 @@ class GamifyMap:
 
     def run_updates(self):
 
+        # collect the values to remove for each parameter
+        drop = {}
+
         for key in self.gamify_dict.keys():
             for val in self.gamify_dict[key].keys():
                 if self.gamify_dict[key][val] != self.updated_dict[key][val]:
 
                     label = list(self.params.keys())[int(key)]
-                    value = self.params[label][int(val)]
+                    value = _values(self.params[label])[int(val)]
 
                     self.gamify_dict[key][val] = self.updated_dict[key][val]
-                    self.scan_object.param_object.remove_is(label, value)
+                    drop.setdefault(label, []).append(value)
+
+        # remove them with one pass over the parameter space per parameter
+        for label, values in drop.items():
+            self.scan_object.param_object.remove_many(label, values)
 
         return self.scan_object
 
@@ -49,7 +56,7 @@ class GamifyMap:
 
         for i, key in enumerate(self.params.keys()):
             param_vals = {}
-            for ii, val in enumerate(self.params[key]):
+            for ii, val in enumerate(_values(self.params[key])):
                 param_vals[str(ii)] = [key, val]
             gamify_dict_map[str(i)] = param_vals
 
@@ -68,7 +75,7 @@ class GamifyMap:
 
         for i, key in enumerate(self.params.keys()):
             param_vals = {}
-            for ii, val in enumerate(self.params[key]):
+            for ii, val in enumerate(_values(self.params[key])):
                 param_vals[str(ii)] = ['active', 0, str(key), str(val)]
             gamify_dict[str(i)] = param_vals
 
@@ -89,3 +96,20 @@ class GamifyMap:
             out = json.load(fp)
 
         self.updated_dict = out
+
+
+def _values(values):
+
+    '''Distributions have no values to turn on and off, and conditional
+    parameters have the values they take when they are used.'''
+
+    from ..parameters.distributions import is_distribution
+    from ..parameters.Conditional import is_conditional
+
+    if is_distribution(values):
+        return []
+
+    if is_conditional(values):
+        return values.values
+
+    return values
@@ -0,0 +1,173 @@
+import math
+
+
+class Hyperband:
+
+    def __init__(self, scan_object):
+
+        '''Hyperband schedules the rounds of the experiment in brackets
+        of successive halving. Each bracket draws permutations from the
+        parameter space, trains them for a small number of epochs, and
+        promotes the best 1/`reduction_factor` of them to a larger number
+        of epochs until the largest value of `epochs` in params is reached.
+
+        Each bracket starts from a different number of epochs, from the
+        smallest value of `epochs` in params upwards, and the brackets are
+        repeated until the parameter space is exhausted. Every training of
+        a permutation is a round of its own in the experiment log, with
+        `epochs` set to the epochs of the rung.
+
+        The permutations are ranked by the last epoch of `reduction_metric`
+        and `minimize_loss` tells if lower is better.
+
+        '''
+
+        from ..utils.exceptions import TalosParamsError
+
+        self.scan_object = scan_object
+        self.param_object = scan_object.param_object
+
+        if 'epochs' not in self.param_object.param_keys:
+            raise TalosParamsError("%s requires 'epochs' in params."
+                                   % scan_object.reduction_method)
+
+        col = self.param_object.param_keys.index('epochs')
+        epochs = self.param_object._params_temp[col]
+
+        self.eta = scan_object.reduction_factor
+        self.min_epochs = min(epochs)
+        self.max_epochs = max(epochs)
+
+        # the number of brackets is based on the range of epochs
+        ratio = self.max_epochs / self.min_epochs
+        self.s_max = int(math.log(ratio, self.eta) + 1e-9)
+        self._bracket = self.s_max + 1
+
+        # the state of the current rung
+        self._pending = []
+        self._results = []
+        self._in_flight = {}
+        self._rung = 0
+        self._rungs = 0
+        self._epochs = None
+
+        # permutations that differ only by epochs are the same here
+        self._seen = set()
+
+        # where new permutations come from (see scan_distribute)
+        self.draw = self.param_object.round_parameters
+
+        self.finished = False
+
+    def next_round(self):
+
+        '''Returns the parameters for the next round, None if the
+        rung can't be promoted before the rounds in flight are reported,
+        or False when the experiment is finished.'''
+
+        if self.finished or self.param_object._check_time_limit() is False:
+            return False
+
+        while True:
+
+            # rounds of the current rung are left
+            if len(self._pending) > 0:
+
+                round_params = dict(self._pending.pop(0))
+                round_params['epochs'] = self._epochs
+                self._in_flight[self.key(round_params)] = round_params
+
+                return round_params
+
+            # wait for the rest of the rung
+            if len(self._in_flight) > 0:
+                return None
+
+            # promote to the next rung or start a new bracket
+            if self._promote() is False and self._new_bracket() is False:
+                return False
+
+    def report(self, round_params, history):
+
+        '''Records the result of a finished round.'''
+
+        round_params = self._in_flight.pop(self.key(round_params), None)
+
+        if round_params is None:
+            return
+
+        value = history[self.scan_object.reduction_metric][-1]
+        self._results.append((value, round_params))
+
+    def stop(self):
+
+        '''Ends the experiment e.g. once performance target is met.'''
+
+        self.finished = True
+
+    def key(self, round_params):
+
+        '''Returns what identifies a permutation regardless of epochs.'''
+
+        return tuple([str(v) for k, v in round_params.items()
+                      if k != 'epochs'])
+
+    def _promote(self):
+
+        if self._rung >= self._rungs or len(self._results) == 0:
+            return False
+
+        # keep the best of the rung
+        keep = max(1, int(len(self._results) / self.eta))
+        self._results.sort(key=lambda x: x[0],
+                           reverse=self.scan_object.minimize_loss is False)
+
+        self._pending = [params for _, params in self._results[:keep]]
+        self._results = []
+        self._rung += 1
+        self._epochs = self._rung_epochs(self._rung)
+
+        return True
+
+    def _new_bracket(self):
+
+        # cycle through the brackets from the most explorative
+        self._bracket = self._bracket - 1 if self._bracket > 0 else self.s_max
+
+        s = self._bracket
+        n = int(math.ceil((self.s_max + 1) / (s + 1) * self.eta ** s))
+
+        self._pending = self._draw(n)
+        self._results = []
+        self._rung = 0
+        self._rungs = s
+        self._epochs = self._rung_epochs(self._rung)
+
+        return len(self._pending) > 0
+
+    def _rung_epochs(self, rung):
+
+        epochs = self.max_epochs * self.eta ** (rung - self._bracket)
+
+        return max(self.min_epochs, int(round(epochs)))
+
+    def _draw(self, n):
+
+        '''Draws up to n new permutations from the parameter space.'''
+
+        out = []
+
+        while len(out) < n:
+
+            round_params = self.draw()
+
+            if round_params is False:
+                break
+
+            key = self.key(round_params)
+
+            if key not in self._seen:
+                self._seen.add(key)
+                out.append(round_params)
+
+        return out
@@ -0,0 +1,114 @@
+import numpy as np
+
+
+class RandomPermutation:
+
+    # the number of feistel rounds
+    rounds = 6
+
+    def __init__(self, max_value, n=None, random_method='uniform_mersenne'):
+
+        '''A random order of the numbers from 0 to max_value - 1 where
+        each number is computed from its position only when it's needed,
+        so memory does not grow with max_value or n. The order is a keyed
+        feistel network over the smallest even number of bits that fits
+        max_value, and numbers past max_value are encrypted again until
+        they fit (cycle walking), so each number appears exactly once.
+
+        max_value | int | the numbers are from 0 to max_value - 1
+        n | int or None | the number of positions, max_value if None
+        random_method | str | keys are from `secrets` for uniform_crypto,
+                              otherwise from numpy's random state
+
+        '''
+
+        self.max_value = int(max_value)
+        self.n = self.max_value if n is None else int(n)
+
+        bits = max(2, int(self.max_value - 1).bit_length())
+        self._half = (bits + 1) // 2
+        self._mask = np.uint64((1 << self._half) - 1)
+
+        if random_method == 'uniform_crypto':
+            import secrets
+            keys = [secrets.randbits(64) for i in range(self.rounds)]
+        else:
+            keys = [int(np.random.randint(2 ** 32)) << 32
+                    | int(np.random.randint(2 ** 32))
+                    for i in range(self.rounds)]
+
+        self._keys = np.array(keys, dtype='uint64')
+
+    def __len__(self):
+
+        return self.n
+
+    def __getitem__(self, position):
+
+        if isinstance(position, slice):
+            return self._permute(np.arange(*position.indices(self.n)))
+
+        if isinstance(position, (list, np.ndarray)):
+            position = np.asarray(position, dtype='int64')
+            position = np.where(position < 0, position + self.n, position)
+            if ((position < 0) | (position >= self.n)).any():
+                raise IndexError('position out of range')
+            return self._permute(position)
+
+        position = int(position)
+        if position < 0:
+            position += self.n
+        if position < 0 or position >= self.n:
+            raise IndexError('position out of range')
+
+        return int(self._permute(np.array([position]))[0])
+
+    def __iter__(self):
+
+        # in chunks, so that each number is not computed on its own
+        for start in range(0, self.n, 10000):
+            yield from self[start:start + 10000].tolist()
+
+    def __array__(self, dtype=None, copy=None):
+
+        return self[:].astype(dtype or 'int64')
+
+    def _permute(self, positions):
+
+        '''Returns the numbers at positions, as an int64 array.'''
+
+        out = self._encrypt(positions.astype('uint64'))
+
+        # walk the numbers that are past max_value until they fit
+        over = out >= self.max_value
+        while over.any():
+            out[over] = self._encrypt(out[over])
+            over = out >= self.max_value
+
+        return out.astype('int64')
+
+    def _encrypt(self, x):
+
+        half = np.uint64(self._half)
+        left = x >> half
+        right = x & self._mask
+
+        for key in self._keys:
+            left, right = right, left ^ (_mix(right ^ key) & self._mask)
+
+        return (left << half) | right
+
+
+def _mix(x):
+
+    '''A 64 bit hash (splitmix64 finalizer) that spreads
+    every bit of x over all the bits of the output.'''
+
+    x = x * np.uint64(0x9E3779B97F4A7C15)
+    x ^= x >> np.uint64(30)
+    x *= np.uint64(0xBF58476D1CE4E5B9)
+    x ^= x >> np.uint64(27)
+    x *= np.uint64(0x94D049BB133111EB)
+    x ^= x >> np.uint64(31)
+
+    return x
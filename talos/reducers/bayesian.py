@@ -0,0 +1,146 @@
+def bayesian(self, max_candidates=2000, max_observations=500):
+
+    '''Gaussian process based strategy. Instead of removing values from
+    the parameter space, fits a gaussian process on the results so far
+    and picks the remaining permutation with the highest expected
+    improvement in `reduction_metric` to be the next round.
+
+    The permutations are encoded as the positions of their values in
+    params, scaled to 0-1, so that the order of the values in params
+    is the order seen by the gaussian process. To keep each suggestion
+    cheap compared to a round, the gaussian process is fitted on the
+    latest `max_observations` rounds, and a random sample of at most
+    `max_candidates` remaining permutations is considered.
+
+    '''
+
+    import numpy as np
+
+    param_object = self.param_object
+
+    # random rounds first before the gaussian process can be of use
+    if len(self.result) - 1 < self.reduction_window:
+        return self
+
+    if len(param_object.param_index) < 2:
+        return self
+
+    x, y = _observations(self, max_observations)
+
+    if len(y) < 2:
+        return self
+
+    # a random sample of the remaining permutations
+    remaining = param_object.param_index
+    positions = range(len(remaining))
+    if len(remaining) > max_candidates:
+        rng = np.random.default_rng(np.random.randint(2 ** 31))
+        positions = rng.choice(len(remaining), max_candidates, replace=False)
+
+    candidates = np.array([remaining[int(i)] for i in positions])
+    x_candidates = _encode(param_object, candidates)
+
+    ei = _expected_improvement(x, y, x_candidates, self.minimize_loss)
+
+    # this is where we modify the parameter space accordingly
+    param_object.prioritize(int(candidates[np.argmax(ei)]))
+
+    return self
+
+
+def _observations(self, max_observations):
+
+    '''Returns the encoded parameters and the reduction_metric of the
+    latest rounds from the results.'''
+
+    import numpy as np
+
+    param_object = self.param_object
+    header = self.result[0]
+    rows = self.result[1:][-max_observations:]
+
+    col = header.index(self.reduction_metric)
+    no_of_params = len(param_object.param_keys)
+
+    # positions of the values in params (as written in the log)
+    lookup = [{str(v): i for i, v in enumerate(values)}
+              for values in param_object._params_temp]
+
+    # distributions are placed by their cdf
+    for i in param_object._distributions:
+        lookup[i] = param_object._distributions[i]
+
+    x = []
+    y = []
+
+    for row in rows:
+
+        try:
+            codes = [_code(lookup[i], v)
+                     for i, v in enumerate(row[-no_of_params:])]
+        except (KeyError, ValueError):
+            continue
+
+        x.append(codes)
+        y.append(float(row[col]))
+
+    return _scale(param_object, np.array(x, dtype=float)), np.array(y)
+
+
+def _code(lookup, value):
+
+    if isinstance(lookup, dict):
+        return lookup[str(value)]
+
+    return float(lookup.cdf(float(value)))
+
+
+def _encode(param_object, candidates):
+
+    '''Returns the positions of the values in params for permutations
+    in param_index, scaled to 0-1.'''
+
+    import numpy as np
+
+    grid_index = np.asarray(param_object.grid_index[candidates])
+    x = _scale(param_object, param_object._grid_codes(grid_index))
+
+    # distributions that are not sampled yet are in the middle
+    for i, distribution in param_object._distributions.items():
+        values = param_object._distribution_values(i, candidates)
+        x[:, i] = [0.5 if v is None else distribution.cdf(v) for v in values]
+
+    return x
+
+
+def _scale(param_object, codes):
+
+    import numpy as np
+
+    sizes = np.array([max(1, len(l) - 1) for l in param_object._params_temp])
+
+    return codes / sizes
+
+
+def _expected_improvement(x, y, x_candidates, minimize):
+
+    import numpy as np
+    from scipy.stats import norm
+    from sklearn.gaussian_process import GaussianProcessRegressor
+    from sklearn.gaussian_process.kernels import Matern, WhiteKernel
+
+    # handle everything as maximization
+    if minimize:
+        y = -y
+
+    gp = GaussianProcessRegressor(kernel=Matern(nu=2.5) + WhiteKernel(),
+                                  normalize_y=True)
+    gp.fit(x, y)
+
+    mean, std = gp.predict(x_candidates, return_std=True)
+    std = np.maximum(std, 1e-9)
+
+    improvement = mean - y.max()
+    z = improvement / std
+
+    return improvement * norm.cdf(z) + std * norm.pdf(z)
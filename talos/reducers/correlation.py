@@ -13,17 +13,15 @@ def correlation(self, method):
 
     '''
 
-    import numpy as np
+    # the statistics are kept between reductions
+    if self._correlation_stats is None:
+        from .CorrelationStats import CorrelationStats
+        self._correlation_stats = CorrelationStats(self._results_buffer,
+                                                   self.reduction_metric,
+                                                   self.reduction_window)
 
-    # transform the data properly first
-    from .reduce_utils import cols_to_multilabel
-    data = cols_to_multilabel(self)
-
-    # get the correlations
-    corr_values = data.corr(method)[self.reduction_metric]
-
-    # drop the reduction metric row
-    corr_values.drop(self.reduction_metric, inplace=True)
+    # get the correlations against the reduction metric
+    corr_values, values = self._correlation_stats.correlations(method)
 
     # drop labels where value is NaN
     corr_values.dropna(inplace=True)
@@ -36,17 +34,11 @@ def correlation(self, method):
     corr_values.sort_values(ascending=self.minimize_loss, inplace=True)
 
     # if less than threshold, then stop
-    if abs(corr_values[-1]) < self.reduction_threshold:
+    if abs(corr_values.iloc[-1]) < self.reduction_threshold:
         return self
 
-    # get the strongest correlation
-    corr_values = corr_values.index[-1]
-
-    # get the label, value, and dtype from the column header
-    label, dtype, value = corr_values.split('~')
-
-    # convert things back to their original dtype
-    value = np.array([value]).astype(dtype)[0]
+    # get the label and value of the strongest correlation
+    label, value = values[corr_values.index[-1]]
 
     # this is where we modify the parameter space accordingly
     self.param_object.remove_is(label, value)
@@ -3,12 +3,16 @@ def gamify(self):
     '''Will apply reduction changes based on edits on the
     the produced .json file in the experiment folder'''
 
-    if self.param_object.round_counter == 1:
+    if hasattr(self, '_gamify_object') is False:
 
         # create the gamify object
         from .GamifyMap import GamifyMap
         g = GamifyMap(self)
 
+        # continue from the state of a resumed experiment
+        if hasattr(self, '_gamify_dict'):
+            g.gamify_dict = self._gamify_dict
+
         # keep in scan_object
         self._gamify_object = g
 
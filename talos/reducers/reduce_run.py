@@ -23,6 +23,7 @@ def reduce_run(self):
     from .forrest import forrest
     from .trees import trees
     from .gamify import gamify
+    from .bayesian import bayesian
 
     from .local_strategy import local_strategy
     from .limit_by_metric import limit_by_metric
@@ -34,6 +35,8 @@ def reduce_run(self):
         # handle the case where performance target is met
         if status == True:
             self.param_object.param_index = []
+            if self._scheduler is not None:
+                self._scheduler.stop()
             print("Target %.3f have been met." % self.performance_target[1])
 
     # stop here if no reduction method is set
@@ -41,7 +44,7 @@ def reduce_run(self):
         return self
 
     # setup what's required for updating progress bar
-    left = (self.param_object.round_counter + 1)
+    left = (len(self.round_history) + 1)
     right = self.reduction_interval
     len_before_reduce = len(self.param_object.param_index)
 
@@ -49,6 +52,10 @@ def reduce_run(self):
     if self.reduction_method == 'gamify':
         self = gamify(self)
 
+    # pick the next permutation with a gaussian process
+    if self.reduction_method == 'bayesian':
+        self = bayesian(self)
+
     # apply window based reducers
     if left % right == 0:
 
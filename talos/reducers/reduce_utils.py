@@ -2,30 +2,20 @@ def cols_to_multilabel(self):
 
     '''Utility function for correlation and other reducers
     that require transforming hyperparameter values into
-    multilabel values before applying the reduction strategy.'''
+    multilabel values before applying the reduction strategy.
 
-    import wrangle
-    import pandas as pd
-
-    # read in the experiment log
-    data = pd.read_csv(self._experiment_log)
-
-    # apply recuction window
-    data = data.tail(self.reduction_window)
+    Returns a dataframe with reduction_metric and a column for each
+    parameter value in the reduction window, and the parameter label
+    and value of each of those columns by their position. The rounds
+    are kept in memory as parameter codes (see ResultsBuffer), so the
+    experiment log is not read.'''
 
-    # drop all other metric columns except reduction_metric
-    data = data[[self.reduction_metric] + self._param_dict_keys]
-
-    # convert all hyperparameter columns to multi label columns
-    for col in data.iloc[:, 1:].columns:
+    import pandas as pd
 
-        # get the dtype of the column data
-        col_dtype = data[col].dtype
+    y, x, values = self._results_buffer.design_matrix(self.reduction_metric,
+                                                      self.reduction_window)
 
-        # parse column name to contain label, value and dtype
-        data = wrangle.col_to_multilabel(data,
-                                         col,
-                                         extended_colname=True,
-                                         extended_separator='~' + str(col_dtype) + '~')
+    data = pd.DataFrame(x)
+    data.insert(0, self.reduction_metric, y)
 
-    return data
+    return data, values
@@ -1,3 +1,7 @@
+# the largest number of permutations chances can sample from
+CHANCES_MAX_VALUE = 10 ** 7
+
+
 def sample_reducer(limit, max_value, random_method):
 
     '''Sample Reducer (Helper)
@@ -14,12 +18,18 @@ def sample_reducer(limit, max_value, random_method):
     Options are uniform random, stratified random, latin hypercube
     sampling, and latin hypercube with sudoku style constraint.
 
-    Returns the reduced param_grid as numpy array.
+    The uniform methods return a RandomPermutation where each index is
+    computed only when it's used, so the sample takes no memory up front
+    and works for any number of permutations. The other methods create
+    the sample in one go and return it as numpy array.
 
     '''
 
+    import numpy as np
     import chances as ch
 
+    from .RandomPermutation import RandomPermutation
+
     # calculate the size of the downsample
     if isinstance(limit, float):
         n = int(max_value * limit)
@@ -32,6 +42,19 @@ def sample_reducer(limit, max_value, random_method):
     from ..utils.exceptions import TalosDataError
     if n < 1:
         raise TalosDataError("Limiters lead to < 1 permutations.")
+    if n > max_value:
+        raise TalosDataError("Limiters lead to more permutations than "
+                             "there are in the parameter space.")
+
+    # sample the indexes as they are used
+    if random_method in ['uniform_mersenne', 'uniform_crypto']:
+        return RandomPermutation(max_value, n, random_method)
+
+    # the other methods are limited to ten million permutations
+    if max_value > CHANCES_MAX_VALUE:
+        print('random_method is limited to %d permutations. '
+              'Using uniform_mersenne.' % CHANCES_MAX_VALUE)
+        return RandomPermutation(max_value, n)
 
     # Initialize Randomizer()
     r = ch.Randomizer(max_value, n)
@@ -51,14 +74,10 @@ def sample_reducer(limit, max_value, random_method):
         out = r.latin_matrix()
     elif random_method == 'latin_improved':
         out = r.latin_improved()
-    elif random_method == 'uniform_mersenne':
-        out = r.uniform_mersenne()
-    elif random_method == 'uniform_crypto':
-        out = r.uniform_crypto()
     elif random_method == 'ambience':
         out = r.ambience()
     else:
         print('No eligble random_method found. Using uniform_mersenne.')
-        out = r.uniform_mersenne()
+        return RandomPermutation(max_value, n)
 
-    return out
+    return np.array(out, dtype='int64')
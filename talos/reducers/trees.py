@@ -13,11 +13,10 @@ def trees(self, quantile=.8):
     '''
 
     import wrangle
-    import numpy as np
 
     # handle conversion to multi_labels
     from .reduce_utils import cols_to_multilabel
-    data = cols_to_multilabel(self)
+    data, values = cols_to_multilabel(self)
 
     # because extra trees wants label as 'y' we first transform with quantile
     quantile_value = data[self.reduction_metric].quantile(quantile)
@@ -30,17 +29,11 @@ def trees(self, quantile=.8):
     corr_values.dropna(inplace=True)
 
     # handle the turning around of values (see docstring for more info)
-    corr_values -= corr_values[0]
+    corr_values -= corr_values.iloc[0]
     corr_values = corr_values.abs()
 
-    # get the strongest correlation
-    corr_values = corr_values.index[-1]
-
-    # get the label, value, and dtype from the column header
-    label, dtype, value = corr_values.split('~')
-
-    # convert things back to their original dtype
-    value = np.array([value]).astype(dtype)[0]
+    # get the label and value of the strongest correlation
+    label, value = values[corr_values.index[-1]]
 
     # this is where we modify the parameter space accordingly
     self.param_object.remove_is(label, value)
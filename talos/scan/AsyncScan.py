@@ -0,0 +1,33 @@
+from .Scan import Scan
+
+
+class AsyncScan(Scan):
+    """Hyperparamater scanning and optimization for async model functions
+
+    USE: scan_object = await ta.AsyncScan(x, y, params, model, 'name').arun()
+
+    Takes the same arguments as Scan(), but the model is an async function
+    and the experiment is started by awaiting `arun()` in a running event
+    loop, for example in a notebook or an asyncio service:
+
+    async def model(x_train, y_train, x_val, y_val, params):
+
+        # e.g. send the training job to a trainer and await the reply
+
+        return out, model
+
+    Up to `n_jobs` rounds are kept in flight at a time. Outside of an event
+    loop, an async model function can be passed directly to Scan() instead.
+    """
+
+    # AsyncScan is started with arun() instead of on init
+    _autostart = False
+
+    async def arun(self):
+
+        '''Runs the experiment and returns the finished scan object.'''
+
+        from .scan_run import scan_arun
+        await scan_arun(self)
+
+        return self
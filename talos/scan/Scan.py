@@ -89,12 +89,22 @@ class Scan:
     boolean_limit : None or lambda function
         Allows setting a limit to accepted permutations as a lambda function.
         E.g. example lambda p: p['first_neuron'] * p['hidden_layers'] < 220
+    canonical_rules : None or dict
+        Parameter labels with a lambda function that is True for the
+        permutations where the parameter has no effect on the model. Only
+        one of the permutations that are otherwise the same is trained,
+        and its results are logged for each of them. Rules for the
+        parameters of talos.utils.hidden_layers() are in
+        talos.utils.canonical.hidden_layers.
 
     # OPTIMIZER ARGUMENTS
     ---------------------
     reduction_method : None or string
         If None, random search will be used as the optimization strategy.
         Otherwise use the name of the specific strategy, e.g. 'correlation'.
+        With 'hyperband' the rounds are scheduled in brackets of successive
+        halving over the values of `epochs` in params, and with 'asha' the
+        same is done asynchronously as each round finishes.
     reduction_interval : None or int
         The number of reduction method rounds that will be performed. (Default
         is None).
@@ -110,6 +120,10 @@ class Scan:
         if this is a loss.
     minimize_loss : bool
         Must be set to True if a reduction_metric is a loss.
+    reduction_factor : int
+        The factor by which successive halving ('hyperband', 'asha')
+        reduces the number of permutations, and increases the epochs, from
+        one rung to the next. (Default is 3).
 
     # OUTPUT ARGUMENTS
     ------------------
@@ -131,8 +145,62 @@ class Scan:
         If True, models will be saved on the local disk in theexperiment
         folder. When `save_models` is set to True, you should consider setting
         `save_weights` to False.
+    resume : bool
+        If True, the latest experiment log in the experiment folder is
+        continued. Permutations that are already in the log are skipped,
+        and the log is appended. Models and weights of the earlier rounds
+        are not available after resuming.
+    snapshot_interval : None or int
+        The number of rounds between saving a snapshot of the progress of
+        the experiment, so that `resume` also restores the reductions
+        and the random sample of the parameter space. (Default is None).
+    warm_start : bool
+        If True, the model function can start from the weights of the
+        closest finished round with the same architecture by calling
+        `params.warm_start(model)` before fitting. Requires save_weights.
+    log_flush_rows : None or int
+        The experiment log is appended one round at a time, and flushed
+        every `log_flush_rows` rounds. If None, 1 for a csv log and 100
+        for a parquet log. (Default is None).
+    log_flush_seconds : None or float
+        Also flush the experiment log when this many seconds have passed
+        since the last flush, even if no more rounds finish by then. If
+        None, only for a parquet log, every 60 seconds. (Default is None).
+    log_fsync : bool
+        If True, each flush of the experiment log is also synced to disk.
+    log_format : str
+        Either 'csv' or 'parquet'. A parquet experiment log is a folder
+        where each flush adds a file with typed columns, and the files
+        are merged into one at the end of the experiment. Analyze() and
+        the reducers read only the columns they need from it. Requires
+        pyarrow. (Default is 'csv').
+    results_store : None or ResultsStore
+        If a ResultsStore object, the rounds are also added to a SQLite
+        file that many experiments can share, and that Analyze() queries
+        without reading all the rounds. See talos.logging.ResultsStore.
+
+    # EXECUTION ARGUMENTS
+    ---------------------
+    n_jobs : int
+        The number of rounds that are run at the same time. If -1, then the
+        number of CPUs is used. When the model is an async function, this is
+        the number of rounds awaited at the same time. (Default is 1).
+    executor : str
+        The type of worker pool used when `n_jobs` is more than 1. With
+        'process' each worker is a separate process, and the model function
+        has to be picklable with the multiprocessing start method in use.
+        With 'thread' the workers are threads of the same process, which
+        avoids copying the data, but is only useful when training releases
+        the GIL (e.g. PyTorch or scikit-learn). (Default is 'process').
+    queue : None or ParamQueue
+        If a ParamQueue object, the scan is run as one of many nodes that
+        claim permutations from a shared SQLite file, instead of going
+        through `params` alone. See talos.parameters.ParamQueue.
     """
 
+    # start the experiment on init (see AsyncScan)
+    _autostart = True
+
     def __init__(self,
                  x,
                  y,
@@ -150,6 +218,7 @@ class Scan:
                  round_limit=None,
                  time_limit=None,
                  boolean_limit=None,
+                 canonical_rules=None,
                  reduction_method=None,
                  reduction_interval=50,
                  reduction_window=20,
@@ -160,7 +229,19 @@ class Scan:
                  print_params=False,
                  clear_session=True,
                  save_weights=True,
-                 save_models=False):
+                 save_models=False,
+                 resume=False,
+                 snapshot_interval=None,
+                 n_jobs=1,
+                 executor='process',
+                 queue=None,
+                 reduction_factor=3,
+                 warm_start=False,
+                 log_flush_rows=None,
+                 log_flush_seconds=None,
+                 log_fsync=False,
+                 log_format='csv',
+                 results_store=None):
 
         self.x = x
         self.y = y
@@ -182,6 +263,7 @@ class Scan:
         self.round_limit = round_limit
         self.time_limit = time_limit
         self.boolean_limit = boolean_limit
+        self.canonical_rules = canonical_rules
 
         # optimization
         self.reduction_method = reduction_method
@@ -190,6 +272,7 @@ class Scan:
         self.reduction_threshold = reduction_threshold
         self.reduction_metric = reduction_metric
         self.minimize_loss = minimize_loss
+        self.reduction_factor = reduction_factor
 
         # display
         self.disable_progress_bar = disable_progress_bar
@@ -199,7 +282,21 @@ class Scan:
         self.clear_session = clear_session
         self.save_weights = save_weights
         self.save_models = save_models
+        self.resume = resume
+        self.snapshot_interval = snapshot_interval
+        self.warm_start = warm_start
+        self.log_flush_rows = log_flush_rows
+        self.log_flush_seconds = log_flush_seconds
+        self.log_fsync = log_fsync
+        self.log_format = log_format
+        self.results_store = results_store
+
+        # execution
+        self.n_jobs = n_jobs
+        self.executor = executor
+        self.queue = queue
 
         # start runtime
-        from .scan_run import scan_run
-        scan_run(self)
+        if self._autostart:
+            from .scan_run import scan_run
+            scan_run(self)
@@ -0,0 +1,85 @@
+async def scan_async(self):
+
+    '''Runs the rounds of an async model function with up to `n_jobs`
+    rounds in flight at a time. The rounds are awaited concurrently in
+    the event loop, and each round is logged and reduced as soon as its
+    model function returns, in the same way as in sequential scan.'''
+
+    import asyncio
+    import time
+
+    from .scan_round import scan_round_finish
+    from .scan_utils import next_round_params
+
+    semaphore = asyncio.Semaphore(self.n_jobs)
+    running = {}
+    failed = []
+
+    async def run_round(round_params):
+
+        try:
+            round_start = time.strftime('%D-%H%M%S')
+            start = time.time()
+
+            history, model = await self.model(self.x_train,
+                                              self.y_train,
+                                              self.x_val,
+                                              self.y_val,
+                                              round_params)
+
+            end = time.time()
+
+            # the round is finished without awaiting, one at a time
+            self.round_params = round_params
+            self.model_history = history
+            self.round_model = model
+
+            running.pop(asyncio.current_task())
+            self._in_flight = list(running.values())
+
+            scan_round_finish(self, round_start, start, end)
+            self.pbar.update(1)
+
+        except Exception as e:
+            failed.append(e)
+
+        finally:
+            semaphore.release()
+
+    while True:
+
+        # wait until there is room for another round
+        await semaphore.acquire()
+
+        # stop drawing new rounds if a round failed
+        if len(failed) > 0:
+            break
+
+        round_params = next_round_params(self)
+
+        # the scheduler is waiting for the rounds in flight
+        if round_params is None and len(running) > 0:
+            semaphore.release()
+            await asyncio.wait(list(running),
+                               return_when=asyncio.FIRST_COMPLETED)
+            continue
+
+        # no more permutations left
+        if round_params is False or round_params is None:
+            break
+
+        if self.print_params is True:
+            print(round_params)
+
+        task = asyncio.ensure_future(run_round(round_params))
+        running[task] = round_params
+
+    semaphore.release()
+
+    # wait for the rounds still in flight
+    await asyncio.gather(*running.keys())
+
+    if len(failed) > 0:
+        raise failed[0]
+
+    return self
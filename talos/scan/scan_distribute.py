@@ -0,0 +1,163 @@
+def scan_distribute(self):
+
+    '''Runs the rounds as one of many nodes that share a ParamQueue.
+    Permutations are claimed from the queue a batch at a time, and the
+    result of each round is written back to the queue. As the parameter
+    space of each node is made of the permutations the queue was seeded
+    with, a claimed permutation is only missing from it when this node has
+    removed it (e.g. by a reducer), and then it's skipped for all the
+    nodes. When no free permutations are left, but other nodes
+    still hold leases, the node waits in case a lease expires and the
+    permutations are given back.'''
+
+    import time
+
+    from .scan_round import scan_round
+    from .scan_utils import wrap_round_params
+
+    # the queue is seeded in scan_prepare()
+    queue = self.queue
+    queue.start_heartbeat()
+
+    # the time to wait for other nodes before checking again
+    wait_seconds = min(queue.lease_seconds / 4, 10)
+
+    # the scheduler (e.g. asha) decides the rounds of this node
+    if self._scheduler is not None:
+        return _scan_distribute_scheduled(self, wait_seconds)
+
+    header_set = False
+
+    try:
+        while True:
+
+            indexes = queue.claim()
+
+            if len(indexes) == 0:
+
+                # all permutations are done or cancelled
+                if queue.remaining() == 0:
+                    break
+
+                time.sleep(wait_seconds)
+                continue
+
+            for index in indexes:
+
+                # time limit has been met
+                if self.param_object._check_time_limit() is False:
+                    queue.release()
+                    return self
+
+                round_params = self.param_object.draw_grid_index(index)
+
+                # e.g. removed by a reducer or a limit on this node
+                if round_params is False:
+                    queue.skip(index)
+                    continue
+
+                self.round_params = wrap_round_params(self, round_params)
+                self = scan_round(self)
+
+                # the column names are stored with the first result
+                if header_set is False:
+                    queue.set_header(self.result[0])
+                    header_set = True
+
+                queue.complete(index, self.result[-1])
+                self.pbar.update(1)
+
+                # nothing is left on this node e.g. performance target is
+                # met, but the other nodes keep going
+                if len(self.param_object.param_index) == 0:
+                    queue.release()
+                    return self
+
+    finally:
+        queue.stop_heartbeat()
+
+    return self
+
+
+def _scan_distribute_scheduled(self, wait_seconds):
+
+    '''Runs the rounds of a scheduler (e.g. hyperband or asha) that
+    draws new permutations from the queue. Promotions are decided by the
+    node from the rounds it has run itself. The result that is stored in
+    the queue for a permutation is the one from its highest rung.'''
+
+    import time
+
+    from .scan_round import scan_round
+    from .scan_utils import next_round_params
+
+    queue = self.queue
+    scheduler = self._scheduler
+
+    claimed = []
+    indexes = {}
+
+    def draw():
+
+        while True:
+
+            # claim more when the earlier claims are used up
+            if len(claimed) == 0:
+
+                claimed.extend(queue.claim())
+
+                if len(claimed) == 0:
+
+                    # all permutations are done or cancelled
+                    if queue.remaining() == 0:
+                        return False
+
+                    time.sleep(wait_seconds)
+                    continue
+
+            index = claimed.pop(0)
+            round_params = self.param_object.draw_grid_index(index)
+
+            # e.g. removed by a limit on this node
+            if round_params is False:
+                queue.skip(index)
+                continue
+
+            key = scheduler.key(round_params)
+
+            # the same permutation with other epochs was already run here
+            if key in indexes:
+                queue.skip(index)
+                continue
+
+            indexes[key] = index
+
+            return round_params
+
+    scheduler.draw = draw
+
+    try:
+        while True:
+
+            self.round_params = next_round_params(self)
+
+            # a node runs one round at a time so it never has to wait
+            if self.round_params is False or self.round_params is None:
+                break
+
+            self = scan_round(self)
+
+            if len(self.result) == 2:
+                queue.set_header(self.result[0])
+
+            index = indexes[scheduler.key(self.round_params)]
+            queue.complete(index, self.result[-1])
+            self.pbar.update(1)
+
+        # give back the claims that were not started
+        queue.release()
+
+    finally:
+        queue.stop_heartbeat()
+
+    return self
@@ -7,7 +7,8 @@ def scan_finish(self):
                                    'reduction_interval', 'reduce_loss',
                                    'reduction_method', 'reduction_metric',
                                    'reduction_threshold', 'reduction_window',
-                                   'experiment_name', 'round_history']
+                                   'experiment_name', 'round_history',
+                                   'log_format']
 
     import time
     import pandas as pd
@@ -0,0 +1,213 @@
+import time
+
+# the state of a worker process; set once by _init_worker()
+_worker = {}
+
+
+class RoundModel:
+
+    '''A picklable stand-in for the model of a round that was
+    trained in a worker process. Provides the parts of the model
+    API that are used in scan_round_finish().'''
+
+    def __init__(self, model_json, weights):
+
+        self.model_json = model_json
+        self.weights = weights
+
+    def to_json(self):
+
+        return self.model_json
+
+    def get_weights(self):
+
+        return self.weights
+
+    def save(self, file_path):
+
+        from tensorflow.keras.models import model_from_json
+
+        model = model_from_json(self.model_json)
+        model.set_weights(self.weights)
+        model.save(file_path)
+
+
+class RoundHistory:
+
+    '''Holds the history dictionary of a round that was trained
+    in a worker process, in the same way as Keras history object.'''
+
+    def __init__(self, history):
+
+        self.history = history
+
+
+def scan_parallel(self):
+
+    '''Runs the rounds on a pool of `n_jobs` workers, either processes
+    or threads based on `executor`. The parameters are drawn, and the
+    results are handled, in the main thread as each round finishes. This
+    way logging, reducers and `performance_target` work in the same way
+    as in a sequential scan, and all the result stores are kept in the
+    same order.'''
+
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    from concurrent.futures import wait, FIRST_COMPLETED
+
+    from .scan_round import scan_round_finish
+    from .scan_utils import next_round_params
+
+    keep_weights = self.save_weights or self.save_models
+
+    # threads share the data and the model function with the main thread
+    if self.executor == 'thread':
+        pool = ThreadPoolExecutor(max_workers=self.n_jobs)
+        run_round = _run_thread_round.__get__(self)
+
+    else:
+        pool = ProcessPoolExecutor(max_workers=self.n_jobs,
+                                   initializer=_init_worker,
+                                   initargs=(self.model,
+                                             self.x_train,
+                                             self.y_train,
+                                             self.x_val,
+                                             self.y_val,
+                                             keep_weights,
+                                             self.clear_session))
+        run_round = _run_round
+
+    running = {}
+
+    # the workers are stopped also when a round or its handling fails
+    try:
+
+        while True:
+
+            # keep n_jobs rounds in flight as long as there are permutations
+            while len(running) < self.n_jobs:
+
+                round_params = next_round_params(self)
+
+                # no more permutations left, or the scheduler is waiting
+                if round_params is False or round_params is None:
+                    break
+
+                if self.print_params is True:
+                    print(round_params)
+
+                running[pool.submit(run_round, round_params)] = round_params
+
+            # all rounds have been handled
+            if len(running) == 0:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            finished = [(future, running.pop(future)) for future in done]
+
+            # handle the finished rounds in the main process
+            for i, (future, round_params) in enumerate(finished):
+
+                self.round_params = round_params
+                self._in_flight = list(running.values())
+                self._in_flight += [params for _, params in finished[i + 1:]]
+                out = future.result()
+
+                self.model_history = out['history']
+                self.round_model = out['model']
+
+                self = scan_round_finish(self,
+                                         out['round_start'],
+                                         out['start'],
+                                         out['end'])
+
+                self.pbar.update(1)
+
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+    return self
+
+
+def _init_worker(model, x_train, y_train, x_val, y_val,
+                 keep_weights, clear_session):
+
+    '''Sets the model and data once for each worker process so that
+    they are not sent again with every round.'''
+
+    _worker['model'] = model
+    _worker['data'] = (x_train, y_train, x_val, y_val)
+    _worker['keep_weights'] = keep_weights
+    _worker['clear_session'] = clear_session
+
+
+def _run_round(round_params):
+
+    '''Trains the model for a single round inside a worker process
+    and returns the picklable parts of the outcome.'''
+
+    import gc
+
+    x_train, y_train, x_val, y_val = _worker['data']
+
+    round_start = time.strftime('%D-%H%M%S')
+    start = time.time()
+
+    history, model = _worker['model'](x_train,
+                                      y_train,
+                                      x_val,
+                                      y_val,
+                                      round_params)
+
+    end = time.time()
+
+    # keras models are passed back as json and weights
+    try:
+        if _worker['keep_weights']:
+            weights = model.get_weights()
+        else:
+            weights = None
+        model = RoundModel(model.to_json(), weights)
+
+    # other (e.g. pytorch) models are passed back as they are
+    except AttributeError:
+        pass
+
+    if _worker['clear_session'] is True:
+
+        gc.collect()
+
+        # try TF specific and pass for everyone else
+        try:
+            from tensorflow.keras import backend as K
+            K.clear_session()
+        except ImportError:
+            pass
+
+    return {'history': RoundHistory(history.history),
+            'model': model,
+            'round_start': round_start,
+            'start': start,
+            'end': end}
+
+
+def _run_thread_round(self, round_params):
+
+    '''Trains the model for a single round in a worker thread. The
+    model function is expected to release the GIL while training, as
+    is the case e.g. with PyTorch and scikit-learn.'''
+
+    round_start = time.strftime('%D-%H%M%S')
+    start = time.time()
+
+    history, model = self.model(self.x_train,
+                                self.y_train,
+                                self.x_val,
+                                self.y_val,
+                                round_params)
+
+    return {'history': history,
+            'model': model,
+            'round_start': round_start,
+            'start': start,
+            'end': time.time()}
@@ -1,9 +1,31 @@
+# the number of permutations above which LazyParamSpace is used
+LAZY_GRID_SIZE = 10 ** 6
+
+
 def scan_prepare(self):
 
     '''Includes all preparation procedures up until starting the first scan
     through scan_run()'''
 
     from .scan_utils import initialize_log
+    from ..parameters.ParamSpace import ParamSpace
+
+    if self.log_format not in ['csv', 'parquet']:
+        raise TypeError("log_format has to be either 'csv' or 'parquet'.")
+
+    # parquet is an optional dependency
+    if self.log_format == 'parquet':
+        import importlib.util
+        if importlib.util.find_spec('pyarrow') is None:
+            raise ImportError("log_format='parquet' requires pyarrow "
+                              "e.g. pip install talos[parquet]")
+
+    # each flush of a parquet log adds a file, so rounds are batched
+    if self.log_flush_rows is None:
+        self.log_flush_rows = 100 if self.log_format == 'parquet' else 1
+
+    if self.log_flush_seconds is None and self.log_format == 'parquet':
+        self.log_flush_seconds = 60
 
     self._experiment_log = initialize_log(self)
 
@@ -22,18 +44,24 @@ def scan_prepare(self):
         # create reference for parameter keys
         self._param_dict_keys = list(self.params.keys())
 
+        # very large parameter spaces are not created in memory, unless
+        # the permutations are needed up front for canonical_rules
+        if _space_size(self) > LAZY_GRID_SIZE and self.canonical_rules is None:
+            from ..parameters.LazyParamSpace import LazyParamSpace as Space
+        else:
+            Space = ParamSpace
+
         # create the parameter object and move to self
-        from ..parameters.ParamSpace import ParamSpace
-        self.param_object = ParamSpace(params=self.params,
-                                       param_keys=self._param_dict_keys,
-                                       random_method=self.random_method,
-                                       fraction_limit=self.fraction_limit,
-                                       round_limit=self.round_limit,
-                                       time_limit=self.time_limit,
-                                       boolean_limit=self.boolean_limit)
+        self.param_object = Space(params=self.params,
+                                  param_keys=self._param_dict_keys,
+                                  random_method=self.random_method,
+                                  fraction_limit=self.fraction_limit,
+                                  round_limit=self.round_limit,
+                                  time_limit=self.time_limit,
+                                  boolean_limit=self.boolean_limit)
 
     # handle the case when self.params already is ParamSpace object
-    elif 'talos.parameters.ParamSpace.ParamSpace' in str(type(self.params)):
+    elif isinstance(self.params, ParamSpace):
 
         self._param_dict_keys = list(self.params.param_keys)
         self.param_object = self.params
@@ -41,6 +69,55 @@ def scan_prepare(self):
     else:
         raise TypeError('params has to be either dict or ParamSpace object.')
 
+    # the nodes of a queue draw from the permutations it was seeded with,
+    # instead of each taking their own sample
+    if self.queue is not None:
+        seeded = self.queue.seed(self.param_object)
+        sampled = (self.param_object.round_limit is not None
+                   or self.param_object.fraction_limit is not None)
+        if sampled and not seeded:
+            self.param_object.replace_sample(self.queue.grid_indexes())
+
+    # train only one of the permutations that build the same model
+    if self.canonical_rules is not None:
+        self.param_object.canonicalize(self.canonical_rules)
+
+    # handle the number of parallel jobs
+    if self.n_jobs == -1:
+        import os
+        self.n_jobs = os.cpu_count()
+
+    elif not isinstance(self.n_jobs, int) or self.n_jobs < 1:
+        raise ValueError("n_jobs has to be a positive integer or -1.")
+
+    if self.executor not in ['process', 'thread']:
+        raise ValueError("executor has to be either 'process' or 'thread'.")
+
+    # warm_start uses the weights that are kept in memory
+    if self.warm_start and (self.save_weights is False or self.save_models):
+        raise TypeError("warm_start requires save_weights and no save_models.")
+
+    # rounds are scheduled by the reducer instead of drawn in order
+    self._scheduler = None
+
+    if self.reduction_method in ['hyperband', 'asha']:
+
+        if self.snapshot_interval is not None:
+            raise TypeError("%s can't be used with snapshot_interval."
+                            % self.reduction_method)
+
+        if self.canonical_rules is not None:
+            raise TypeError("%s can't be used with canonical_rules."
+                            % self.reduction_method)
+
+        if self.reduction_method == 'hyperband':
+            from ..reducers.Hyperband import Hyperband
+            self._scheduler = Hyperband(self)
+
+        else:
+            from ..reducers.Asha import Asha
+            self._scheduler = Asha(self)
+
     # mark that it's a first round
     self.first_round = True
 
@@ -53,6 +130,37 @@ def scan_prepare(self):
     self.saved_models = []
     self.saved_weights = []
 
+    # the results for reducers are created with the first round
+    self._results_buffer = None
+    self._correlation_stats = None
+
+    # the experiment log is appended as rounds finish (see save_result)
+    self._log_writer = None
+    self._log_rows = 0
+
+    # the run of the experiment in results_store (see store_result)
+    self._run_id = None
+    self._store_rows = 0
+    if self.results_store is not None:
+        self._run_id = self.results_store.start_run(self.experiment_name,
+                                                    self._experiment_id,
+                                                    self._param_dict_keys,
+                                                    self.param_object.params,
+                                                    self.resume
+                                                    and self._resumed)
+
+    # the number of each round in the results (see RoundParams)
+    self._next_round = 0
+    self._result_rounds = []
+
+    # rounds that are drawn but not finished yet (see scan_parallel)
+    self._in_flight = []
+
+    # continue from where a previous run of the experiment stopped
+    if self.resume and self._resumed:
+        from .scan_resume import scan_resume
+        self = scan_resume(self)
+
     # handle validation split
     from ..utils.validation_split import validation_split
     self = validation_split(self)
@@ -61,3 +169,34 @@ def scan_prepare(self):
     self._data_len = len(self.x)
 
     return self
+
+
+def _space_size(self):
+
+    '''Returns the number of permutations that ParamSpace would
+    create for the params dictionary after the limits, without creating
+    them. Ranges (tuples) are counted by their steps.'''
+
+    from ..parameters.distributions import is_distribution
+    from ..parameters.Conditional import is_conditional
+
+    size = 1
+    for values in self.params.values():
+
+        # conditional parameters may also be the default (upper bound)
+        default = 0
+        if is_conditional(values):
+            values, default = values.values, 1
+
+        if isinstance(values, tuple):
+            size *= int(values[2]) + default
+        elif not is_distribution(values):
+            size *= len(values) + default
+
+    if self.fraction_limit is not None:
+        size = int(size * self.fraction_limit)
+
+    if self.round_limit is not None:
+        size = min(size, self.round_limit)
+
+    return size
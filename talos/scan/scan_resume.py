@@ -0,0 +1,239 @@
+def save_snapshot(self):
+
+    '''Saves a compact snapshot of the progress of the experiment
+    next to the experiment log. The snapshot holds the permutations that
+    are still left (including rounds that are in flight) as returned by
+    ParamSpace.snapshot(), the timings and the state of reducers.'''
+
+    import os
+    import pickle
+
+    # the rounds in the snapshot are not run again, so they have to be
+    # in the experiment log e.g. when log_flush_rows is more than 1
+    if self._log_writer is not None:
+        self._log_writer.flush()
+
+    param_object = self.param_object
+
+    in_flight = [param_object._param_grid_index(round_params)
+                 for round_params in self._in_flight]
+
+    state = {'param_object': param_object.snapshot(in_flight),
+             'round_times': self.round_times,
+             'epoch_entropy': self.epoch_entropy}
+
+    # keep the state of the gamify reducer
+    if hasattr(self, '_gamify_object'):
+        state['gamify_dict'] = self._gamify_object.gamify_dict
+
+    # write to a temporary file first so that a crash can't corrupt it
+    file_path = _snapshot_path(self)
+    with open(file_path + '.tmp', 'wb') as f:
+        pickle.dump(state, f)
+
+    os.replace(file_path + '.tmp', file_path)
+
+
+def scan_resume(self):
+
+    '''Restores the progress of an experiment from its experiment log
+    and from the latest snapshot, if there is one. The permutations that
+    are already in the experiment log are dropped from the parameter
+    space, and the logging continues in the same experiment log.'''
+
+    import os
+    import pickle
+    import numpy as np
+
+    if self.log_format == 'parquet':
+        header, rows, values = _read_parquet_log(self)
+    else:
+        header, rows, values = _read_csv_log(self)
+
+    # the experiment was stopped before the first round finished
+    if header is None:
+        return self
+
+    param_object = self.param_object
+    param_object.round_counter = len(rows)
+
+    # the rounds that the limits allow in total
+    limit = len(param_object.param_index)
+
+    # continue from the snapshot
+    snapshot = os.path.exists(_snapshot_path(self))
+    if snapshot:
+
+        with open(_snapshot_path(self), 'rb') as f:
+            state = pickle.load(f)
+
+        param_object.restore(state['param_object'])
+
+        self.round_times = state['round_times']
+        self.epoch_entropy = state['epoch_entropy']
+
+        if 'gamify_dict' in state:
+            self._gamify_dict = state['gamify_dict']
+
+    # drop the permutations that are already in the experiment log
+    no_of_params = len(self._param_dict_keys)
+    lookups = [[str(v) for v in l] for l in param_object._params_temp]
+
+    # values in a parquet log are converted to the type of their column
+    if self.log_format == 'parquet':
+        from ..logging.ParquetWriter import param_types, log_value
+        types = param_types(param_object)
+        for i, key in enumerate(self._param_dict_keys):
+            if i not in param_object._distributions:
+                lookups[i] = [str(log_value(v, types[key]))
+                              for v in param_object._params_temp[i]]
+
+    for i in param_object._distributions:
+        lookups[i] = None
+    done = [_grid_index(lookups, row[-no_of_params:]) for row in rows]
+    param_object.remove_grid_index([i for i in done if i is not None])
+
+    # without a snapshot, round_limit and fraction_limit sample the
+    # parameter space anew, so only the rounds that are left are kept
+    sampled = (param_object.round_limit is not None
+               or param_object.fraction_limit is not None)
+
+    if not snapshot and sampled:
+        left = max(0, limit - len(rows))
+        if len(param_object.param_index) > left:
+            remaining = np.asarray(param_object.param_index)[:left]
+            param_object.param_index = remaining
+
+    # continue logging where it was left
+    self.result = [header] + values
+    self._log_rows = len(self.result)
+    self.first_round = False
+
+    # the rounds before resuming are numbered in the order of the log,
+    # unless they are already in the run of the results store
+    self._result_rounds = list(range(len(rows)))
+    self._next_round = len(rows)
+
+    if self.results_store is not None:
+        stored = self.results_store.next_round(self._run_id)
+        if stored > 0:
+            self._store_rows = len(self.result)
+            self._next_round = max(len(rows), stored)
+
+    self._all_keys = header[1:len(header) - no_of_params]
+    self._metric_keys = [k for k in self._all_keys if 'val_' not in k]
+    self._val_keys = [k for k in self._all_keys if 'val_' in k]
+
+    # the results for reducers
+    from ..logging.ResultsBuffer import ResultsBuffer
+    self._results_buffer = ResultsBuffer(param_object, self._all_keys)
+    for row, row_values in zip(rows, values):
+        self._results_buffer.append(_codes(lookups, row[-no_of_params:]),
+                                    row_values[1:len(self._all_keys) + 1])
+
+    # fill the stores for the rounds that are not in the snapshot
+    for i in range(len(self.round_times), len(rows)):
+        self.round_times.append([None, None, None])
+        self.epoch_entropy.append([np.nan] * len(self._metric_keys))
+
+    # models and epoch level data do not survive the restart
+    self.round_history = [{}] * len(rows)
+    self.saved_models = [None] * len(rows)
+    self.saved_weights = [None] * len(rows)
+
+    return self
+
+
+def _snapshot_path(self):
+
+    import os
+
+    return os.path.splitext(self._experiment_log)[0] + '_snapshot.pkl'
+
+
+def _read_csv_log(self):
+
+    '''Returns the header, the rows as they are written, and the rows
+    as values of a csv experiment log. The header is None if the log
+    is empty.'''
+
+    import csv
+
+    with open(self._experiment_log, 'r') as f:
+        text = f.read()
+
+    # drop a round that was being written when the experiment stopped,
+    # as the experiment log is appended from where it ends
+    if not text.endswith('\n'):
+        text = text[:text.rfind('\n') + 1]
+        with open(self._experiment_log, 'w') as f:
+            f.write(text)
+
+    rows = list(csv.reader(text.splitlines()))
+
+    if len(rows) == 0:
+        return None, [], []
+
+    values = [[_parse_value(v) for v in row] for row in rows[1:]]
+
+    return rows[0], rows[1:], values
+
+
+def _read_parquet_log(self):
+
+    '''Same as _read_csv_log() for a parquet experiment log. The files
+    are only ever written whole, so there is nothing to drop.'''
+
+    import pyarrow.parquet as pq
+
+    from ..logging.ParquetWriter import log_parts
+
+    if len(log_parts(self._experiment_log)) == 0:
+        return None, [], []
+
+    table = pq.read_table(self._experiment_log)
+    values = [list(row) for row in zip(*table.to_pydict().values())]
+    rows = [[str(v) for v in row] for row in values]
+
+    return table.column_names, rows, values
+
+
+def _grid_index(lookups, values):
+
+    '''Returns the grid index of parameter values as they are written
+    in the experiment log, or None if they are not on the grid. Lookups
+    are None for distributions.'''
+
+    index = 0
+    for value, lookup in zip(values, lookups):
+        if lookup is None:
+            continue
+        if value not in lookup:
+            return None
+        index = index * len(lookup) + lookup.index(value)
+
+    return index
+
+
+def _codes(lookups, values):
+
+    '''Returns the position of each value in its lookup, or -1 for
+    distributions and values that are not on the grid.'''
+
+    return [-1 if lookup is None or value not in lookup
+            else lookup.index(value)
+            for value, lookup in zip(values, lookups)]
+
+
+def _parse_value(value):
+
+    '''Converts a value read from the experiment log back to a number
+    where possible so that it's written back in the same way.'''
+
+    for dtype in [int, float]:
+        try:
+            return dtype(value)
+        except ValueError:
+            pass
+
+    return value
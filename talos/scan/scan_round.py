@@ -4,7 +4,6 @@ def scan_round(self):
     on the level of execution of each round.'''
 
     import time
-    import gc
 
     # print round params
     if self.print_params is True:
@@ -17,20 +16,80 @@ def scan_round(self):
     # fit the model
     from ..model.ingest_model import ingest_model
     self.model_history, self.round_model = ingest_model(self)
+
+    return scan_round_finish(self, round_start, start)
+
+
+def scan_round_finish(self, round_start, start, end=None):
+
+    '''Handles everything that follows the fitting of the model in
+    a round; logging, reductions and storing the model. Expects
+    self.round_params, self.model_history and self.round_model to be
+    set for the round. `end` is the end time of the round when the
+    model was fitted elsewhere (e.g. in a worker process).'''
+
+    import gc
+
     self.round_history.append(self.model_history.history)
 
     # handle logging of results
     from ..logging.logging_run import logging_run
-    self = logging_run(self, round_start, start, self.model_history)
+    self = logging_run(self, round_start, start, self.model_history, end)
+
+    # let the scheduler know the outcome of the round
+    if self._scheduler is not None:
+        self._scheduler.report(self.round_params, self.model_history.history)
 
     # apply reductions
     from ..reducers.reduce_run import reduce_run
     self = reduce_run(self)
 
+    # store the model
+    _store_model(self)
+
+    # log the same results for the permutations that build the same model
+    # (see canonical_rules) as if each was a round, but keep the history
+    # once in round_history as it's from one model (see MedianStopping)
+    for round_params in self.param_object.equivalent_parameters(
+            self.round_params):
+        self.round_params = round_params
+        self = logging_run(self, round_start, start, self.model_history, end)
+        _store_model(self)
+
+    # clear tensorflow sessions
+    if self.clear_session is True:
+
+        del self.round_model
+        gc.collect()
+
+        # not while other rounds are still in flight
+        if len(self._in_flight) == 0:
+
+            # try TF specific and pass for everyone else
+            try:
+                from tensorflow.keras import backend as K
+                K.clear_session()
+            except ImportError:
+                pass
+
+    # save a snapshot for resuming the experiment
+    if self.snapshot_interval is not None:
+        if len(self.round_history) % self.snapshot_interval == 0:
+            from .scan_resume import save_snapshot
+            save_snapshot(self)
+
+    return self
+
+
+def _store_model(self):
+
+    '''Saves the model of the round, or keeps its json and weights.'''
+
     # handle the case where the actual model is to be saved
     if self.save_models:
 
-        dir_name = str(len(self.round_history) - 1)
+        # by the row of the round in the results (the first is the header)
+        dir_name = str(len(self.result) - 2)
         file_path = self._saved_models_path + '/' + dir_name
         self.round_model.save(file_path)
 
@@ -52,18 +111,3 @@ def scan_round(self):
                     self.saved_models.append(self.round_model.state_dict())
                 else:
                     self.saved_weights.append(None)
-
-    # clear tensorflow sessions
-    if self.clear_session is True:
-
-        del self.round_model
-        gc.collect()
-
-        # try TF specific and pass for everyone else
-        try:
-            from tensorflow.keras import backend as K
-            K.clear_session()
-        except ImportError:
-            pass
-
-    return self
@@ -3,6 +3,62 @@ def scan_run(self):
     '''The high-level management of the scan procedures
     onwards from preparation. Manages round_run()'''
 
+    from .scan_utils import next_round_params
+
+    self = scan_start(self)
+
+    # handle the case where the model function is async
+    if _is_async(self.model):
+        import asyncio
+        from .scan_async import scan_async
+        self = asyncio.run(scan_async(self))
+
+    # handle the case where permutations come from a shared queue
+    elif self.queue is not None:
+        from .scan_distribute import scan_distribute
+        self = scan_distribute(self)
+
+    # handle the case where rounds are run in parallel
+    elif self.n_jobs > 1:
+        from .scan_parallel import scan_parallel
+        self = scan_parallel(self)
+
+    # the main cycle of the experiment
+    else:
+        while True:
+
+            # get the parameters
+            self.round_params = next_round_params(self)
+
+            # break when there is no more permutations left, or when
+            # the scheduler waits for rounds while none are in flight
+            if self.round_params is False or self.round_params is None:
+                break
+            # otherwise proceed with next permutation
+            from .scan_round import scan_round
+            self = scan_round(self)
+            self.pbar.update(1)
+
+    scan_end(self)
+
+
+async def scan_arun(self):
+
+    '''Same as scan_run() but for an async model function and
+    awaited in an already running event loop (see AsyncScan).'''
+
+    from .scan_async import scan_async
+
+    self = scan_start(self)
+    self = await scan_async(self)
+
+    scan_end(self)
+
+
+def scan_start(self):
+
+    '''Prepares the experiment and the progress bar.'''
+
     from tqdm import tqdm
 
     from .scan_prepare import scan_prepare
@@ -12,19 +68,12 @@ def scan_run(self):
     self.pbar = tqdm(total=len(self.param_object.param_index),
                      disable=self.disable_progress_bar)
 
-    # the main cycle of the experiment
-    while True:
+    return self
+
 
-        # get the parameters
-        self.round_params = self.param_object.round_parameters()
+def scan_end(self):
 
-        # break when there is no more permutations left
-        if self.round_params is False:
-            break
-        # otherwise proceed with next permutation
-        from .scan_round import scan_round
-        self = scan_round(self)
-        self.pbar.update(1)
+    '''Closes the progress bar and finishes the experiment.'''
 
     # close progress bar before finishing
     self.pbar.close()
@@ -35,3 +84,10 @@ def scan_run(self):
 
     from .scan_finish import scan_finish
     self = scan_finish(self)
+
+
+def _is_async(model):
+
+    import inspect
+
+    return inspect.iscoroutinefunction(model)
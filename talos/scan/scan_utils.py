@@ -10,6 +10,23 @@ def initialize_log(self):
     except FileExistsError:
         pass
 
+    # continue the latest experiment log in the folder
+    if self.resume:
+        _experiment_log = latest_log(self.experiment_name, self.log_format)
+        self._resumed = _experiment_log is not None
+
+        if self._resumed:
+            _file_name = os.path.basename(_experiment_log)
+            self._experiment_id = os.path.splitext(_file_name)[0]
+
+            if self.save_models:
+                self._saved_models_path = self.experiment_name + '/' + self._experiment_id
+                os.makedirs(path + '/' + self._saved_models_path, exist_ok=True)
+
+            return _experiment_log
+
+        print("No experiment log found for resume. Starting from scratch.")
+
     # create unique experiment_id
     self._experiment_id = time.strftime('%D%H%M%S').replace('/', '')
 
@@ -19,11 +36,114 @@ def initialize_log(self):
         file_path = path + '/' + self._saved_models_path
         os.mkdir(file_path)
 
-    _file_name = self._experiment_id + '.csv'
+    _file_name = self._experiment_id + '.' + self.log_format
     _experiment_log = './' + self.experiment_name + '/' + _file_name
 
-    f = open(_experiment_log, 'w')
-    f.write('')
-    f.close()
+    # a parquet log is a folder with a file for each row group
+    if self.log_format == 'parquet':
+        import shutil
+        shutil.rmtree(_experiment_log, ignore_errors=True)
+        os.mkdir(_experiment_log)
+    else:
+        f = open(_experiment_log, 'w')
+        f.write('')
+        f.close()
 
     return _experiment_log
+
+
+def latest_log(experiment_name, log_format='csv'):
+
+    '''Returns the path to the latest experiment log in
+    the experiment folder, or None if there is none.'''
+
+    import glob
+    import os
+
+    list_of_files = glob.glob('./' + experiment_name + '/*.' + log_format)
+
+    if len(list_of_files) == 0:
+        return None
+
+    return max(list_of_files, key=os.path.getmtime)
+
+
+def next_round_params(self):
+
+    '''Returns the parameters for the next round. When a scheduler
+    (e.g. hyperband) is in use, it decides the parameters and returns None
+    while it waits for the rounds in flight. False means no rounds are left.'''
+
+    if self._scheduler is not None:
+        round_params = self._scheduler.next_round()
+    else:
+        round_params = self.param_object.round_parameters()
+
+    if round_params is False or round_params is None:
+        return round_params
+
+    return wrap_round_params(self, round_params)
+
+
+def wrap_round_params(self, round_params):
+
+    '''Returns the parameters of a round as RoundParams that
+    come with the history of the earlier rounds, and with
+    the weights of the closest earlier rounds for warm_start.'''
+
+    from ..parameters.RoundParams import RoundParams
+
+    warm_start = None
+
+    # avoid sending many weights and histories to worker processes
+    to_process = self.n_jobs > 1 and self.executor == 'process'
+
+    if self.warm_start:
+
+        limit = None
+        if to_process:
+            limit = 3
+
+        warm_start = warm_start_candidates(self, round_params, limit)
+
+    history_limit = None
+    if to_process:
+        history_limit = 100
+
+    # the rounds are numbered as they are drawn, as rounds in parallel
+    # finish in a different order (see logging_run)
+    round_number = self._next_round
+    self._next_round += 1
+
+    return RoundParams(round_params,
+                       self.round_history,
+                       warm_start,
+                       history_limit,
+                       self._run_id,
+                       round_number)
+
+
+def warm_start_candidates(self, round_params, limit=None):
+
+    '''Returns the model json and weights of the finished rounds,
+    the ones with the fewest different parameter values first.'''
+
+    values = [str(v) for v in round_params.values()]
+    rows = self.result[1:]
+
+    distances = {}
+
+    for i, row in enumerate(rows):
+
+        # e.g. the rounds before resuming have no weights
+        if i >= len(self.saved_weights) or self.saved_weights[i] is None:
+            continue
+
+        row = row[-len(values):]
+        distances[i] = sum([a != str(b) for a, b in zip(values, row)])
+
+    # the latest round first among equally close ones
+    order = sorted(distances, key=lambda i: (distances[i], -i))
+
+    return [(self.saved_models[i], self.saved_weights[i])
+            for i in order[:limit]]
@@ -12,5 +12,8 @@ from .torch_history import TorchHistory
 from wrangle import array_split as val_split
 from .power_draw_append import power_draw_append
 from .recover_best_model import recover_best_model
+from ..parameters import distributions
+from ..parameters.Conditional import Conditional
+from ..parameters import canonical
 
 del sequence_generator
@@ -31,14 +31,14 @@ def recover_best_model(x_train,
 
     '''
 
-    import pandas as pd
     import sklearn as sk
     import numpy as np
 
     from talos.utils.validation_split import kfold
+    from talos.logging.read_log import read_log
 
     # read the experiment log into a dataframe
-    df = pd.read_csv(experiment_log)
+    df = read_log(experiment_log)
 
     # handle input data scenarios
     if x_cross is None or y_cross is None:
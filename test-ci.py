@@ -8,12 +8,15 @@ if __name__ == '__main__':
     test_latest()
     recover_best_model()
     test_random_methods()
+    test_param_space()
+    test_logging()
     test_autom8()
     test_templates() 
     test_analyze(scan_object)
     test_lr_normalizer()
     test_predict()
     test_reducers()
+    test_correlation_stats()
     test_rest(scan_object)
 
     print("\n All tests successfully completed :) Good work. \n ")
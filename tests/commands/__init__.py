@@ -1,8 +1,11 @@
 from .recover_best_model import recover_best_model
 from .test_analyze import test_analyze
 from .test_autom8 import test_autom8
+from .test_correlation_stats import test_correlation_stats
 from .test_latest import test_latest
+from .test_logging import test_logging
 from .test_lr_normalizer import test_lr_normalizer
+from .test_param_space import test_param_space
 from .test_predict import test_predict
 from .test_random_methods import test_random_methods
 from .test_reducers import test_reducers
@@ -29,6 +29,10 @@ def test_autom8():
 
     p.resample_params(1)
 
+    # shapes given in params are not made conditional
+    kept = talos.autom8.AutoParams({'shapes': ['brick']}, replace=False)
+    assert kept.params['shapes'] == ['brick']
+
     print('finised AutoParams() \n')
 
     # # # # # # # # # # # # # # # #
@@ -0,0 +1,52 @@
+def test_correlation_stats():
+
+    print('\n >>> start CorrelationStats()... \n')
+
+    import numpy as np
+    import pandas as pd
+
+    from talos.parameters.ParamSpace import ParamSpace
+    from talos.logging.ResultsBuffer import ResultsBuffer
+    from talos.reducers.CorrelationStats import CorrelationStats
+
+    # 'optimizer' has a value that is in every round
+    p = {'first_neuron': [8, 16, 32],
+         'activation': ['relu', 'elu'],
+         'dropout': [0, .1, .2, .3, .4],
+         'optimizer': ['adam']}
+
+    np.random.seed(4)
+    space = ParamSpace(p, list(p))
+
+    for metric in ['continuous', 'ties']:
+        for window in [5, 12, 1000]:
+
+            buffer = ResultsBuffer(space, ['val_acc'], size=4)
+            stats = CorrelationStats(buffer, 'val_acc', window)
+
+            for i in range(40):
+
+                codes = [np.random.randint(len(v)) for v in p.values()]
+                if metric == 'ties':
+                    value = float(np.random.randint(4))
+                else:
+                    value = np.random.normal()
+                buffer.append(codes, [value])
+
+                # the rounds in the window, as the reducers used to see them
+                y, x, columns = buffer.design_matrix('val_acc', window)
+                data = pd.DataFrame(x)
+
+                for method in ['pearson', 'spearman', 'kendall']:
+
+                    expected = data.corrwith(pd.Series(y), method=method)
+                    out, values = stats.correlations(method)
+
+                    assert values == columns
+                    assert np.allclose(out, expected, equal_nan=True)
+
+                    # the value in every round has no correlation
+                    optimizer = values.index(('optimizer', 'adam'))
+                    assert np.isnan(out[optimizer])
+
+    print('finised CorrelationStats() \n')
@@ -43,7 +43,8 @@ def test_latest():
 
         out = model.fit(x_train,
                         y_train,
-                        callbacks=[talos.callbacks.ExperimentLog('test_latest', params)],
+                        callbacks=[talos.callbacks.ExperimentLog('test_latest', params),
+                                   talos.callbacks.MedianStopping(params, min_rounds=2)],
                         batch_size=params['batch_size'],
                         epochs=params['epochs'],
                         validation_data=(x_val, y_val),
@@ -74,4 +75,58 @@ def test_latest():
                              reduction_method='gamify',
                              save_weights=False)
 
+    from talos.parameters.LazyParamSpace import LazyParamSpace
+
+    param_object = LazyParamSpace(params=p,
+                                  param_keys=list(p.keys()),
+                                  round_limit=5)
+
+    scan_object = talos.Scan(x, y,
+                             model=iris_model,
+                             params=param_object,
+                             experiment_name='test_latest',
+                             reduction_method='correlation',
+                             reduction_interval=2,
+                             reduction_window=2)
+
+    from talos.parameters.ParamSpace import ParamSpace
+
+    param_spaces.param_spaces[1].save('test_latest_space')
+    param_object = ParamSpace.load('test_latest_space')
+
+    scan_object = talos.Scan(x, y,
+                             model=iris_model,
+                             params=param_object,
+                             experiment_name='test_latest')
+
+    from talos.parameters.ParamQueue import ParamQueue
+
+    import os
+
+    if os.path.exists('test_latest_queue.db'):
+        os.remove('test_latest_queue.db')
+
+    queue = ParamQueue('test_latest_queue.db', batch_size=2)
+
+    scan_object = talos.Scan(x, y,
+                             model=iris_model,
+                             params=p,
+                             experiment_name='test_latest',
+                             round_limit=4,
+                             queue=queue)
+
+    # every permutation is done, or skipped after a reduction
+    import sqlite3
+
+    conn = sqlite3.connect('test_latest_queue.db')
+    statuses = [row[0] for row in
+                conn.execute('SELECT status FROM permutations')]
+    conn.close()
+
+    assert len(statuses) == 4
+    assert set(statuses) <= {'done', 'skipped'}
+    assert queue.remaining() == 0
+    assert len(queue.results()) == statuses.count('done')
+    assert len(scan_object.data) == statuses.count('done')
+
     print('finised Latest Features \n')
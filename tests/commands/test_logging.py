@@ -0,0 +1,133 @@
+def test_logging():
+
+    print('\n >>> start logging... \n')
+
+    import os
+    import time
+    import tempfile
+
+    import numpy as np
+
+    from talos.logging.ResultsWriter import ResultsWriter
+    from talos.logging.read_log import read_log
+
+    rows = [['round_epochs', 'val_acc', 'activation', 'dropout', 'flag'],
+            [5, 0.5, 'relu', .25, True],
+            [3, np.float32(0.3333), 'elü', 0, False],
+            [7, np.float64(1e-20), None, np.int64(3), np.bool_(True)],
+            [2, np.nan, len, 1.5, False]]
+
+    folder = tempfile.mkdtemp()
+    expected_path = os.path.join(folder, 'savetxt.csv')
+
+    # the experiment log used to be written whole with np.savetxt
+    np.savetxt(expected_path, rows, fmt='%s', delimiter=',')
+
+    with open(expected_path, 'rb') as f:
+        expected = f.read()
+
+    # the appended log has the same bytes however often it's flushed
+    for flush_rows in [1, 2, 100]:
+
+        path = os.path.join(folder, 'appended_%d.csv' % flush_rows)
+
+        writer = ResultsWriter(path, flush_rows=flush_rows)
+        for row in rows:
+            writer.write(row)
+        writer.close()
+
+        with open(path, 'rb') as f:
+            assert f.read() == expected
+
+        data = read_log(path)
+        assert list(data.columns) == rows[0]
+        assert len(data) == len(rows) - 1
+
+    # with flush_seconds the rows are flushed without more writes
+    path = os.path.join(folder, 'timer.csv')
+    writer = ResultsWriter(path, flush_rows=None, flush_seconds=.2)
+    writer.write(rows[0])
+    writer.write(rows[1])
+    writer.write(rows[2])
+
+    time.sleep(1)
+
+    with open(path, 'rb') as f:
+        assert f.read() == b''.join(expected.splitlines(True)[:3])
+
+    writer.close()
+
+    from talos.logging.ParquetWriter import ParquetWriter
+
+    # the files of a parquet log are merged into one when it's closed
+    path = os.path.join(folder, 'log.parquet')
+    os.makedirs(path)
+
+    writer = ParquetWriter(path, {'activation': 'string'}, flush_rows=2)
+    writer.write(['round_epochs', 'val_acc', 'activation'])
+    for i in range(5):
+        writer.write([i, i / 10, 'relu'])
+
+    assert len(os.listdir(path)) == 2
+    writer.close()
+    assert os.listdir(path) == ['part-00000000.parquet']
+
+    data = read_log(path)
+    assert list(data['round_epochs']) == list(range(5))
+    assert list(data['val_acc']) == [i / 10 for i in range(5)]
+
+    import wrangle
+
+    from talos.parameters.ParamSpace import ParamSpace
+    from talos.logging.ResultsBuffer import ResultsBuffer
+
+    params = {'first_neuron': [8, 16, 32],
+              'activation': ['relu', 'elu'],
+              'dropout': [0, .25, .5],
+              'batch_size': [10, 20]}
+
+    np.random.seed(3)
+    space = ParamSpace(params, list(params))
+    buffer = ResultsBuffer(space, ['loss', 'val_acc'])
+
+    path = os.path.join(folder, 'rounds.csv')
+    writer = ResultsWriter(path)
+    writer.write(['round_epochs', 'loss', 'val_acc'] + list(params))
+
+    for i in range(20):
+        round_params = space.round_parameters()
+        values = [round_params[key] for key in params]
+        metrics = list(np.random.rand(2))
+        writer.write([5] + metrics + values)
+        buffer.append(buffer.codes(values), metrics)
+
+    writer.close()
+
+    # the design matrix has the same columns as the log used to be
+    # encoded into with wrangle.col_to_multilabel
+    for window in [1, 8, 20, 50]:
+
+        data = read_log(path, ['val_acc'] + list(params)).tail(window)
+        for col in data.columns[1:]:
+            data = wrangle.col_to_multilabel(data, col,
+                                             extended_colname=True,
+                                             extended_separator='~' + str(data[col].dtype) + '~')
+
+        y, x, columns = buffer.design_matrix('val_acc', window)
+
+        # wrangle writes the values as they are in the log (e.g. 0.0)
+        def column_key(label, value):
+            try:
+                return label, float(value)
+            except ValueError:
+                return label, value
+
+        old = {column_key(*col.split('~')[::2]): list(data[col].astype(float))
+               for col in data.columns[1:]}
+        new = {column_key(*col): list(x[:, j])
+               for j, col in enumerate(columns)}
+
+        assert np.allclose(y, data['val_acc'])
+        assert new == old
+
+    print('finised logging \n')
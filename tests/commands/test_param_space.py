@@ -0,0 +1,139 @@
+def test_param_space():
+
+    print('\n >>> start ParamSpace()... \n')
+
+    import numpy as np
+
+    from talos.parameters.ParamSpace import ParamSpace
+    from talos.parameters.LazyParamSpace import LazyParamSpace
+
+    p = {'first_neuron': [8, 16, 32],
+         'activation': ['relu', 'elu'],
+         'dropout': [0, .25, .5],
+         'batch_size': [10, 20]}
+
+    def draw_all(param_object):
+
+        out = []
+        while True:
+            round_params = param_object.round_parameters()
+            if round_params is False:
+                return out
+            out.append(round_params)
+
+    # the lazy parameter space draws the same permutations in the same order
+    for limits in [{},
+                   {'round_limit': 10},
+                   {'fraction_limit': .5},
+                   {'boolean_limit': lambda p: p['first_neuron'] > 8},
+                   {'boolean_limit': lambda p: p['batch_size'] == 20
+                    and p['dropout'] == .25}]:
+
+        np.random.seed(1)
+        eager = ParamSpace(p, list(p), **limits)
+        np.random.seed(1)
+        lazy = LazyParamSpace(p, list(p), **limits)
+
+        # with boolean_limit the length of lazy param_index is an upper bound
+        if 'boolean_limit' not in limits:
+            grid_indexes = eager.grid_index[eager.param_index]
+            assert list(lazy.param_index) == list(grid_indexes)
+
+        for param_object in [eager, lazy]:
+            param_object.remove_is('activation', 'elu')
+            param_object.remove_ge('dropout', .5)
+
+        eager_rounds = draw_all(eager)
+
+        assert eager_rounds == draw_all(lazy)
+        assert all(r['activation'] == 'relu' for r in eager_rounds)
+        assert all(r['dropout'] < .5 for r in eager_rounds)
+
+    import itertools
+
+    # the typed columns decode to the same permutations as the full grid,
+    # with the values as they are in params
+    p_wide = dict(p)
+    p_wide['lr'] = [i / 1000 for i in range(300)]
+
+    space = ParamSpace(p_wide, list(p_wide))
+    grid = list(itertools.product(*p_wide.values()))
+
+    assert [tuple(row) for row in space.param_space] == grid
+    dtypes = [column.dtype for column in space._columns]
+    assert dtypes == ['uint8'] * 4 + ['uint16']
+    assert type(space.param_space[0, 1]) is str
+    assert type(space.param_space[0, 2]) is int
+
+    for index in [0, 1, 299, 300, len(grid) - 1]:
+        assert tuple(space.grid_parameters(index).values()) == grid[index]
+
+    rounds = draw_all(space)
+    assert [tuple(r.values()) for r in rounds] == grid
+
+    import copy
+    import tempfile
+
+    from talos.utils import Conditional
+
+    # a saved parameter space continues where it was left when loaded
+    p_saved = dict(p)
+    p_saved['dropout'] = Conditional([.25, .5],
+                                     when={'first_neuron': lambda x: x > 8},
+                                     default=0)
+
+    for space_class in [ParamSpace, LazyParamSpace]:
+        for mmap in [True, False]:
+
+            np.random.seed(2)
+            space = space_class(p_saved, list(p_saved), round_limit=12)
+            space.remove_is('activation', 'elu')
+
+            for i in range(3):
+                space.round_parameters()
+
+            path = tempfile.mkdtemp()
+            space.save(path)
+            loaded = ParamSpace.load(path, mmap=mmap)
+
+            assert type(loaded) is space_class
+            assert loaded.round_counter == space.round_counter
+            assert list(loaded.param_index) == list(space.param_index)
+
+            rest = draw_all(loaded)
+            assert len(rest) > 0
+            assert rest == draw_all(copy.deepcopy(space))
+
+    from talos.parameters.BooleanLimit import BooleanLimit
+
+    space = ParamSpace(p, list(p))
+    rows = [dict(zip(space.param_keys, row)) for row in space.param_space]
+
+    minimum = 16
+    limits = [lambda p: p['first_neuron'] * p['batch_size'] < 400,
+              lambda p: p['activation'] == 'relu' or p['dropout'] > 0,
+              lambda p: not (8 < p['first_neuron'] <= 16),
+              lambda p: p['activation'] in ['elu'] and p['first_neuron'] >= minimum,
+              lambda p: p['dropout'] if p['batch_size'] == 10 else True,
+              lambda p: abs(p['dropout'] - .25) < .1,
+              lambda p: len(p['activation']) == 4]
+
+    # all but the one calling len() are compiled to work with columns
+    for limit in limits[:-1]:
+        assert BooleanLimit(limit, space.param_keys)._vectorized is not None
+
+    assert BooleanLimit(limits[-1], space.param_keys)._vectorized is None
+
+    # the compiled lambdas accept the same permutations as python,
+    # also when evaluated in many chunks
+    for limit in limits:
+
+        expected = [bool(limit(row)) for row in rows]
+
+        for chunk_size in [100000, 7]:
+            boolean_limit = BooleanLimit(limit, space.param_keys)
+            boolean_limit.chunk_size = chunk_size
+            out = boolean_limit(space._columns, space._tables)
+            assert list(out) == expected
+
+    print('finised ParamSpace() \n')
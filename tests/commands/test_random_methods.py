@@ -23,4 +23,43 @@ def test_random_methods():
     for method in random_methods:
         talos.templates.pipelines.titanic(random_method=method, debug=True)
 
+    import numpy as np
+
+    from talos.reducers.RandomPermutation import RandomPermutation
+
+    # each number is at exactly one position, also when max_value
+    # is not a power of two and the numbers are cycle walked
+    for max_value in [1, 2, 3, 5, 16, 17, 1000, 4097]:
+        for method in ['uniform_mersenne', 'uniform_crypto']:
+
+            permutation = RandomPermutation(max_value, random_method=method)
+            numbers = np.array(permutation)
+
+            assert len(permutation) == max_value
+            assert sorted(numbers.tolist()) == list(range(max_value))
+            assert list(permutation) == numbers.tolist()
+            assert permutation[-1] == numbers[-1]
+            assert permutation[[0, max_value - 1]].tolist() == \
+                [numbers[0], numbers[-1]]
+
+    # a sample of a huge space has no repeats and stays in range
+    permutation = RandomPermutation(2 ** 40, 10 ** 5)
+    numbers = permutation[:]
+
+    assert len(np.unique(numbers)) == 10 ** 5
+    assert numbers.min() >= 0 and numbers.max() < 2 ** 40
+
+    # the order is the same for the same seed
+    np.random.seed(3)
+    first = np.array(RandomPermutation(1000))
+    np.random.seed(3)
+    assert (np.array(RandomPermutation(1000)) == first).all()
+    assert (first != np.arange(1000)).any()
+
+    try:
+        permutation[10 ** 5]
+        raise AssertionError('no IndexError')
+    except IndexError:
+        pass
+
     print('finish Random Methods \n')
@@ -26,6 +26,15 @@ def test_reducers():
                    reduction_method=strategy,
                    reduction_interval=1)
 
+    talos.Scan(x=x,
+               y=y,
+               params=p,
+               model=model,
+               experiment_name='test_iris',
+               round_limit=6,
+               reduction_method='bayesian',
+               reduction_window=3)
+
     print('finised reducers \n')
 
     # # # # # # # # # # # # # # # # # #
@@ -20,6 +20,9 @@ def test_scan():
          'dropout': (.05, .35, .1),
          'epochs': [50]}
 
+    # if each round was warm started (see Scan(warm_start=True))
+    warm_started = []
+
     def iris_model(x_train, y_train, x_val, y_val, params):
 
         model = Sequential()
@@ -40,6 +43,9 @@ def test_scan():
                       loss=params['losses'],
                       metrics=['acc', talos.utils.metrics.f1score])
 
+        # only has an effect with Scan(warm_start=True)
+        warm_started.append(params.warm_start(model))
+
         out = model.fit(x_train, y_train,
                         batch_size=25,
                         epochs=params['epochs'],
@@ -75,6 +81,29 @@ def test_scan():
                              reduction_metric='val_acc',
                              minimize_loss=False)
 
+    # the rounds are distinct permutations of the parameter grid
+    import itertools
+
+    grid = set(itertools.product(*p_for_q.values()))
+    rounds = [tuple(row) for row in scan_object.data[list(p_for_q)].values]
+
+    assert len(rounds) > 0
+    assert len(set(rounds)) == len(rounds)
+    assert set(rounds) <= grid
+
+    # the values keep the types of params, not of the typed columns
+    dtypes = scan_object.data[list(p_for_q)].dtypes.astype(str).to_dict()
+    assert dtypes == {'activation': 'object',
+                      'optimizer': 'object',
+                      'losses': 'object',
+                      'shapes': 'object',
+                      'first_neuron': 'int64',
+                      'hidden_layers': 'int64',
+                      'dropout': 'float64',
+                      'batch_size': 'int64',
+                      'epochs': 'int64'}
+    assert all(type(v) is str for v in rounds[0][:4])
+
     x = x[:50]
     y = y[:50]
 
@@ -106,6 +135,279 @@ def test_scan():
                print_params=True,
                clear_session=False)
 
+    talos.Scan(x=x,
+               y=y,
+               params=p,
+               model=iris_model,
+               experiment_name="test_2",
+               x_val=x,
+               y_val=y,
+               round_limit=4,
+               disable_progress_bar=True,
+               n_jobs=2,
+               executor='process')
+
+    talos.Scan(x=x,
+               y=y,
+               params=p,
+               model=iris_model,
+               experiment_name="test_2",
+               x_val=x,
+               y_val=y,
+               round_limit=4,
+               disable_progress_bar=True,
+               n_jobs=2,
+               executor='thread')
+
+    # a scan that is stopped after two rounds continues from its log
+    import shutil
+    shutil.rmtree('test_resume', ignore_errors=True)
+
+    trained = []
+    resumed = []
+
+    def stopped_model(x_train, y_train, x_val, y_val, params):
+
+        if len(trained) == 2:
+            raise KeyboardInterrupt
+
+        trained.append(str(dict(params)))
+
+        return iris_model(x_train, y_train, x_val, y_val, params)
+
+    def resumed_model(x_train, y_train, x_val, y_val, params):
+
+        resumed.append(str(dict(params)))
+
+        return iris_model(x_train, y_train, x_val, y_val, params)
+
+    try:
+        talos.Scan(x=x,
+                   y=y,
+                   params=p,
+                   model=stopped_model,
+                   experiment_name="test_resume",
+                   x_val=x,
+                   y_val=y,
+                   round_limit=4,
+                   disable_progress_bar=True,
+                   resume=True,
+                   snapshot_interval=1)
+    except KeyboardInterrupt:
+        pass
+
+    resume_object = talos.Scan(x=x,
+                               y=y,
+                               params=p,
+                               model=resumed_model,
+                               experiment_name="test_resume",
+                               x_val=x,
+                               y_val=y,
+                               round_limit=4,
+                               disable_progress_bar=True,
+                               resume=True,
+                               snapshot_interval=1)
+
+    # the logged permutations are not run again
+    assert len(trained) == 2
+    assert len(resumed) == 2
+    assert len(set(trained + resumed)) == 4
+    assert len(resume_object.data) == 4
+
+    # 16 permutations that differ by more than epochs
+    p_hyperband = dict(p)
+    p_hyperband['shapes'] = ['brick']
+    p_hyperband['hidden_layers'] = [0, 1]
+    p_hyperband['dropout'] = [.05]
+    p_hyperband['epochs'] = [1, 9]
+
+    hyperband_object = talos.Scan(x=x,
+                                  y=y,
+                                  params=p_hyperband,
+                                  model=iris_model,
+                                  experiment_name="test_2",
+                                  x_val=x,
+                                  y_val=y,
+                                  disable_progress_bar=True,
+                                  reduction_method='hyperband',
+                                  reduction_metric='val_acc',
+                                  reduction_factor=3,
+                                  n_jobs=2)
+
+    # brackets of 9, 5 and the 2 last permutations, halved by 3 at each rung
+    epochs = hyperband_object.data['epochs'].value_counts().to_dict()
+    assert epochs == {1: 9, 3: 8, 9: 4}
+
+    asha_object = talos.Scan(x=x,
+                             y=y,
+                             params=p_hyperband,
+                             model=iris_model,
+                             experiment_name="test_2",
+                             x_val=x,
+                             y_val=y,
+                             disable_progress_bar=True,
+                             reduction_method='asha',
+                             reduction_metric='val_acc',
+                             n_jobs=2,
+                             executor='thread')
+
+    # a permutation is promoted only after its round on the rung below
+    finished = set()
+    for _, row in asha_object.data.iterrows():
+        key = tuple(str(row[k]) for k in p_hyperband if k != 'epochs')
+        assert row['epochs'] == 1 or (key, row['epochs'] // 3) in finished
+        finished.add((key, row['epochs']))
+
+    assert (asha_object.data['epochs'] == 1).sum() == 16
+    assert (asha_object.data['epochs'] == 9).sum() > 0
+
+    bayesian_object = talos.Scan(x=x,
+                                 y=y,
+                                 params=p,
+                                 model=iris_model,
+                                 experiment_name="test_2",
+                                 x_val=x,
+                                 y_val=y,
+                                 round_limit=6,
+                                 disable_progress_bar=True,
+                                 reduction_method='bayesian',
+                                 reduction_window=3)
+
+    # after the random rounds, each round has the highest expected
+    # improvement of the permutations that were not run yet (the last
+    # round is the only one left)
+    import numpy as np
+    from talos.parameters.ParamSpace import ParamSpace
+    from talos.reducers.bayesian import _expected_improvement
+
+    values = ParamSpace(p, list(p.keys()))._params_temp
+    x_rounds = np.array([[[str(v) for v in l].index(str(value)) / (len(l) - 1)
+                          if len(l) > 1 else 0
+                          for l, value in zip(values, row)]
+                         for row in bayesian_object.data[list(p)].values])
+    y_rounds = bayesian_object.data['val_acc'].values.astype(float)
+    assert len(y_rounds) == 6
+
+    for i in range(3, 5):
+        ei = _expected_improvement(x_rounds[:i],
+                                   y_rounds[:i],
+                                   x_rounds[i:],
+                                   False)
+        assert ei[0] >= ei.max() - 1e-9
+
+    # rounds with the same architecture start from each other's weights
+    p_warm_start = {k: v[:1] for k, v in p.items() if k != 'dropout'}
+    p_warm_start['dropout'] = [.05]
+    p_warm_start['epochs'] = [3, 4, 5]
+
+    del warm_started[:]
+
+    talos.Scan(x=x,
+               y=y,
+               params=p_warm_start,
+               model=iris_model,
+               experiment_name="test_2",
+               x_val=x,
+               y_val=y,
+               round_limit=3,
+               disable_progress_bar=True,
+               warm_start=True)
+
+    assert warm_started == [False, True, True]
+
+    p_distributions = dict(p)
+    p_distributions['dropout'] = talos.utils.distributions.Uniform(.05, .35)
+
+    distribution_object = talos.Scan(x=x,
+                                     y=y,
+                                     params=p_distributions,
+                                     model=iris_model,
+                                     experiment_name="test_2",
+                                     round_limit=4,
+                                     disable_progress_bar=True,
+                                     random_method='halton')
+
+    # each round draws its own value from the distribution
+    dropout = distribution_object.data['dropout']
+    assert dropout.between(.05, .35).all()
+    assert dropout.nunique() == 4
+
+    p_conditional = dict(p)
+    p_conditional['shapes'] = talos.utils.Conditional(
+        ['brick', 'funnel', 'triangle'],
+        when={'hidden_layers': lambda hidden_layers: hidden_layers > 0})
+
+    talos.Scan(x=x,
+               y=y,
+               params=p_conditional,
+               model=iris_model,
+               experiment_name="test_2",
+               round_limit=4,
+               disable_progress_bar=True,
+               log_flush_rows=2,
+               log_flush_seconds=10)
+
+    talos.Scan(x=x,
+               y=y,
+               params=p_conditional,
+               model=iris_model,
+               experiment_name="test_parquet",
+               round_limit=6,
+               reduction_method='correlation',
+               reduction_interval=2,
+               reduction_window=4,
+               reduction_metric='val_acc',
+               disable_progress_bar=True,
+               log_format='parquet',
+               log_flush_rows=2)
+
+    import glob
+    r = talos.Analyze(glob.glob('./test_parquet/*.parquet')[-1])
+    r.high('val_acc')
+    r.rounds()
+    r.rounds2high('val_acc')
+    r.best_params('val_loss', ['val_acc'])
+
+    from talos.logging.ResultsStore import ResultsStore
+    store = ResultsStore('test_store.db')
+
+    talos.Scan(x=x,
+               y=y,
+               params=p,
+               model=iris_model,
+               experiment_name="test_2",
+               round_limit=4,
+               disable_progress_bar=True,
+               results_store=store)
+
+    r = talos.Analyze(store)
+    r.high('val_acc')
+    r.rounds2high('val_acc')
+    r.table('val_loss', ['val_acc'])
+    r.best_params('val_loss', ['val_acc'], n=2)
+
+    talos.Scan(x=x,
+               y=y,
+               params=p,
+               model=iris_model,
+               experiment_name="test_2",
+               round_limit=6,
+               canonical_rules=talos.utils.canonical.hidden_layers,
+               disable_progress_bar=True)
+
+    async def async_iris_model(x_train, y_train, x_val, y_val, params):
+
+        return iris_model(x_train, y_train, x_val, y_val, params)
+
+    talos.Scan(x=x,
+               y=y,
+               params=p,
+               model=async_iris_model,
+               experiment_name="test_2",
+               round_limit=3,
+               disable_progress_bar=True,
+               n_jobs=2)
+
     talos.Scan(x=x,
                y=y,
                params=p,
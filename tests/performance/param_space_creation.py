@@ -0,0 +1,61 @@
+import sys
+import time
+
+import numpy as np
+
+from talos.parameters.ParamSpace import ParamSpace
+
+p = {'first_neuron': list(range(8, 808, 8)),
+     'hidden_layers': [0, 1, 2, 3, 4],
+     'dropout': (0, 0.5, 10),
+     'lr': [0.1, 0.01, 0.001, 0.0001],
+     'batch_size': [16, 32, 64, 128, 256],
+     'activation': ['relu', 'elu', 'selu', 'tanh'],
+     'optimizer': ['Adam', 'Nadam', 'SGD', 'RMSprop', 'Adagrad'],
+     'epochs': [10, 20, 50, 100, 200]}
+
+
+def loop_creation(param_object):
+
+    '''The permutations decoded one by one as before.'''
+
+    final_grid = []
+    for i in param_object.grid_index:
+        final_grid.append(param_object._param_values(i))
+
+    return np.array(final_grid, dtype='object')
+
+
+def benchmark(rows):
+
+    param_object = ParamSpace(p, list(p.keys()), round_limit=1)
+
+    # the columns are created when the grid indexes are set
+    start = time.time()
+    param_object.grid_index = np.arange(rows)
+    vectorized_time = time.time() - start
+
+    vectorized = param_object.param_space
+
+    start = time.time()
+    loop = loop_creation(param_object)
+    loop_time = time.time() - start
+
+    if not (vectorized == loop).all():
+        raise Exception('PARAM SPACE TEST FAILED: the permutations differ')
+
+    print('%9d rows  loop %8.2fs  vectorized %6.2fs  %5.1fx'
+          % (rows, loop_time, vectorized_time, loop_time / vectorized_time))
+
+
+if __name__ == '__main__':
+
+    print('\n Param Space Creation Benchmark Starts...\n')
+
+    # e.g. python param_space_creation.py 6 to stop at 10^6 rows
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+
+    for power in range(4, largest + 1):
+        benchmark(10 ** power)
+
+    print('\n Param Space Creation Benchmark Finished \n')